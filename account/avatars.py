@@ -0,0 +1,123 @@
+"""
+Avatar thumbnails, rendered once when an avatar is uploaded.
+thumbnails are named by the sha256 of their source image, so equal uploads share them
+and a url is known from the digest alone, without looking up any file
+"""
+
+import hashlib
+import threading
+from PIL import Image, ImageOps
+from concurrent.futures import ThreadPoolExecutor
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from functools import lru_cache, partial
+from io import BytesIO
+
+from tripmedia import settings
+
+_EXTENSIONS = {"jpeg": "jpg", "webp": "webp"}
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_executor():
+    """
+    Return the threads rendering thumbnails, pillow releases the gil while it resizes and encodes
+    """
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(settings.avatars.get("workers"), thread_name_prefix='avatars')
+    return _executor
+
+
+def thumbnail_name(digest, size, image_format):
+    return "avatars/{}/{}/{}.{}".format(digest[:2], digest, size, _EXTENSIONS[image_format])
+
+
+def file_digest(file):
+    """
+    Return hex sha256 of a django File, read in chunks
+    """
+    digest = hashlib.sha256()
+    for chunk in file.chunks():
+        digest.update(chunk)
+    file.seek(0)
+    return digest.hexdigest()
+
+
+def render_avatar(file, digest):
+    """
+    Decode image file once and store a square thumbnail of each size in each format, named by digest of the file.
+    return digest. raise OSError when file is not an image pillow can read
+    """
+    options = settings.avatars
+    sizes = sorted(options.get("sizes"), reverse=True)
+    formats = options.get("formats")
+    if default_storage.exists(thumbnail_name(digest, sizes[-1], formats[-1])):
+        # the smallest thumbnail is stored last, an avatar that has it is complete
+        return digest
+
+    image = Image.open(file)
+    # jpeg decodes straight to a smaller scale when the image is much larger than the largest thumbnail
+    image.draft('RGB', (sizes[0], sizes[0]))
+    image = _flatten(image)
+    side = min(min(image.size), sizes[0])
+    square = ImageOps.fit(image, (side, side), Image.LANCZOS)
+
+    rendered = get_executor().map(partial(_render_size, square, formats), sizes)
+    for (size, encoded) in zip(sizes, rendered):
+        for (image_format, data) in encoded:
+            name = thumbnail_name(digest, size, image_format)
+            if not default_storage.exists(name):
+                default_storage.save(name, ContentFile(data))
+    return digest
+
+
+def _flatten(image):
+    # transparent avatars are laid on white, thumbnail formats are all opaque
+    if image.mode in ('RGBA', 'LA') or (image.mode == 'P' and 'transparency' in image.info):
+        image = image.convert('RGBA')
+        background = Image.new('RGB', image.size, (255, 255, 255))
+        background.paste(image, mask=image.split()[-1])
+        return background
+    return image.convert('RGB')
+
+
+def _render_size(square, formats, size):
+    # sources smaller than a size are not scaled up, their thumbnail keeps the side of the source
+    image = square.resize((size, size), Image.LANCZOS) if square.size[0] > size else square
+    quality = settings.avatars.get("quality")
+    encoded = []
+    for image_format in formats:
+        output = BytesIO()
+        if image_format == 'jpeg':
+            image.save(output, 'JPEG', quality=quality, optimize=True, progressive=True)
+        else:
+            image.save(output, 'WEBP', quality=quality, method=4)
+        encoded.append((image_format, output.getvalue()))
+    return encoded
+
+
+@lru_cache(maxsize=None)
+def default_avatar_digest():
+    """
+    Render thumbnails of the default avatar on first use and return their digest
+    """
+    with open(settings.avatars.get("default"), 'rb') as source:
+        digest = hashlib.sha256(source.read()).hexdigest()
+        source.seek(0)
+        return render_avatar(source, digest)
+
+
+def avatar_url(digest, size, webp=False):
+    """
+    Return url of the smallest thumbnail of at least size px, or of the largest one, of the avatar with digest.
+    profiles with no avatar of their own get the default one
+    """
+    sizes = sorted(settings.avatars.get("sizes"))
+    size = next((s for s in sizes if s >= size), sizes[-1])
+    image_format = 'webp' if webp and 'webp' in settings.avatars.get("formats") else 'jpeg'
+    return settings.avatars.get("base_url") + thumbnail_name(digest or default_avatar_digest(), size, image_format)
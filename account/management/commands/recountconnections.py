@@ -0,0 +1,25 @@
+from django.core.management import BaseCommand
+from django.db.models import Max
+
+from account.models import Profile
+
+
+class Command(BaseCommand):
+    help = "Recompute follower, following and post counts of profiles from their connections and trip media"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=10000,
+                            help="Profiles updated by each query.")
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        last_id = Profile.objects.aggregate(last_id=Max('id'))['last_id'] or 0
+
+        updated = 0
+        for start in range(0, last_id + 1, batch_size):
+            profiles = Profile.objects.filter(id__gte=start, id__lt=start + batch_size)
+            updated += Profile.recount_connections(profiles)
+            Profile.recount_posts(profiles)
+            self.stderr.write("\t✓ {}/{} profiles".format(min(start + batch_size, last_id), last_id))
+
+        self.stderr.write("✓ Recount completed, {} profiles updated".format(updated))
@@ -0,0 +1,27 @@
+from django.core.management import BaseCommand
+
+from account.avatars import default_avatar_digest, file_digest, render_avatar
+from account.models import Profile
+
+
+class Command(BaseCommand):
+    help = "Render thumbnails of the default avatar and of uploaded avatars that have none yet"
+
+    def handle(self, *args, **options):
+        default_avatar_digest()
+        self.stderr.write("\t✓ default avatar")
+
+        profiles = Profile.objects.filter(pic_digest='').exclude(pic_url='').exclude(pic_url__isnull=True) \
+            .only('id', 'pic_url')
+        rendered = failed = 0
+        for profile in profiles.iterator():
+            try:
+                with profile.pic_url.open('rb') as pic:
+                    digest = render_avatar(pic, file_digest(pic))
+            except OSError as error:
+                failed += 1
+                self.stderr.write("\t✗ profile {}: {}".format(profile.id, error))
+                continue
+            Profile.objects.filter(pk=profile.pk).update(pic_digest=digest)
+            rendered += 1
+        self.stderr.write("✓ Rendered avatars of {} profiles, {} failed".format(rendered, failed))
@@ -0,0 +1,155 @@
+import io
+import random
+from datetime import timedelta
+from itertools import accumulate
+from django.contrib.auth.hashers import make_password
+from django.core.management import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.utils.timezone import now
+
+from account.models import ConnectionType, Profile, Status, User, UserConnection
+from account.strings.account import strings
+
+
+def _copy_value(value):
+    if value is None:
+        return r'\N'
+    if isinstance(value, bool):
+        return 't' if value else 'f'
+    if hasattr(value, 'isoformat'):
+        return value.isoformat()
+    return str(value).replace('\\', '\\\\').replace('\t', '\\t').replace('\n', '\\n')
+
+
+def _like_prefix(prefix):
+    # LIKE pattern of the values starting with prefix, its wildcards match themselves
+    return prefix.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '%'
+
+
+def insert_rows(model, fields, rows):
+    """
+    Insert rows, tuples of values of fields, with COPY on postgres and bulk_create elsewhere.
+    neither sends model signals
+    """
+    if connection.vendor == 'postgresql':
+        buffer = io.StringIO()
+        for row in rows:
+            buffer.write("\t".join(_copy_value(value) for value in row) + "\n")
+        buffer.seek(0)
+        columns = ", ".join(connection.ops.quote_name(model._meta.get_field(field).column) for field in fields)
+        with connection.cursor() as cursor:
+            cursor.copy_expert("COPY {} ({}) FROM STDIN".format(
+                connection.ops.quote_name(model._meta.db_table), columns), buffer)
+    else:
+        objects = [model(**dict(zip(fields, row))) for row in rows]
+        batch_size = connection.ops.bulk_batch_size(model._meta.concrete_fields, objects)
+        model.objects.bulk_create(objects, batch_size=max(1, min(1000, batch_size)))
+
+
+class Command(BaseCommand):
+    help = "Seed users with profiles and a power-law follow graph between them, for benchmarks"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=100000,
+                            help="Users created, named <prefix><number>.")
+        parser.add_argument('--edges', type=int, default=1000000,
+                            help="Follow connections created between them.")
+        parser.add_argument('--exponent', type=float, default=1.0,
+                            help="Zipf exponent of follower counts, 0 spreads followers evenly.")
+        parser.add_argument('--prefix', default='seed',
+                            help="Lowercase prefix of usernames, it must not be taken by existing users.")
+        parser.add_argument('--password', default='seed password',
+                            help="Password of every seeded user.")
+        parser.add_argument('--seed', type=int, default=1,
+                            help="Seed of the random graph, equal seeds make equal graphs.")
+        parser.add_argument('--batch-size', type=int, default=100000,
+                            help="Rows written by each COPY or bulk insert.")
+
+    def handle(self, *args, **options):
+        rng = random.Random(options['seed'])
+        prefix, batch_size = options['prefix'], options['batch_size']
+        # usernames are stored lowercased, seeded users are found by their prefix
+        if prefix != User.normalize_username(prefix):
+            raise CommandError("Prefix must be lowercase, such as {!r}.".format(User.normalize_username(prefix)))
+
+        profile_ids = self.seed_users(options['users'], prefix, make_password(options['password']), batch_size)
+        self.stderr.write("\t✓ {} users with profiles".format(len(profile_ids)))
+
+        edges = self.seed_connections(profile_ids, options['edges'], options['exponent'], batch_size, rng)
+        self.stderr.write("\t✓ {} connections".format(edges))
+
+        # connections were written without signals, counters are set from them in one update
+        Profile.recount_connections(Profile.objects.filter(user__username__startswith=prefix))
+        if connection.vendor == 'postgresql':
+            with connection.cursor() as cursor:
+                cursor.execute("ANALYZE {}".format(connection.ops.quote_name(UserConnection._meta.db_table)))
+        self.stderr.write("✓ Seed completed, {} users and {} connections".format(len(profile_ids), edges))
+
+    @staticmethod
+    def seed_users(users, prefix, password, batch_size):
+        """
+        Create users, then their profiles with active status in one insert select, as the post_save signal would.
+        return profile ids of seeded users in order of their numbers
+        """
+        joined = now()
+        for start in range(0, users, batch_size):
+            with transaction.atomic():
+                insert_rows(User, ('password', 'is_superuser', 'username', 'email', 'date_joined', 'is_staff',
+                                   'is_active'),
+                            ((password, False, '{}{}'.format(prefix, i), '{}{}@seed.local'.format(prefix, i),
+                              joined, False, True) for i in range(start, min(start + batch_size, users))))
+
+        status = Status.get_or_create_status(strings.ACTIVE_STATUS)
+        profile = Profile._meta
+        quote = connection.ops.quote_name
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "INSERT INTO {profile} ({user_id}, {full_name}, {email_verified}, {verified}, {status_id}, "
+                "{pic_url}, {pic_digest}, {followers_count}, {following_count}, {posts_count}) "
+                "SELECT u.{id}, '', %s, %s, %s, %s, '', 0, 0, 0 FROM {user} u "
+                "WHERE u.{username} LIKE %s ESCAPE '\\' "
+                "AND NOT EXISTS (SELECT 1 FROM {profile} p WHERE p.{user_id} = u.{id})"
+                .format(profile=quote(profile.db_table), user=quote(User._meta.db_table), id=quote('id'),
+                        username=quote('username'),
+                        **{field: quote(profile.get_field(field).column) for field in (
+                            'user_id', 'full_name', 'email_verified', 'verified', 'status_id', 'pic_url',
+                            'pic_digest', 'followers_count', 'following_count', 'posts_count')}),
+                [False, False, status.id, profile.get_field('pic_url').get_default(), _like_prefix(prefix)])
+
+        numbered = Profile.objects.filter(user__username__startswith=prefix).values_list('user__username', 'id')
+        ids = {username: profile_id for (username, profile_id) in numbered.iterator(chunk_size=batch_size)}
+        return [ids['{}{}'.format(prefix, i)] for i in range(users)]
+
+    @staticmethod
+    def seed_connections(profile_ids, edges, exponent, batch_size, rng):
+        """
+        Connect random followers to followings drawn from a Zipf distribution, batch_size edges at a time.
+        followers are split between batches, so removing duplicates within a batch removes them all.
+        no connection is a block, so skipping the check_user_connections signal changes nothing
+        """
+        users = len(profile_ids)
+        edges = min(edges, users * (users - 1))
+        ranked = list(profile_ids)
+        rng.shuffle(ranked)
+        cum_weights = list(accumulate((rank + 1) ** -exponent for rank in range(users)))
+
+        sources_per_batch = max(1, batch_size * users // max(1, edges))
+        created = now()
+        written = 0
+        for start in range(0, users, sources_per_batch):
+            stop = min(start + sources_per_batch, users)
+            quota = min(edges * stop // users - edges * start // users, (stop - start) * (users - 1))
+            pairs = set()
+            while len(pairs) < quota:
+                need = quota - len(pairs)
+                sources = [rng.randrange(start, stop) for _ in range(need)]
+                targets = rng.choices(ranked, cum_weights=cum_weights, k=need)
+                pairs.update((profile_ids[source], target) for (source, target) in zip(sources, targets)
+                             if profile_ids[source] != target)
+
+            with transaction.atomic():
+                insert_rows(UserConnection, ('created', 'user_id', 'one_id', 'type'),
+                            ((created - timedelta(microseconds=written + i), user_id, one_id,
+                              ConnectionType.FOLLOW.name) for (i, (user_id, one_id)) in enumerate(sorted(pairs))))
+            written += len(pairs)
+        return written
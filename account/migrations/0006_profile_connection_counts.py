@@ -0,0 +1,69 @@
+# Generated by Django 2.1 on 2026-10-18 12:00
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+import django.db.models.deletion
+
+
+def count_connections(apps, schema_editor):
+    Profile = apps.get_model('account', 'Profile')
+    UserConnection = apps.get_model('account', 'UserConnection')
+
+    follows = UserConnection.objects.filter(type='FOLLOW').order_by()
+    followers = follows.filter(one=OuterRef('pk')).values('one').annotate(count=Count('*')).values('count')
+    following = follows.filter(user=OuterRef('pk')).values('user').annotate(count=Count('*')).values('count')
+    Profile.objects.update(
+        followers_count=Coalesce(Subquery(followers, output_field=models.IntegerField()), 0),
+        following_count=Coalesce(Subquery(following, output_field=models.IntegerField()), 0),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('account', '0005_auto_20180803_0107'),
+    ]
+
+    operations = [
+        migrations.RenameField(
+            model_name='userconnection',
+            old_name='creator',
+            new_name='user',
+        ),
+        migrations.RenameField(
+            model_name='userconnection',
+            old_name='target',
+            new_name='one',
+        ),
+        migrations.AlterField(
+            model_name='userconnection',
+            name='one',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='other', to='account.Profile'),
+        ),
+        migrations.AlterField(
+            model_name='userconnection',
+            name='type',
+            field=models.CharField(choices=[('BLOCK', 'Block'), ('FOLLOW', 'Follow')], max_length=30),
+        ),
+        migrations.AlterUniqueTogether(
+            name='userconnection',
+            unique_together={('user', 'one', 'type')},
+        ),
+        migrations.AddField(
+            model_name='profile',
+            name='followers_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='profile',
+            name='following_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='profile',
+            name='posts_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(count_connections, migrations.RunPython.noop),
+    ]
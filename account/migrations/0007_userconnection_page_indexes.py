@@ -0,0 +1,21 @@
+# Generated by Django 2.1 on 2026-10-18 14:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('account', '0006_profile_connection_counts'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='userconnection',
+            index=models.Index(fields=['one', 'type', 'created', 'id'], name='account_follower_page_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='userconnection',
+            index=models.Index(fields=['user', 'type', 'created', 'id'], name='account_following_page_idx'),
+        ),
+    ]
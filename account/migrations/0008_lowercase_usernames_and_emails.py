@@ -0,0 +1,51 @@
+# Generated by Django 2.1 on 2026-10-18 14:53
+
+import account.models
+from django.db import IntegrityError, migrations
+from django.db.models import Count
+from django.db.models.functions import Lower
+
+
+def _collisions(User, field):
+    """
+    Return [(lowercased value, [values])] of the values of field that only differ in case
+    """
+    lowered = User.objects.annotate(lowered=Lower(field))
+    taken = lowered.values('lowered').annotate(users=Count('id')).filter(users__gt=1).values('lowered')
+    collisions = {}
+    for (value, original) in lowered.filter(lowered__in=taken).order_by('lowered', 'id') \
+            .values_list('lowered', field):
+        collisions.setdefault(value, []).append(original)
+    return sorted(collisions.items())
+
+
+def lowercase_usernames_and_emails(apps, schema_editor):
+    User = apps.get_model('account', 'User')
+
+    # which of the users keeps a value is not for a migration to decide, they are renamed by hand first
+    collisions = ["{} {}: {}".format(field, value, ", ".join(originals))
+                  for field in ('username', 'email') for (value, originals) in _collisions(User, field)]
+    if collisions:
+        raise IntegrityError("Users differ only in case, rename all but one of each and migrate again:\n{}"
+                             .format("\n".join(collisions)))
+
+    # values lowercased apart are unique lowercased together, so one update hits no unique index on its way
+    User.objects.exclude(username=Lower('username')).update(username=Lower('username'))
+    User.objects.exclude(email=Lower('email')).update(email=Lower('email'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('account', '0007_userconnection_page_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterModelManagers(
+            name='user',
+            managers=[
+                ('objects', account.models.CaseInsensitiveUserManager()),
+            ],
+        ),
+        migrations.RunPython(lowercase_usernames_and_emails, migrations.RunPython.noop),
+    ]
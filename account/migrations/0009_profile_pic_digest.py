@@ -0,0 +1,18 @@
+# Generated by Django 2.1 on 2026-10-18 15:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('account', '0008_lowercase_usernames_and_emails'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='profile',
+            name='pic_digest',
+            field=models.CharField(blank=True, default='', editable=False, max_length=64),
+        ),
+    ]
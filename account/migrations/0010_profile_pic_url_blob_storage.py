@@ -0,0 +1,26 @@
+# Generated by Django 2.1 on 2026-10-18 15:20
+
+from django.db import migrations, models
+import trip.storage
+
+
+def clear_default_pic_urls(apps, schema_editor):
+    # the old default was a path into STATIC_ROOT, profiles with an empty pic_url get the default avatar now
+    Profile = apps.get_model('account', 'Profile')
+    Profile.objects.filter(pic_url__endswith='default-avatar.jpg').update(pic_url='')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('account', '0009_profile_pic_digest'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='profile',
+            name='pic_url',
+            field=models.ImageField(blank=True, default='', null=True, storage=trip.storage.ContentAddressedStorage(), upload_to='media/'),
+        ),
+        migrations.RunPython(clear_default_pic_urls, migrations.RunPython.noop),
+    ]
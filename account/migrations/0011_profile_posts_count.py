@@ -0,0 +1,26 @@
+# Generated by Django 2.1 on 2026-10-18 18:20
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def count_posts(apps, schema_editor):
+    Profile = apps.get_model('account', 'Profile')
+    TripMedia = apps.get_model('trip', 'TripMedia')
+
+    posts = TripMedia.objects.filter(owner=OuterRef('user_id'), completed__isnull=False).order_by() \
+        .values('owner').annotate(count=Count('*')).values('count')
+    Profile.objects.update(posts_count=Coalesce(Subquery(posts, output_field=models.IntegerField()), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('account', '0010_profile_pic_url_blob_storage'),
+        ('trip', '0005_tripmedia_metadata'),
+    ]
+
+    operations = [
+        migrations.RunPython(count_posts, migrations.RunPython.noop),
+    ]
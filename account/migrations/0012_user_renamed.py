@@ -0,0 +1,19 @@
+# Generated by Django 2.1 on 2026-10-18 19:34
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('account', '0011_profile_posts_count'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='renamed',
+            field=models.DateTimeField(db_index=True, default=django.utils.timezone.now),
+        ),
+    ]
@@ -1,14 +1,16 @@
-import os
 from django.contrib.auth.base_user import AbstractBaseUser
 from django.contrib.auth.models import AbstractUser, PermissionsMixin, UserManager
 from django.core.mail import send_mail
-from django.db import models
+from django.db import models, transaction
+from django.db.models import Case, Count, F, OuterRef, Subquery, Value, When
+from django.db.models.functions import Coalesce
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 from enum import Enum, unique
 
 from account.validators import UsernameValidator
-from tripmedia.settings import STATIC_ROOT
+from trip.models import TripMedia
+from trip.storage import blob_storage
 
 
 ###############################
@@ -16,6 +18,19 @@ from tripmedia.settings import STATIC_ROOT
 # Define models that display database tables
 ###############################
 
+class CaseInsensitiveUserManager(UserManager):
+    """
+    User manager that finds users by lowercased username, the form they are stored in
+    """
+
+    @classmethod
+    def normalize_email(cls, email):
+        return (email or '').strip().lower()
+
+    def get_by_natural_key(self, username):
+        return super().get_by_natural_key(self.model.normalize_username(username))
+
+
 class User(AbstractBaseUser, PermissionsMixin):
     """
     Custom user model that idea taken from django user model in auth app
@@ -32,6 +47,8 @@ class User(AbstractBaseUser, PermissionsMixin):
     )
     email = models.EmailField(blank=True, unique=True)
     date_joined = models.DateTimeField(default=timezone.now)
+    # when username or email were last set, servers read the users renamed since into their availability index
+    renamed = models.DateTimeField(default=timezone.now, db_index=True)
     is_staff = models.BooleanField(default=False)
     is_active = models.BooleanField(default=True)
 
@@ -39,7 +56,7 @@ class User(AbstractBaseUser, PermissionsMixin):
     USERNAME_FIELD = 'username'
     REQUIRED_FIELDS = ['email']
 
-    objects = UserManager()
+    objects = CaseInsensitiveUserManager()
 
     class Meta:
         verbose_name = _('user')
@@ -48,6 +65,21 @@ class User(AbstractBaseUser, PermissionsMixin):
     def __str__(self):
         return self.username.strip()
 
+    def save(self, *args, **kwargs):
+        # usernames and emails are stored lowercased, so their unique indexes serve case-insensitive lookups
+        self.username = self.normalize_username(self.username)
+        self.email = self.__class__.objects.normalize_email(self.email)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None or {'username', 'email'} & set(update_fields):
+            self.renamed = timezone.now()
+            if update_fields is not None:
+                kwargs['update_fields'] = set(update_fields) | {'renamed'}
+        super().save(*args, **kwargs)
+
+    @classmethod
+    def normalize_username(cls, username):
+        return super().normalize_username(username).lower()
+
     def clean(self):
         super().clean()
         self.email = self.__class__.objects.normalize_email(self.email)
@@ -98,9 +130,15 @@ class Profile(models.Model):
     status = models.ForeignKey(Status, default=None, null=True, blank=True,
                                on_delete=models.SET_DEFAULT)  # TODO check on_delete field
 
-    pic_url = models.ImageField(null=True, blank=True,
-                                upload_to='media/',
-                                default=os.path.join(STATIC_ROOT, 'default-avatar.jpg'))
+    # stored once per content in the blob store, profiles with none get the default avatar of account.avatars
+    pic_url = models.ImageField(null=True, blank=True, default='', upload_to='media/', storage=blob_storage)
+    # sha256 of pic_url, names its thumbnails in account.avatars, empty for the default avatar
+    pic_digest = models.CharField(max_length=64, blank=True, default='', editable=False)
+
+    # denormalized counts, kept in sync by the signals of connections and trip media
+    followers_count = models.PositiveIntegerField(default=0, editable=False)
+    following_count = models.PositiveIntegerField(default=0, editable=False)
+    posts_count = models.PositiveIntegerField(default=0, editable=False)
 
     def __str__(self):
         return self.user.username
@@ -114,31 +152,67 @@ class Profile(models.Model):
         return UserConnection.objects.filter(user=self, one=one, type=ConnectionType.BLOCK.name).exists()
 
     def follow(self, one):
-        if self.block(one) or one.block(self):
+        if self.blocking(one) or one.blocking(self):
             return False
 
-        return True if UserConnection.objects.get_or_create(user=self, one=one,
-                                                            type=ConnectionType.FOLLOW.name) else False
+        with transaction.atomic():
+            UserConnection.objects.get_or_create(user=self, one=one, type=ConnectionType.FOLLOW.name)
+        return True
 
     def block(self, one):
-        # if user follow one or following by one, remove connection
-        return True if UserConnection.objects.save(user=self, one=one, type=ConnectionType.BLOCK.name) else False
+        # check_user_connections signal removes follow connections between users
+        with transaction.atomic():
+            UserConnection.objects.get_or_create(user=self, one=one, type=ConnectionType.BLOCK.name)
+        return True
 
     def unblock(self, one):
-        if self.block(one):
-            return True if UserConnection.objects.filter(user=self, one=one,
-                                                         type=ConnectionType.BLOCK.name).delete() else False
+        (deleted, _) = UserConnection.objects.filter(user=self, one=one, type=ConnectionType.BLOCK.name).delete()
+        return deleted > 0
 
     def unfollow(self, one):
-        if self.following(one):
-            return True if UserConnection.objects.filter(user=self, one=one,
-                                                         type=ConnectionType.FOLLOW.name).delete() else False
+        (deleted, _) = UserConnection.objects.filter(user=self, one=one, type=ConnectionType.FOLLOW.name).delete()
+        return deleted > 0
+
+    @staticmethod
+    def count(profiles, field, delta):
+        """
+        Add delta to a stored count of profiles in one update, counts never drop below 0
+        """
+        if delta >= 0:
+            return profiles.update(**{field: F(field) + delta})
+        return profiles.update(**{field: Case(When(**{field + '__gt': -delta}, then=F(field) + delta),
+                                              default=Value(0))})
 
     def count_followers(self):
-        return UserConnection.objects.filter(one=self, type=ConnectionType.FOLLOW.name).count()
+        return self.followers_count
 
     def count_following(self):
-        return UserConnection.objects.filter(user=self, type=ConnectionType.FOLLOW.name).count()
+        return self.following_count
+
+    @staticmethod
+    def recount_connections(profiles=None):
+        """
+        Recompute stored follower and following counts from connections, in one update query
+        """
+        follows = UserConnection.objects.filter(type=ConnectionType.FOLLOW.name).order_by()
+        followers = follows.filter(one=OuterRef('pk')).values('one').annotate(count=Count('*')).values('count')
+        following = follows.filter(user=OuterRef('pk')).values('user').annotate(count=Count('*')).values('count')
+
+        profiles = Profile.objects.all() if profiles is None else profiles
+        return profiles.update(
+            followers_count=Coalesce(Subquery(followers, output_field=models.IntegerField()), 0),
+            following_count=Coalesce(Subquery(following, output_field=models.IntegerField()), 0),
+        )
+
+    @staticmethod
+    def recount_posts(profiles=None):
+        """
+        Recompute stored post counts from complete trip media, in one update query
+        """
+        posts = TripMedia.objects.filter(owner=OuterRef('user_id'), completed__isnull=False).order_by() \
+            .values('owner').annotate(count=Count('*')).values('count')
+        profiles = Profile.objects.all() if profiles is None else profiles
+        return profiles.update(posts_count=Coalesce(Subquery(posts, output_field=models.IntegerField()), 0))
 
     def change_status(self, new_status):
         status = Status.get_or_create_status(new_status)
@@ -163,6 +237,11 @@ class UserConnection(models.Model):
 
     class Meta:
         unique_together = ('user', 'one', 'type')
+        indexes = [
+            # pages of followers and followings are range scans in (created, id) order
+            models.Index(fields=['one', 'type', 'created', 'id'], name='account_follower_page_idx'),
+            models.Index(fields=['user', 'type', 'created', 'id'], name='account_following_page_idx'),
+        ]
 
     def __str__(self):
         return "%s %s %s" % (self.user, ConnectionType[self.type].value, self.one)
@@ -2,10 +2,14 @@
 # --------- SIGNALS ---------- #
 # Define functions that are sensitive to signals defined in Django
 ################################
-from django.db.models.signals import pre_save, post_save
+import mimetypes
+from django.db.models.signals import post_delete, pre_save, post_save
 from django.dispatch import receiver
 
-from account.models import User, UserConnection
+from account.avatars import file_digest, render_avatar
+from account.models import ConnectionType, Profile, Status, User, UserConnection
+from account.strings.account import strings
+from trip.models import Blob, TripMedia
 
 
 @receiver(post_save, sender=User)
@@ -26,12 +30,87 @@ def create_or_update_user_profile(sender, instance, created, **kwargs):
 
 @receiver(pre_save, sender=UserConnection)
 def check_user_connections(sender, instance, **kwargs):
-    print(instance.type)
+    # a block removes the follows of both ways, their deletes uncount them
     if instance.type == ConnectionType.BLOCK.name:
-        if instance.user.following(one=instance.one) or instance.one.following(one=instance.user):
-            instance.user.unfollow(one=instance.one)
-            instance.one.unfollow(one=instance.user)
+        instance.user.unfollow(one=instance.one)
+        instance.one.unfollow(one=instance.user)
     elif instance.type == ConnectionType.FOLLOW.name:
-        print(instance.one)
         if instance.one.blocking(instance.user):
             raise Exception("user is blocked by one")
+
+
+def count_follow(user_id, one_id, delta):
+    Profile.count(Profile.objects.filter(pk=user_id), 'following_count', delta)
+    Profile.count(Profile.objects.filter(pk=one_id), 'followers_count', delta)
+
+
+@receiver(pre_save, sender=UserConnection)
+def stash_user_connection(sender, instance, **kwargs):
+    # a connection saved again may be another one now, the one it was is uncounted
+    if instance.pk:
+        instance._saved_as = UserConnection.objects.filter(pk=instance.pk) \
+            .values_list('user_id', 'one_id', 'type').first()
+
+
+@receiver(post_save, sender=UserConnection)
+def count_user_connection(sender, instance, **kwargs):
+    # follower and following counts follow every saved connection, not only those of Profile.follow
+    saved_as = instance.__dict__.pop('_saved_as', None)
+    saved = (instance.user_id, instance.one_id, instance.type)
+    if saved_as == saved:
+        return
+    if saved_as is not None and saved_as[2] == ConnectionType.FOLLOW.name:
+        count_follow(saved_as[0], saved_as[1], -1)
+    if instance.type == ConnectionType.FOLLOW.name:
+        count_follow(instance.user_id, instance.one_id, 1)
+
+
+@receiver(post_delete, sender=UserConnection)
+def uncount_user_connection(sender, instance, **kwargs):
+    # deletes of querysets, the admin and cascades all send it once per connection
+    if instance.type == ConnectionType.FOLLOW.name:
+        count_follow(instance.user_id, instance.one_id, -1)
+
+
+@receiver(pre_save, sender=Profile)
+def render_profile_avatar(sender, instance, **kwargs):
+    # a newly uploaded pic_url gets its thumbnails before the profile is saved
+    pic = instance.pic_url
+    if pic and not pic._committed:
+        instance.pic_digest = render_avatar(pic, file_digest(pic))
+        instance._replaced_pic = (Profile.objects.filter(pk=instance.pk).values_list('pic_url', flat=True).first()
+                                  if instance.pk else None, mimetypes.guess_type(pic.name)[0] or '')
+
+
+@receiver(post_save, sender=Profile)
+def count_profile_avatar(sender, instance, **kwargs):
+    # the stored upload takes a reference to its blob from the avatar it replaced
+    replaced = instance.__dict__.pop('_replaced_pic', None)
+    if replaced is not None:
+        (old_name, content_type) = replaced
+        Blob.replace(old_name, instance.pic_url.name, content_type)
+
+
+@receiver(post_delete, sender=Profile)
+def release_profile_avatar(sender, instance, **kwargs):
+    Blob.release(instance.pic_url.name)
+
+
+@receiver(pre_save, sender=TripMedia)
+def stash_media_completion(sender, instance, update_fields=None, **kwargs):
+    # posts are complete media, one is counted as its upload completes
+    if instance.pk and instance.is_complete and (update_fields is None or 'completed' in update_fields):
+        instance._completing = not TripMedia.objects.filter(pk=instance.pk, completed__isnull=False).exists()
+
+
+@receiver(post_save, sender=TripMedia)
+def count_profile_post(sender, instance, created, **kwargs):
+    completing = instance.__dict__.pop('_completing', False)
+    if completing or (created and instance.is_complete):
+        Profile.count(Profile.objects.filter(user_id=instance.owner_id), 'posts_count', 1)
+
+
+@receiver(post_delete, sender=TripMedia)
+def uncount_profile_post(sender, instance, **kwargs):
+    if instance.is_complete:
+        Profile.count(Profile.objects.filter(user_id=instance.owner_id), 'posts_count', -1)
@@ -0,0 +1,297 @@
+"""
+Asyncio variant of ServerApi.
+Every method of ServerApi is served as a coroutine, while its database work runs on a bounded executor,
+so slow clients on streaming calls hold a coroutine instead of a worker thread.
+grpc.aio comes with grpcio 1.32, which requirements.txt pins.
+"""
+
+import asyncio
+import grpc
+from django.db import close_old_connections
+from grpc import aio
+from functools import partial
+from itertools import islice
+
+from microservice import metrics, services
+from microservice.interceptors import (LoggingInterceptor, MetricsInterceptor, RateLimitInterceptor, _StatusContext,
+                                      _timed, _wrap_rpc_handler)
+from microservice.rpc import server_api_pb2_grpc as rpc
+from tripmedia import settings
+
+_CONTINUE = object()
+
+
+class _Abort(Exception):
+    def __init__(self, code, details):
+        super().__init__(code, details)
+        self.code = code
+        self.details = details
+
+
+class _ExecutorContext:
+    """
+    Context given to synchronous service code.
+    aio context can only abort from the event loop, so abort is raised back to the coroutine
+    """
+
+    def __init__(self, context):
+        self._context = context
+
+    def abort(self, code, details):
+        raise _Abort(code, details)
+
+    def __getattr__(self, name):
+        return getattr(self._context, name)
+
+
+def _release_connections(function, *args):
+    # executor threads have no request cycle, release their connection like django does after a request
+    try:
+        return function(*args)
+    finally:
+        close_old_connections()
+
+
+def _next_batch(responses, size):
+    # each batch may run on another executor thread, so each one releases the connection of its thread.
+    # a batch is a whole database round trip of the stream, no query is left running between them
+    return _release_connections(list, islice(responses, size))
+
+
+def _unary_method(name):
+    async def method(self, request, context):
+        try:
+            return await self._run(_release_connections, getattr(self._servicer, name), request,
+                                   _ExecutorContext(context))
+        except _Abort as abort:
+            await context.abort(abort.code, abort.details)
+
+    method.__name__ = name
+    return method
+
+
+def _stream_method(name):
+    async def method(self, request, context):
+        try:
+            # decorators of the method check the session when it is called, so call it on executor too
+            responses = await self._run(_release_connections, getattr(self._servicer, name), request,
+                                        _ExecutorContext(context))
+            batch_size = settings.stream_batch_size
+            while True:
+                batch = await self._run(_next_batch, responses, batch_size)
+                for response in batch:
+                    yield response
+                if len(batch) < batch_size:
+                    break
+        except _Abort as abort:
+            await context.abort(abort.code, abort.details)
+
+    method.__name__ = name
+    return method
+
+
+class AsyncServerApi(rpc.ServerApiServicer):
+    """
+    Serve methods of ServerApi as coroutines, running them on executor.
+    methods ServerApi does not implement are left to the generated servicer, which answers UNIMPLEMENTED
+    """
+
+    def __init__(self, servicer, executor):
+        self._servicer = servicer
+        self._executor = executor
+
+    def _run(self, function, *args):
+        return asyncio.get_event_loop().run_in_executor(self._executor, function, *args)
+
+    async def upload_media(self, request_iterator, context):
+        # messages are read on the event loop and only their chunks are written on executor,
+        # so a slow client holds a coroutine between chunks instead of a worker thread
+        requests = request_iterator.__aiter__()
+        try:
+            try:
+                first = await requests.__anext__()
+            except StopAsyncIteration:
+                first = None
+            upload = await self._run(_release_connections, self._servicer.open_upload, first,
+                                     _ExecutorContext(context))
+            try:
+                try:
+                    if upload.writing:
+                        await self._run(upload.write, first)
+                        async for request in requests:
+                            await self._run(upload.write, request)
+                finally:
+                    await self._run(_release_connections, upload.save)
+                return await self._run(_release_connections, upload.finish)
+            finally:
+                await self._run(upload.close)
+        except _Abort as abort:
+            await context.abort(abort.code, abort.details)
+
+    signup = _unary_method('signup')
+    init_profile = _unary_method('init_profile')
+    is_logged_in = _unary_method('is_logged_in')
+    login = _unary_method('login')
+    logout = _unary_method('logout')
+    is_username_available = _unary_method('is_username_available')
+    is_email_available = _unary_method('is_email_available')
+    change_profile = _unary_method('change_profile')
+    change_username = _unary_method('change_username')
+    change_avatar = _unary_method('change_avatar')
+    get_user = _unary_method('get_user')
+    get_users = _unary_method('get_users')
+    get_follower = _stream_method('get_follower')
+    get_following = _stream_method('get_following')
+    download_media = _stream_method('download_media')
+    get_media_nearby = _stream_method('get_media_nearby')
+    get_map_tile = _unary_method('get_map_tile')
+
+
+class InterceptorAdapter(aio.ServerInterceptor):
+    """
+    Run a synchronous interceptor that either passes the call on or terminates it
+    """
+
+    def __init__(self, interceptor):
+        self._interceptor = interceptor
+
+    async def intercept_service(self, continuation, handler_call_details):
+        handler = self._interceptor.intercept_service(lambda details: _CONTINUE, handler_call_details)
+        if handler is _CONTINUE:
+            return await continuation(handler_call_details)
+
+        async def terminate(request, context):
+            try:
+                return handler.unary_unary(request, _ExecutorContext(context))
+            except _Abort as abort:
+                await context.abort(abort.code, abort.details)
+
+        return grpc.unary_unary_rpc_method_handler(terminate)
+
+
+class RateLimitAdapter(aio.ServerInterceptor):
+    """
+    Throttle calls through a RateLimitInterceptor, checking its buckets on the event loop
+    """
+
+    def __init__(self, interceptor):
+        self._interceptor = interceptor
+
+    async def intercept_service(self, continuation, handler_call_details):
+        handler = await continuation(handler_call_details)
+        if not self._interceptor.limits(handler_call_details.method):
+            return handler
+
+        def wrapper(behavior, response_streaming):
+            if response_streaming:
+                async def limited(request, context):
+                    if self._interceptor.is_limited(request, context):
+                        await context.abort(grpc.StatusCode.RESOURCE_EXHAUSTED, "Too many requests, try again later.")
+                    async for response in behavior(request, context):
+                        yield response
+            else:
+                async def limited(request, context):
+                    if self._interceptor.is_limited(request, context):
+                        await context.abort(grpc.StatusCode.RESOURCE_EXHAUSTED, "Too many requests, try again later.")
+                    return await behavior(request, context)
+            return limited
+
+        return _wrap_rpc_handler(handler, wrapper)
+
+
+class _AsyncStatusContext(_StatusContext):
+    async def abort(self, code, details):
+        self.code = code
+        await self._context.abort(code, details)
+
+
+async def _count_messages(messages, counter, method):
+    async for message in messages:
+        counter.inc((method,))
+        yield message
+
+
+class MetricsAdapter(aio.ServerInterceptor):
+    """
+    Record calls in metrics.registry as MetricsInterceptor does
+    """
+
+    async def intercept_service(self, continuation, handler_call_details):
+        method = handler_call_details.method.rpartition('/')[2]
+        handler = await continuation(handler_call_details)
+        if handler is None:
+            return None
+        request_streaming = handler.request_streaming
+
+        def wrapper(behavior, response_streaming):
+            if response_streaming:
+                async def recorded(request, context):
+                    status = _AsyncStatusContext(context)
+                    if request_streaming:
+                        request = _count_messages(request, metrics.messages_received, method)
+                    with metrics.track_call(method, status):
+                        async for response in _count_messages(behavior(request, status), metrics.messages_sent,
+                                                              method):
+                            yield response
+            else:
+                async def recorded(request, context):
+                    status = _AsyncStatusContext(context)
+                    if request_streaming:
+                        request = _count_messages(request, metrics.messages_received, method)
+                    with metrics.track_call(method, status):
+                        return await behavior(request, status)
+            return recorded
+
+        return _wrap_rpc_handler(handler, wrapper)
+
+
+class LoggingAdapter(aio.ServerInterceptor):
+    """
+    Log calls through a LoggingInterceptor when they end
+    """
+
+    def __init__(self, interceptor):
+        self._interceptor = interceptor
+
+    async def intercept_service(self, continuation, handler_call_details):
+        handler = await continuation(handler_call_details)
+        log_call = partial(self._interceptor.log_call, handler_call_details)
+
+        def wrapper(behavior, response_streaming):
+            if response_streaming:
+                async def logged(request, context):
+                    status = _AsyncStatusContext(context)
+                    with _timed(status, partial(log_call, context.peer())):
+                        async for response in behavior(request, status):
+                            yield response
+            else:
+                async def logged(request, context):
+                    status = _AsyncStatusContext(context)
+                    with _timed(status, partial(log_call, context.peer())):
+                        return await behavior(request, status)
+            return logged
+
+        return _wrap_rpc_handler(handler, wrapper)
+
+
+def _adapt_interceptor(interceptor):
+    if isinstance(interceptor, MetricsInterceptor):
+        return MetricsAdapter()
+    if isinstance(interceptor, LoggingInterceptor):
+        return LoggingAdapter(interceptor)
+    if isinstance(interceptor, RateLimitInterceptor):
+        return RateLimitAdapter(interceptor)
+    return InterceptorAdapter(interceptor)
+
+
+async def serve(address, executor, interceptors=(), options=None, maximum_concurrent_rpcs=None):
+    server = aio.server(interceptors=tuple(_adapt_interceptor(interceptor) for interceptor in interceptors),
+                        options=options,
+                        maximum_concurrent_rpcs=maximum_concurrent_rpcs)
+    rpc.add_ServerApiServicer_to_server(AsyncServerApi(services.ServerApi(), executor), server)
+    server.add_insecure_port(address)
+    await server.start()
+    try:
+        await server.wait_for_termination()
+    finally:
+        await server.stop(0)
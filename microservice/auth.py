@@ -0,0 +1,62 @@
+"""Session state shared by every step of one authenticated gRPC call."""
+
+from account.models import User
+from microservice.sessions import load_session
+from tripmedia import settings
+
+
+def get_session_key(context):
+    """
+    Return session key that client sent in the header of request or None
+    """
+    metadata = dict(context.invocation_metadata())
+    session_key = metadata.get(settings.auth_meta_keys.get("auth_session_key"))
+    return session_key if isinstance(session_key, str) else None
+
+
+class AuthContext:
+    """
+    Resolved session of the current call.
+    Auth decorators build it once and attach it to the grpc context, so service methods
+    read the session and the user without querying the database again
+    """
+
+    def __init__(self, session_key, data):
+        self.session_key = session_key
+        self.data = data
+        self._user = None
+
+    @property
+    def is_active(self):
+        return bool(self.data.get(settings.auth_meta_keys.get("auth_client_state")))
+
+    @property
+    def user_id(self):
+        return self.data.get(settings.auth_meta_keys.get("auth_user_key"))
+
+    @property
+    def user(self):
+        # user and profile are loaded together, once per call
+        if self._user is None and self.user_id is not None:
+            self._user = User.objects.select_related('profile').filter(pk=self.user_id).first()
+        return self._user
+
+    @classmethod
+    def from_session_key(cls, session_key):
+        data = load_session(session_key) if session_key else None
+        return cls(session_key, data) if data is not None else None
+
+
+def set_auth_context(context, auth_context):
+    context.auth_context = auth_context
+
+
+def get_auth_context(context):
+    """
+    Return auth context of the call, resolve it from header if no decorator did it before
+    """
+    auth_context = getattr(context, 'auth_context', None)
+    if auth_context is None:
+        auth_context = AuthContext.from_session_key(get_session_key(context))
+        set_auth_context(context, auth_context)
+    return auth_context
@@ -0,0 +1,176 @@
+"""In-process index of taken usernames and emails, so availability checks skip the database."""
+
+import hashlib
+import logging
+import math
+import threading
+import time
+from datetime import timedelta
+from django.db import connection
+
+from account.models import User
+from tripmedia import settings
+
+logger = logging.getLogger(__name__)
+
+
+class BloomFilter:
+    """
+    Set of strings that may answer a false "maybe" but never a false "no"
+    """
+
+    def __init__(self, capacity, error_rate):
+        self.size = max(8, int(math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)))
+        self.hash_count = max(1, int(round(self.size / capacity * math.log(2))))
+        self.count = 0
+        self._bits = bytearray((self.size + 7) // 8)
+        self._lock = threading.Lock()
+
+    def _positions(self, value):
+        digest = hashlib.blake2b(value.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], 'little')
+        second = int.from_bytes(digest[8:], 'little') | 1
+        return [(first + i * second) % self.size for i in range(self.hash_count)]
+
+    def add(self, value):
+        positions = self._positions(value)
+        # setting a bit is read-modify-write of its byte
+        with self._lock:
+            for position in positions:
+                self._bits[position >> 3] |= 1 << (position & 7)
+            self.count += 1
+
+    def __contains__(self, value):
+        bits = self._bits
+        return all(bits[position >> 3] & (1 << (position & 7)) for position in self._positions(value))
+
+
+class AvailabilityIndex:
+    """
+    Bloom filters of lowercased usernames and emails that are taken.
+    a value missing from its filter is available for sure, any other value has to be checked in database.
+    users added or renamed by other processes, the admin or seedgraph are read into the filters by a thread
+    of each server every refresh_interval, the filters are built again every rebuild_interval to drop the values
+    users left, and the unique columns of users stay the last word.
+    until warm() is called, or while the refresh thread lags more than max_lag, every value has to be checked
+    """
+
+    def __init__(self):
+        self._usernames = None
+        self._emails = None
+        self._building = None
+        self._last_renamed = None  # latest rename read into the filters
+        self._caught_up = 0.0
+        self._built = 0.0
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+
+    @property
+    def is_warm(self):
+        return self._usernames is not None
+
+    def warm(self):
+        options = settings.availability_index
+        capacity = max(User.objects.count() * 2, options.get("capacity"))
+        usernames = BloomFilter(capacity, options.get("error_rate"))
+        emails = BloomFilter(capacity, options.get("error_rate"))
+        started = time.monotonic()
+
+        # values added while the filters are built go to them too
+        with self._lock:
+            self._building = (usernames, emails)
+        try:
+            last_renamed = None
+            users = User.objects.values_list('renamed', 'username', 'email')
+            for (renamed, username, email) in users.iterator(chunk_size=10000):
+                usernames.add(username.lower())
+                if email:
+                    emails.add(email.lower())
+                last_renamed = _latest(last_renamed, renamed)
+            with self._lock:
+                self._usernames, self._emails = usernames, emails
+                self._last_renamed = _latest(self._last_renamed, last_renamed)
+                (self._caught_up, self._built) = (started, started)
+        finally:
+            with self._lock:
+                self._building = None
+
+    def refresh(self):
+        """
+        Read users added or renamed since the last refresh into the filters, and start building them again
+        in the background once they are older than rebuild_interval. it returns at once when another thread
+        is refreshing
+        """
+        if not self._refresh_lock.acquire(blocking=False):
+            return
+        try:
+            options = settings.availability_index
+            started = time.monotonic()
+            users = User.objects.values_list('renamed', 'username', 'email')
+            last_renamed = self._last_renamed
+            if last_renamed is not None:
+                # renames of transactions that commit late, or of hosts whose clock is behind, are read again
+                users = users.filter(renamed__gte=last_renamed - timedelta(seconds=options.get("refresh_overlap")))
+            for (renamed, username, email) in users.iterator(chunk_size=10000):
+                self.add(username=username, email=email)
+                last_renamed = _latest(last_renamed, renamed)
+            with self._lock:
+                (self._last_renamed, self._caught_up) = (last_renamed, started)
+                rebuild = self._building is None and started - self._built > options.get("rebuild_interval")
+                if rebuild:
+                    self._built = started
+        finally:
+            self._refresh_lock.release()
+        if rebuild:
+            threading.Thread(target=self._rebuild, name='availability-index', daemon=True).start()
+
+    def start(self):
+        """
+        Refresh the filters every refresh_interval from a thread of this process, calls only read them
+        """
+        threading.Thread(target=self._refresh_forever, name='availability-refresh', daemon=True).start()
+
+    def _refresh_forever(self):
+        while True:
+            time.sleep(settings.availability_index.get("refresh_interval"))
+            try:
+                self.refresh()
+            except Exception:
+                logger.exception("Availability index was not refreshed")
+            finally:
+                connection.close()
+
+    def _rebuild(self):
+        try:
+            self.warm()
+        finally:
+            connection.close()
+
+    def _fresh(self):
+        # a filter that missed users added meanwhile could answer a false "no"
+        return self._usernames is not None and \
+            time.monotonic() - self._caught_up <= settings.availability_index.get("max_lag")
+
+    def add(self, username=None, email=None):
+        with self._lock:
+            filters = [(self._usernames, self._emails)]
+            if self._building is not None:
+                filters.append(self._building)
+        for (usernames, emails) in filters:
+            if username and usernames is not None:
+                usernames.add(username.lower())
+            if email and emails is not None:
+                emails.add(email.lower())
+
+    def may_have_username(self, username):
+        return not self._fresh() or username.lower() in self._usernames
+
+    def may_have_email(self, email):
+        return not self._fresh() or email.lower() in self._emails
+
+
+def _latest(first, second):
+    return second if first is None or (second is not None and second > first) else first
+
+
+availability_index = AvailabilityIndex()
@@ -0,0 +1,29 @@
+"""
+PostgreSQL backend that takes connections from microservice.pool instead of opening new ones,
+and gives them back to the pool when django closes them
+"""
+
+from functools import partial
+
+from django.db.backends.postgresql import base
+
+from microservice.pool import get_pool
+
+
+class DatabaseWrapper(base.DatabaseWrapper):
+
+    @property
+    def pool_alias(self):
+        # test and fixture databases replace NAME of the alias, their connections must not mix with the old ones
+        return "{}/{}".format(self.alias, self.settings_dict['NAME'])
+
+    def get_new_connection(self, conn_params):
+        pool = get_pool(self.pool_alias, partial(super().get_new_connection, conn_params))
+        connection = pool.getconn()
+        self.isolation_level = self.settings_dict['OPTIONS'].get('isolation_level', connection.isolation_level)
+        return connection
+
+    def _close(self):
+        if self.connection is not None:
+            with self.wrap_database_errors:
+                get_pool(self.pool_alias).putconn(self.connection)
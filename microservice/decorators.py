@@ -1,40 +1,34 @@
 import grpc
-from django.contrib.sessions.models import Session
 
+from microservice.auth import AuthContext, get_session_key, set_auth_context
+from microservice.sessions import delete_session
 from tripmedia import settings
 
 
 def grpc_require_auth(rpc_method):
     def check_session(*args, **kwargs):
-        session = None
-        session_key = ''
-
-        request = args[1]
         context = args[2]
-        metadata = dict(context.invocation_metadata())
-
         auth_meta_keys = settings.auth_meta_keys
 
         # get session key from header if exists
-        if auth_meta_keys.get("auth_session_key") in metadata:
-            session_key = metadata[auth_meta_keys.get("auth_session_key")]
-        else:
-            session_key = ''
+        session_key = get_session_key(context)
+        if session_key is None:
             context.abort(grpc.StatusCode.UNAUTHENTICATED, "Access dined!")
             return
 
-        # get request session
-        try:
-            session = Session.objects.get(pk=session_key)
-            data = session.get_decoded()
-            if all([
-                data[auth_meta_keys.get("auth_key")] ==
-                auth_meta_keys.get("anonymous_value") or auth_meta_keys.get("auth_value"),
-            ]):
-                return rpc_method(*args, **kwargs)
-        except Session.DoesNotExist:
+        # get request session, once for the whole call
+        auth_context = AuthContext.from_session_key(session_key)
+        if auth_context is None:
             context.abort(grpc.StatusCode.UNAUTHENTICATED, "Access dined!")
+            return
 
+        if auth_context.data.get(auth_meta_keys.get("auth_key")) in (auth_meta_keys.get("anonymous_value"),
+                                                                     auth_meta_keys.get("auth_value")):
+            set_auth_context(context, auth_context)
+            return rpc_method(*args, **kwargs)
+
+        # a session that is neither anonymous nor logged in authenticates nothing
+        context.abort(grpc.StatusCode.UNAUTHENTICATED, "Access dined!")
         return
 
     return check_session
@@ -43,27 +37,23 @@ def grpc_require_auth(rpc_method):
 def grpc_check_user_state(rpc_method):
     def has_active_session(*args, **kwargs):
         context = args[2]
-        metadata = dict(context.invocation_metadata())
-        auth_meta_keys = settings.auth_meta_keys
-        session_key = metadata.get(auth_meta_keys.get("auth_session_key"))
 
         # check if session key is set in header
-        if auth_meta_keys.get("auth_session_key") in metadata \
-                and isinstance(metadata.get(auth_meta_keys.get("auth_session_key")), str):
-            try:
-                session = Session.objects.get(pk=session_key)
-                data = session.get_decoded()
-                if data[auth_meta_keys.get("auth_client_state")]:
-                    context.abort(grpc.StatusCode.ALREADY_EXISTS, "Another device is logged in with this user.")
-                    return
-                else:
-                    session.delete()
-                    context.abort(grpc.StatusCode.UNAUTHENTICATED, "Access dined!")
-                    return
-            except Session.DoesNotExist as key:
+        session_key = get_session_key(context)
+        if session_key is not None:
+            auth_context = AuthContext.from_session_key(session_key)
+            if auth_context is None:
                 # ignore session key in header
                 return rpc_method(*args, **kwargs)
 
+            if auth_context.is_active:
+                context.abort(grpc.StatusCode.ALREADY_EXISTS, "Another device is logged in with this user.")
+                return
+            else:
+                delete_session(session_key)
+                context.abort(grpc.StatusCode.UNAUTHENTICATED, "Access dined!")
+                return
+
         return rpc_method(*args, **kwargs)
 
     return has_active_session
@@ -0,0 +1,29 @@
+"""
+Functions run by the password hashing processes.
+spawned processes import this module before django is set up, so it must not import any model
+"""
+
+import os
+
+from django.contrib.auth import hashers
+
+
+def setup(settings_module):
+    # spawned workers start from a fresh interpreter, django has to be set up again
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', settings_module)
+    import django
+    django.setup()
+
+
+def hash_password(raw_password):
+    return hashers.make_password(raw_password)
+
+
+def verify_password(raw_password, encoded):
+    """
+    Return whether raw_password matches encoded, with a new hash when the hasher or its iterations changed.
+    passwords.make_password and passwords.check_password run it on the hashing processes
+    """
+    updated = []
+    valid = hashers.check_password(raw_password, encoded, setter=lambda raw: updated.append(hash_password(raw)))
+    return valid, updated[0] if updated else None
@@ -1,8 +1,17 @@
 """Interceptor that authenticate users."""
 
+import asyncio
 import grpc
 import logging
+import random
+import time
+from contextlib import contextmanager
+from django.db import close_old_connections
+from functools import partial
 
+from microservice import metrics
+from microservice.logs import redact_session_key
+from microservice.ratelimit import TokenBucketLimiter
 from tripmedia import settings
 
 logger = logging.getLogger(__name__)
@@ -15,6 +24,70 @@ def _unary_unary_rpc_terminator(code, details):
     return grpc.unary_unary_rpc_method_handler(terminate)
 
 
+def _wrap_rpc_handler(handler, wrapper):
+    """
+    Return a copy of the rpc method handler whose behavior is wrapped by wrapper(behavior, response_streaming)
+    """
+    if handler is None:
+        return None
+
+    if handler.request_streaming and handler.response_streaming:
+        handler_factory, behavior = grpc.stream_stream_rpc_method_handler, handler.stream_stream
+    elif handler.request_streaming:
+        handler_factory, behavior = grpc.stream_unary_rpc_method_handler, handler.stream_unary
+    elif handler.response_streaming:
+        handler_factory, behavior = grpc.unary_stream_rpc_method_handler, handler.unary_stream
+    else:
+        handler_factory, behavior = grpc.unary_unary_rpc_method_handler, handler.unary_unary
+
+    return handler_factory(wrapper(behavior, handler.response_streaming),
+                           request_deserializer=handler.request_deserializer,
+                           response_serializer=handler.response_serializer)
+
+
+class _StatusContext:
+    """
+    Context that remembers the status code the call ends with
+    """
+
+    def __init__(self, context):
+        self._context = context
+        self.code = grpc.StatusCode.OK
+
+    def set_code(self, code):
+        self.code = code
+        self._context.set_code(code)
+
+    def abort(self, code, details):
+        self.code = code
+        self._context.abort(code, details)
+
+    def fail(self, error):
+        # abort has set the code already, any other error is not handled by the method
+        if isinstance(error, (GeneratorExit, asyncio.CancelledError)):
+            self.code = grpc.StatusCode.CANCELLED
+        elif self.code is grpc.StatusCode.OK:
+            self.code = grpc.StatusCode.UNKNOWN
+
+    def __getattr__(self, name):
+        return getattr(self._context, name)
+
+
+@contextmanager
+def _timed(status, finish):
+    """
+    Call finish(code, seconds) once the block ends, with the status code status.code has then
+    """
+    started = time.perf_counter()
+    try:
+        yield
+    except BaseException as error:
+        status.fail(error)
+        raise
+    finally:
+        finish(status.code, time.perf_counter() - started)
+
+
 class AuthenticateInterceptor(grpc.ServerInterceptor):
     """
     Check header of each coming request and check session_key header key in metadata.
@@ -36,18 +109,217 @@ class AuthenticateInterceptor(grpc.ServerInterceptor):
 
 
 class LoggingInterceptor(grpc.ServerInterceptor):
+    """
+    Log one structured record for each call when it ends, with its duration, status code and client.
+    calls ending with OK are sampled by the rates of settings.call_logging, the others are always logged
+    """
+
+    def __init__(self):
+        options = settings.call_logging
+        self.sample_rate = options.get("sample_rate")
+        self.method_sample_rates = options.get("method_sample_rates")
+
+    def log_call(self, handler_call_details, peer, code, seconds):
+        method = handler_call_details.method.rpartition('/')[2]
+        if code is grpc.StatusCode.OK and random.random() >= self.method_sample_rates.get(method, self.sample_rate):
+            return
 
-    def intercept_service(self, continuation, handler_call_details):
-        called_method = handler_call_details.method
         metadata = dict(handler_call_details.invocation_metadata)
+        logger.log(logging.INFO if code is grpc.StatusCode.OK else logging.WARNING, "call", extra={
+            "method": method,
+            "code": code.name,
+            "duration_ms": round(seconds * 1000, 3),
+            "peer": peer,
+            "user_agent": metadata.get("user-agent"),
+            "session": redact_session_key(metadata.get(settings.auth_meta_keys.get("auth_session_key"))),
+        })
+
+    def intercept_service(self, continuation, handler_call_details):
+        if not logger.isEnabledFor(logging.INFO):
+            return continuation(handler_call_details)
+
+        def wrapper(behavior, response_streaming):
+            if response_streaming:
+                def logged(request, context):
+                    status = _StatusContext(context)
+                    with _timed(status, partial(self.log_call, handler_call_details, context.peer())):
+                        yield from behavior(request, status)
+            else:
+                def logged(request, context):
+                    status = _StatusContext(context)
+                    with _timed(status, partial(self.log_call, handler_call_details, context.peer())):
+                        return behavior(request, status)
+            return logged
+
+        return _wrap_rpc_handler(continuation(handler_call_details), wrapper)
+
+
+def _with_database_connections(behavior, response_streaming):
+    if response_streaming:
+        def wrapper(request, context):
+            close_old_connections()
+            try:
+                yield from behavior(request, context)
+            finally:
+                close_old_connections()
+    else:
+        def wrapper(request, context):
+            close_old_connections()
+            try:
+                return behavior(request, context)
+            finally:
+                close_old_connections()
+
+    return wrapper
+
+
+class DatabaseConnectionInterceptor(grpc.ServerInterceptor):
+    """
+    Release unusable or obsolete database connections before and after each call,
+    as django does around each http request.
+    with the pooled backend every call gives its connection back to the pool
+    """
+
+    def intercept_service(self, continuation, handler_call_details):
+        return _wrap_rpc_handler(continuation(handler_call_details), _with_database_connections)
+
+
+def _peer_address(peer):
+    """
+    Return address of a peer such as "ipv4:10.0.0.1:54321" or "ipv6:[::1]:54321" without its port
+    """
+    address = peer.partition(':')[2] or peer
+    if address.endswith(']') or ':' not in address:
+        return address
+    return address.rpartition(':')[0]
+
+
+def _client_address(peer, metadata, forwarded_for, trusted_proxies):
+    """
+    Return address of the client of a call, read from the forwarded_for metadata key when the peer
+    is a trusted proxy. addresses left of the last one a trusted proxy added are set by the client
+    """
+    address = _peer_address(peer)
+    if not forwarded_for or address not in trusted_proxies:
+        return address
+    hops = [hop.strip() for (key, value) in metadata if key == forwarded_for for hop in value.split(',')]
+    while hops and address in trusted_proxies:
+        address = hops.pop()
+    return address
+
+
+class RateLimitInterceptor(grpc.ServerInterceptor):
+    """
+    Throttle the rate limited methods with a token bucket for each client address, and for each username
+    of each client address so no client can lock others out of an account.
+    calls over either of them are rejected with RESOURCE_EXHAUSTED before any password is hashed
+    """
+
+    def __init__(self):
+        options = settings.rate_limit
+        self.methods = set(options.get("methods"))
+        self.forwarded_for = options.get("forwarded_for")
+        self.trusted_proxies = frozenset(options.get("trusted_proxies"))
+        self.peers = TokenBucketLimiter(options.get("peer_rate"), options.get("peer_burst"),
+                                        options.get("shards"), options.get("evict_every"))
+        self.usernames = TokenBucketLimiter(options.get("username_rate"), options.get("username_burst"),
+                                            options.get("shards"), options.get("evict_every"))
+
+    def limits(self, method):
+        return method.rpartition('/')[2] in self.methods
+
+    def is_limited(self, request, context):
+        address = _client_address(context.peer(), context.invocation_metadata() or (), self.forwarded_for,
+                                  self.trusted_proxies)
+        if not self.peers.allow(address):
+            return True
+        username = getattr(request, 'username', '')
+        return bool(username) and not self.usernames.allow((address, username.lower()))
+
+    def stats(self):
+        return {"peers": self.peers.stats(), "usernames": self.usernames.stats()}
+
+    def intercept_service(self, continuation, handler_call_details):
+        handler = continuation(handler_call_details)
+        if not self.limits(handler_call_details.method):
+            return handler
+
+        def wrapper(behavior, response_streaming):
+            if response_streaming:
+                def limited(request, context):
+                    if self.is_limited(request, context):
+                        context.abort(grpc.StatusCode.RESOURCE_EXHAUSTED, "Too many requests, try again later.")
+                    yield from behavior(request, context)
+            else:
+                def limited(request, context):
+                    if self.is_limited(request, context):
+                        context.abort(grpc.StatusCode.RESOURCE_EXHAUSTED, "Too many requests, try again later.")
+                    return behavior(request, context)
+            return limited
+
+        return _wrap_rpc_handler(handler, wrapper)
+
+
+def _count_messages(messages, counter, method):
+    for message in messages:
+        counter.inc((method,))
+        yield message
 
-        logger.debug("client call %s" % called_method)
 
-        # logging request
-        try:
-            logger.debug("%s" % metadata["user-agent"])
-            logger.info("%s SK/%s" % (called_method, metadata[settings.auth_meta_keys.get("auth_session_key")]))
-        except Exception as key:
-            logger.error("request has no %s in its header" % key)
+class MetricsInterceptor(grpc.ServerInterceptor):
+    """
+    Record duration, status code and streamed messages of each call, and the calls in flight, in metrics.registry.
+    it should come first, so calls rejected by other interceptors are recorded too
+    """
+
+    def intercept_service(self, continuation, handler_call_details):
+        method = handler_call_details.method.rpartition('/')[2]
+        handler = continuation(handler_call_details)
+        if handler is None:
+            return None
+        request_streaming = handler.request_streaming
+
+        def wrapper(behavior, response_streaming):
+            if response_streaming:
+                def recorded(request, context):
+                    status = _StatusContext(context)
+                    if request_streaming:
+                        request = _count_messages(request, metrics.messages_received, method)
+                    with metrics.track_call(method, status):
+                        yield from _count_messages(behavior(request, status), metrics.messages_sent, method)
+            else:
+                def recorded(request, context):
+                    status = _StatusContext(context)
+                    if request_streaming:
+                        request = _count_messages(request, metrics.messages_received, method)
+                    with metrics.track_call(method, status):
+                        return behavior(request, status)
+            return recorded
+
+        return _wrap_rpc_handler(handler, wrapper)
+
+
+class ProfilingInterceptor(grpc.ServerInterceptor):
+    """
+    Run each call under profiling.Profiler, counting its queries and reporting it when it is slow.
+    it should come last, so the queries of every other interceptor's wrapper are left out
+    """
+
+    def __init__(self, profiler):
+        self._profiler = profiler
+
+    def intercept_service(self, continuation, handler_call_details):
+        method = handler_call_details.method.rpartition('/')[2]
+
+        def wrapper(behavior, response_streaming):
+            if response_streaming:
+                def profiled(request, context):
+                    with self._profiler.profile(method):
+                        yield from behavior(request, context)
+            else:
+                def profiled(request, context):
+                    with self._profiler.profile(method):
+                        return behavior(request, context)
+            return profiled
 
-        return continuation(handler_call_details)
+        return _wrap_rpc_handler(continuation(handler_call_details), wrapper)
@@ -0,0 +1,81 @@
+"""Structured logging of the gRPC server, written out by a background thread."""
+
+import hashlib
+import json
+import logging
+import queue
+import time
+from logging.handlers import QueueHandler, QueueListener
+
+_RECORD_ATTRIBUTES = set(vars(logging.LogRecord('', 0, '', 0, '', (), None))) | {'message', 'asctime'}
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    Format a record as one line of json, with the fields given to the log call through extra
+    """
+
+    def format(self, record):
+        entry = {
+            "time": "{}.{:03d}Z".format(time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(record.created)),
+                                        int(record.msecs)),
+            "level": record.levelname,
+            "logger": record.name,
+            "process": record.process,
+            "message": record.getMessage(),
+        }
+        for (key, value) in vars(record).items():
+            if key not in _RECORD_ATTRIBUTES and value is not None:
+                entry[key] = value
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+def redact_session_key(session_key):
+    """
+    Return a short digest that tells session keys apart in logs without giving them away
+    """
+    if not session_key:
+        return None
+    return hashlib.blake2b(session_key.encode(), digest_size=6).hexdigest()
+
+
+class BackgroundHandler(QueueHandler):
+    """
+    Put records on the queue of the log thread, which formats and writes them.
+    a full queue drops records instead of blocking the calling thread
+    """
+
+    def __init__(self, records):
+        super().__init__(records)
+        self.dropped = 0
+
+    def prepare(self, record):
+        # the log thread formats the record, it never leaves this process
+        return record
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+def start_background_logging(name, queue_size):
+    """
+    Move handlers of the named logger to a log thread, so logging only queues records.
+    return the listener, stop() writes out the queued records and ends the thread
+    """
+    logger = logging.getLogger(name)
+    handlers = [handler for handler in logger.handlers if not isinstance(handler, BackgroundHandler)]
+    if not handlers:
+        return None
+
+    records = queue.Queue(queue_size)
+    listener = QueueListener(records, *handlers, respect_handler_level=True)
+    for handler in handlers:
+        logger.removeHandler(handler)
+    logger.addHandler(BackgroundHandler(records))
+    listener.start()
+    return listener
@@ -0,0 +1,50 @@
+import os
+import time
+from concurrent import futures
+from django.core.management import BaseCommand
+
+from microservice import hashing, passwords
+from tripmedia import settings
+
+
+class Command(BaseCommand):
+    help = "Measure password checks per second on the calling threads and on hashing pools of growing size"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--calls', type=int, default=200,
+                            help="Password checks made for each pool size.")
+        parser.add_argument('--threads', type=int, default=settings.default_workers,
+                            help="Threads making the checks, like gRPC worker threads do.")
+        parser.add_argument('--processes', type=int, nargs='*',
+                            help="Pool sizes to measure, every size up to the number of cores by default.")
+
+    @staticmethod
+    def measure(check, calls, threads):
+        encoded = hashing.hash_password("bench password")
+        with futures.ThreadPoolExecutor(max_workers=threads) as callers:
+            started = time.perf_counter()
+            for (valid, _) in callers.map(lambda _: check("bench password", encoded), range(calls)):
+                assert valid
+            return time.perf_counter() - started
+
+    def handle(self, *args, **options):
+        calls, threads = options['calls'], options['threads']
+        sizes = options['processes'] or range(1, (os.cpu_count() or 1) + 1)
+
+        self.stdout.write("{:>10} {:>8} {:>10} {:>10}".format("processes", "calls", "seconds", "checks/s"))
+        seconds = self.measure(hashing.verify_password, calls, threads)
+        self.stdout.write("{:>10} {:>8} {:>10.2f} {:>10.1f}".format("inline", calls, seconds, calls / seconds))
+
+        for size in sizes:
+            executor = passwords.create_executor(size)
+            try:
+                # start every process before measuring
+                list(executor.map(hashing.hash_password, [""] * size))
+
+                def check(raw_password, encoded):
+                    return executor.submit(hashing.verify_password, raw_password, encoded).result()
+
+                seconds = self.measure(check, calls, max(threads, size))
+            finally:
+                executor.shutdown(wait=True)
+            self.stdout.write("{:>10} {:>8} {:>10.2f} {:>10.1f}".format(size, calls, seconds, calls / seconds))
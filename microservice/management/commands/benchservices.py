@@ -0,0 +1,289 @@
+import grpc
+import json
+import math
+import os
+import random
+import re
+import signal
+import subprocess
+import sys
+import threading
+import time
+import urllib.request
+from collections import Counter, defaultdict
+from concurrent import futures
+from django.core.management import BaseCommand, CommandError, call_command
+from django.db import connection
+from django.utils.timezone import now
+from itertools import count
+
+from account.models import User
+from microservice import pool
+from microservice.message import server_api_pb2 as msg
+from microservice.rpc import server_api_pb2_grpc as rpc
+from tripmedia import settings
+
+BENCH_PASSWORD = "bench password 1"
+SCENARIOS = ('signup', 'login', 'get_user', 'is_username_available', 'get_follower', 'get_following')
+
+_sample = re.compile(r'^(\w+)\{([^}]*)\} (\S+)$')
+_label = re.compile(r'(\w+)="((?:[^"\\]|\\.)*)"')
+
+
+def _percentile(values, share):
+    # nearest rank of sorted values
+    if not values:
+        return None
+    return values[min(len(values) - 1, max(0, math.ceil(share * len(values)) - 1))]
+
+
+class Command(BaseCommand):
+    help = "Benchmark runservices on a seeded fixture database and print latency, throughput and queries as json"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=1000,
+                            help="Users seeded in the fixture database.")
+        parser.add_argument('--connections', type=int, default=10000,
+                            help="Follow connections seeded between users, followers of a user follow a power law.")
+        parser.add_argument('--clients', type=int, default=8,
+                            help="Concurrent clients, each with its own channel and session.")
+        parser.add_argument('--calls', type=int, default=400,
+                            help="Calls made by all clients together in each scenario.")
+        parser.add_argument('--scenarios', nargs='*', choices=SCENARIOS, default=SCENARIOS,
+                            help="Scenarios to run, in this order.")
+        parser.add_argument('--page-size', type=int, default=50,
+                            help="Page size of follower and following streams.")
+        parser.add_argument('--workers', type=int, default=settings.default_workers,
+                            help="Worker threads of the benchmarked server.")
+        parser.add_argument('--async', action='store_true', dest='use_async',
+                            help="Benchmark the asyncio server.")
+        parser.add_argument('--profile', action='store_true',
+                            help="Count queries of each call on the threaded server. profiling slows every call, "
+                                 "compare runs with and without it only to each other.")
+        parser.add_argument('--port', type=int, default=8595,
+                            help="Port of the benchmarked server.")
+        parser.add_argument('--metrics-port', type=int, default=8596,
+                            help="Port of /metrics of the benchmarked server.")
+        parser.add_argument('--fixture', default='tripmedia_bench',
+                            help="Name of the fixture database, it is created again on each run.")
+        parser.add_argument('--keep-fixture', action='store_true',
+                            help="Leave the fixture database in place after the run.")
+        parser.add_argument('--seed', type=int, default=1,
+                            help="Seed of the random graph and of the calls, equal seeds make equal runs.")
+        parser.add_argument('--server-log', default=os.devnull,
+                            help="File the output of the benchmarked server is written to.")
+        parser.add_argument('--output',
+                            help="File the json report is written to, instead of stdout.")
+
+    def handle(self, *args, **options):
+        if options['profile'] and options['use_async']:
+            raise CommandError("--profile is only available for the threaded server.")
+
+        old_name = self.create_fixture(options['fixture'])
+        try:
+            seeded = self.seed(options['users'], options['connections'], options['seed'])
+            server = self.start_server(**options)
+            try:
+                report = self.run(seeded, **options)
+            finally:
+                self.stop_server(server)
+        finally:
+            if not options['keep_fixture']:
+                # pooled connections would keep the fixture database in use
+                connection.close()
+                pool.close_pools()
+                connection.creation.destroy_test_db(old_name, verbosity=0)
+
+        output = json.dumps(report, indent=2)
+        if options['output']:
+            with open(options['output'], 'w') as file:
+                file.write(output + "\n")
+        else:
+            self.stdout.write(output)
+
+    @staticmethod
+    def create_fixture(name):
+        # the test database machinery creates and migrates the fixture on sqlite and postgres alike
+        if connection.vendor == 'sqlite':
+            name = os.path.join(settings.BASE_DIR, name + '.sqlite')
+        old_name = connection.settings_dict['NAME']
+        connection.settings_dict.setdefault('TEST', {})['NAME'] = name
+        connection.creation.create_test_db(verbosity=0, autoclobber=True, serialize=False)
+        return old_name
+
+    @staticmethod
+    def seed(users, connections, seed):
+        """
+        Seed users sharing BENCH_PASSWORD and a power-law follow graph between them.
+        return (user id, username) of seeded users
+        """
+        call_command('seedgraph', users=users, edges=connections, prefix='bench', password=BENCH_PASSWORD, seed=seed)
+        return list(User.objects.filter(username__startswith='bench').order_by('id').values_list('id', 'username'))
+
+    def start_server(self, **options):
+        command = [sys.executable, os.path.join(settings.BASE_DIR, 'manage.py'), 'runservices',
+                   '--port', str(options['port']), '--metrics-port', str(options['metrics_port']),
+                   '--workers', str(options['workers']), '--no-rate-limit']
+        # both servers run the same way unless profiling is asked for, which only the threaded one does
+        command += ['--async'] if options['use_async'] else []
+        command += ['--profile'] if options['profile'] else []
+        environment = dict(os.environ, TRIPMEDIA_DB_NAME=connection.settings_dict['NAME'])
+        log = open(options['server_log'], 'w')
+        server = subprocess.Popen(command, env=environment, stdout=log, stderr=subprocess.STDOUT)
+        log.close()
+
+        channel = grpc.insecure_channel("localhost:{}".format(options['port']))
+        try:
+            grpc.channel_ready_future(channel).result(timeout=60)
+        except grpc.FutureTimeoutError:
+            self.stop_server(server)
+            raise CommandError("Benchmarked server did not start, see --server-log.")
+        finally:
+            channel.close()
+        self.stderr.write("\t✓ server started (pid {})".format(server.pid))
+        return server
+
+    @staticmethod
+    def stop_server(server):
+        # runservices stops cleanly on interrupt
+        server.send_signal(signal.SIGINT)
+        try:
+            server.wait(timeout=15)
+        except subprocess.TimeoutExpired:
+            server.kill()
+            server.wait()
+
+    def run(self, seeded, **options):
+        session_key = settings.auth_meta_keys.get("auth_session_key")
+        stubs = []
+        for (_, username) in seeded[:options['clients']]:
+            stub = rpc.ServerApiStub(grpc.insecure_channel("localhost:{}".format(options['port'])))
+            session = stub.login(msg.LoginReq(username=username, raw_password=BENCH_PASSWORD),
+                                 metadata=[(session_key, '')]).session_key
+            stubs.append((stub, [(session_key, session)]))
+
+        report = {
+            "started": now().isoformat(),
+            "database": connection.vendor,
+            "users": len(seeded),
+            "connections": options['connections'],
+            "clients": len(stubs),
+            "calls": options['calls'],
+            "workers": options['workers'],
+            "async": options['use_async'],
+            "profile": options['profile'],
+            "seed": options['seed'],
+            "scenarios": {},
+        }
+        for scenario in options['scenarios']:
+            report["scenarios"][scenario] = self.run_scenario(scenario, stubs, seeded, **options)
+            self.stderr.write("\t✓ {}".format(scenario))
+        return report
+
+    def run_scenario(self, scenario, stubs, seeded, **options):
+        call = self.get_call(scenario, seeded, options['page_size'])
+        metrics_url = "http://localhost:{}/metrics".format(options['metrics_port'])
+        calls = options['calls']
+        errors = Counter()
+        errors_lock = threading.Lock()
+
+        def drive(index):
+            (stub, session) = stubs[index]
+            rng = random.Random("{}-{}-{}".format(options['seed'], scenario, index))
+            latencies = []
+            for _ in range(calls // len(stubs) + (index < calls % len(stubs))):
+                started = time.perf_counter()
+                try:
+                    call(stub, session, rng)
+                except grpc.RpcError as error:
+                    with errors_lock:
+                        errors[error.code().name] += 1
+                latencies.append(time.perf_counter() - started)
+            return latencies
+
+        before = self.scrape(metrics_url)
+        with futures.ThreadPoolExecutor(max_workers=len(stubs)) as executor:
+            started = time.perf_counter()
+            latencies = sorted(latency for latencies in executor.map(drive, range(len(stubs)))
+                               for latency in latencies)
+            seconds = time.perf_counter() - started
+        after = self.scrape(metrics_url)
+
+        handled = after['grpc_server_handled_total'][scenario] - before['grpc_server_handled_total'][scenario]
+        queries = after['grpc_server_queries_total'][scenario] - before['grpc_server_queries_total'][scenario]
+        query_seconds = (after['grpc_server_query_seconds_total'][scenario] -
+                         before['grpc_server_query_seconds_total'][scenario])
+        profiled = options['profile'] and handled
+        return {
+            "calls": len(latencies),
+            "errors": dict(errors),
+            "seconds": round(seconds, 3),
+            "throughput": round(len(latencies) / seconds, 1),
+            "latency_ms": {
+                "mean": round(sum(latencies) / len(latencies) * 1000, 3),
+                "p50": round(_percentile(latencies, .50) * 1000, 3),
+                "p95": round(_percentile(latencies, .95) * 1000, 3),
+                "p99": round(_percentile(latencies, .99) * 1000, 3),
+                "max": round(latencies[-1] * 1000, 3),
+            },
+            "queries_per_call": round(queries / handled, 2) if profiled else None,
+            "db_ms_per_call": round(query_seconds / handled * 1000, 3) if profiled else None,
+        }
+
+    @staticmethod
+    def get_call(scenario, users, page_size):
+        """
+        Return call(stub, session metadata, rng) that makes one call of scenario
+        """
+        new_users = count()
+        anonymous = [(settings.auth_meta_keys.get("auth_session_key"), '')]
+
+        def signup(stub, session, rng):
+            number = next(new_users)
+            stub.signup(msg.SignupReq(username='new{}x{}'.format(number, rng.randrange(10 ** 6)),
+                                      email='new{}x{}@bench.local'.format(number, rng.randrange(10 ** 6)),
+                                      raw_password=BENCH_PASSWORD), metadata=anonymous)
+
+        def login(stub, session, rng):
+            stub.login(msg.LoginReq(username=rng.choice(users)[1], raw_password=BENCH_PASSWORD), metadata=anonymous)
+
+        def get_user(stub, session, rng):
+            stub.get_user(msg.GetUserReq(user_id=rng.choice(users)[0]), metadata=session)
+
+        def is_username_available(stub, session, rng):
+            # half of the names are taken
+            username = rng.choice(users)[1] if rng.random() < .5 else 'free{}'.format(rng.randrange(10 ** 9))
+            stub.is_username_available(msg.CheckUsernameReq(username=username), metadata=session)
+
+        def get_follower(stub, session, rng):
+            for _ in stub.get_follower(msg.GetFollowerReq(user_id=rng.choice(users)[0], page_size=page_size),
+                                       metadata=session):
+                pass
+
+        def get_following(stub, session, rng):
+            for _ in stub.get_following(msg.GetFollowerReq(page_size=page_size), metadata=session):
+                pass
+
+        return {
+            'signup': signup,
+            'login': login,
+            'get_user': get_user,
+            'is_username_available': is_username_available,
+            'get_follower': get_follower,
+            'get_following': get_following,
+        }[scenario]
+
+    @staticmethod
+    def scrape(url):
+        """
+        Return {metric name: {grpc_method: value summed over other labels}} of the benchmarked server
+        """
+        samples = defaultdict(lambda: defaultdict(float))
+        with urllib.request.urlopen(url, timeout=10) as response:
+            for line in response.read().decode().splitlines():
+                match = _sample.match(line)
+                if match:
+                    labels = dict(_label.findall(match.group(2)))
+                    if 'grpc_method' in labels:
+                        samples[match.group(1)][labels['grpc_method']] += float(match.group(3))
+        return samples
@@ -1,35 +1,225 @@
+import asyncio
 import grpc
+import os
+import signal
 import time
 from concurrent import futures
 from contextlib import contextmanager
-from django.core.management import BaseCommand
+from django.core.management import BaseCommand, CommandError
+from django.db import connections
 
-from microservice import services
-from microservice.interceptors import AuthenticateInterceptor, LoggingInterceptor
+from microservice import logs, metrics, passwords, pool, profiling, services
+from microservice.availability import availability_index
+from microservice.interceptors import (AuthenticateInterceptor, DatabaseConnectionInterceptor, LoggingInterceptor,
+                                      MetricsInterceptor, ProfilingInterceptor, RateLimitInterceptor)
 from microservice.rpc import server_api_pb2_grpc as rpc
+from microservice.sessions import session_cache
+from tripmedia import settings
 
 
 class Command(BaseCommand):
     help = "Starts the GRPC server"
 
-    @contextmanager
-    def serve_forever(self, **kwargs):
+    def add_arguments(self, parser):
+        parser.add_argument('--host', default=settings.default_server_host,
+                            help="Address to bind the server to.")
+        parser.add_argument('--port', type=int, default=settings.default_server_port,
+                            help="Port to bind the server to.")
+        parser.add_argument('--workers', type=int, default=settings.default_workers,
+                            help="Worker threads of each server process.")
+        parser.add_argument('--max-concurrent-rpcs', type=int, default=settings.default_max_concurrent_rpcs,
+                            help="Calls over this limit are rejected with RESOURCE_EXHAUSTED.")
+        parser.add_argument('--processes', type=int, default=settings.default_processes,
+                            help="Server processes sharing the port through SO_REUSEPORT.")
+        parser.add_argument('--keepalive-time', type=int,
+                            default=settings.grpc_server_options.get("grpc.keepalive_time_ms"),
+                            help="Milliseconds between keepalive pings sent to clients.")
+        parser.add_argument('--max-message-length', type=int,
+                            default=settings.grpc_server_options.get("grpc.max_receive_message_length"),
+                            help="Largest message in bytes the server sends or receives.")
+        parser.add_argument('--async', action='store_true', dest='use_async',
+                            help="Serve calls from an asyncio server, running database work on the worker threads.")
+        parser.add_argument('--profile', action='store_true', default=settings.profiling.get("enabled"),
+                            help="Count queries of each call and log slow calls, SIGUSR1 logs totals of each method.")
+        parser.add_argument('--no-rate-limit', action='store_false', dest='rate_limit',
+                            help="Do not throttle login and signup, for benchmarks and trusted networks.")
+        parser.add_argument('--metrics-port', type=int, default=settings.metrics.get("port"),
+                            help="Port of the /metrics http endpoint, forked servers use the ports after it. "
+                                 "0 turns it off.")
+
+    @staticmethod
+    def get_server_options(**kwargs):
+        options = dict(settings.grpc_server_options)
+        options["grpc.keepalive_time_ms"] = kwargs['keepalive_time']
+        options["grpc.max_send_message_length"] = kwargs['max_message_length']
+        options["grpc.max_receive_message_length"] = kwargs['max_message_length']
+        if kwargs['processes'] > 1:
+            options["grpc.so_reuseport"] = 1
+        return list(options.items())
+
+    def get_interceptors(self):
         authenticate_validate = AuthenticateInterceptor()
         logging_interceptor = LoggingInterceptor()
-        server = grpc.server(futures.ThreadPoolExecutor(max_workers=5),
-                             interceptors=(logging_interceptor, authenticate_validate,))
+        interceptors = (MetricsInterceptor(), logging_interceptor, authenticate_validate)
+        if self.rate_limit_interceptor is not None:
+            interceptors += (self.rate_limit_interceptor,)
+        return interceptors
+
+    def get_threaded_interceptors(self):
+        # the asyncio server releases connections on its executor instead
+        interceptors = self.get_interceptors() + (DatabaseConnectionInterceptor(),)
+        if self.profiler is not None:
+            interceptors += (ProfilingInterceptor(self.profiler),)
+        return interceptors
+
+    def start_profiler(self, **options):
+        if not options['profile']:
+            return None
+        profiler = profiling.Profiler(**settings.profiling)
+
+        def dump(signum, frame):
+            profiling.logger.info("calls of pid %s:\n%s", os.getpid(), profiler.dump())
+
+        signal.signal(signal.SIGUSR1, dump)
+        self.stdout.write("Profiling calls, send SIGUSR1 to pid {} for totals".format(os.getpid()))
+        return profiler
+
+    @contextmanager
+    def serve_forever(self, **kwargs):
+        server = grpc.server(futures.ThreadPoolExecutor(max_workers=kwargs['workers']),
+                             interceptors=self.get_threaded_interceptors(),
+                             options=self.get_server_options(**kwargs),
+                             maximum_concurrent_rpcs=kwargs['max_concurrent_rpcs'])
 
         rpc.add_ServerApiServicer_to_server(services.ServerApi(), server)
-        server.add_insecure_port("localhost:{}".format(8585))
+        server.add_insecure_port("{}:{}".format(kwargs['host'], kwargs['port']))
         server.start()
-        yield
-        server.stop(0)
+        try:
+            yield
+        finally:
+            server.stop(0)
+
+    def run_async_server(self, **options):
+        # grpc.aio is only loaded by the servers that use it
+        from microservice import async_services
+
+        executor = futures.ThreadPoolExecutor(max_workers=options['workers'])
+        self.stdout.write("Running asyncio GRPC server on {}:{} (pid {}, {} workers)".format(
+            options['host'], options['port'], os.getpid(), options['workers']))
+        try:
+            asyncio.get_event_loop().run_until_complete(async_services.serve(
+                "{}:{}".format(options['host'], options['port']), executor,
+                interceptors=self.get_interceptors(),
+                options=self.get_server_options(**options),
+                maximum_concurrent_rpcs=options['max_concurrent_rpcs']))
+        except KeyboardInterrupt:
+            pass
+        finally:
+            executor.shutdown(wait=False)
+
+    def start_metrics_server(self, **options):
+        if not options['metrics_port']:
+            return None
+        metrics.registry.register(metrics.StatsCollector(
+            "grpc_session_cache", "Decoded sessions cached by this server process.", session_cache.stats))
+        metrics.registry.register(metrics.StatsCollector(
+            "db_pool", "Database connections pooled by this server process.", pool.pool_stats, label="database"))
+        if self.rate_limit_interceptor is not None:
+            metrics.registry.register(metrics.StatsCollector(
+                "rate_limit", "Token buckets of rate limited calls.", self.rate_limit_interceptor.stats,
+                label="limiter"))
+
+        server = metrics.start_http_server(options['host'], options['metrics_port'])
+        self.stdout.write("Serving metrics on http://{}:{}/metrics".format(options['host'], options['metrics_port']))
+        return server
+
+    def run_server(self, **options):
+        # each worker thread holds at most one pooled connection
+        pool.configure(max_size=options['workers'])
+        # forked servers split the cpus of the host, so they do not each spawn a hashing process per cpu
+        passwords.configure(options['processes'])
+        # every process writes its logs, and refreshes its availability index, from threads of its own,
+        # which do not survive a fork
+        log_listener = logs.start_background_logging('microservice', settings.call_logging.get("queue_size"))
+        if availability_index.is_warm:
+            availability_index.start()
+        self.rate_limit_interceptor = RateLimitInterceptor() if options['rate_limit'] else None
+        self.profiler = self.start_profiler(**options)
+        passwords.warm()
+        metrics_server = self.start_metrics_server(**options)
+        try:
+            if options['use_async']:
+                self.run_async_server(**options)
+            else:
+                with self.serve_forever(**options):
+                    self.stdout.write("Running GRPC server on {}:{} (pid {}, {} workers)".format(
+                        options['host'], options['port'], os.getpid(), options['workers']))
+                    try:
+                        while True:
+                            time.sleep(60 * 60 * 24)
+                    except KeyboardInterrupt:
+                        pass
+        finally:
+            passwords.shutdown()
+            if metrics_server is not None:
+                metrics_server.shutdown()
+            if log_listener is not None:
+                log_listener.stop()
+        self.stdout.write("Session cache: {}".format(session_cache.stats()))
+        self.stdout.write("Database pools: {}".format(pool.pool_stats()))
+        if self.rate_limit_interceptor is not None:
+            self.stdout.write("Rate limits: {}".format(self.rate_limit_interceptor.stats()))
+
+    def fork_servers(self, **options):
+        # every child opens its own database connections and grpc server after fork
+        connections.close_all()
+        pool.close_pools()
+
+        children = []
+        for index in range(options['processes']):
+            pid = os.fork()
+            if pid == 0:
+                signal.signal(signal.SIGTERM, signal.default_int_handler)
+                if options['metrics_port']:
+                    options['metrics_port'] += index
+                try:
+                    self.run_server(**options)
+                finally:
+                    os._exit(0)
+            children.append(pid)
+
+        # forward termination to children and wait for all of them
+        def terminate(signum, frame):
+            for child in children:
+                try:
+                    os.kill(child, signal.SIGTERM)
+                except ProcessLookupError:
+                    pass
+
+        signal.signal(signal.SIGTERM, terminate)
+        for child in children:
+            while True:
+                try:
+                    os.waitpid(child, 0)
+                    break
+                except KeyboardInterrupt:
+                    terminate(signal.SIGINT, None)
+                except ChildProcessError:
+                    break
 
     def handle(self, *args, **options):
-        with self.serve_forever():
-            self.stdout.write("Running GRPC server on localhost:{}".format(8585))
-            try:
-                while True:
-                    time.sleep(60 * 60 * 24)
-            except KeyboardInterrupt:
-                pass
+        if options['profile'] and options['use_async']:
+            raise CommandError("--profile is only available for the threaded server.")
+
+        # calls take their connections from microservice.pool, from the first connection on
+        pool.use_pooled_engines()
+
+        # forked servers share the warmed index through copy-on-write memory
+        if settings.availability_index.get("warm_up"):
+            availability_index.warm()
+            self.stdout.write("Availability index is warm")
+
+        if options['processes'] > 1:
+            self.fork_servers(**options)
+        else:
+            self.run_server(**options)
@@ -1,13 +1,11 @@
+# -*- coding: utf-8 -*-
 # Generated by the protocol buffer compiler.  DO NOT EDIT!
 # source: server_api.proto
-
-import sys
-_b=sys.version_info[0]<3 and (lambda x:x) or (lambda x:x.encode('latin1'))
+"""Generated protocol buffer code."""
 from google.protobuf import descriptor as _descriptor
 from google.protobuf import message as _message
 from google.protobuf import reflection as _reflection
 from google.protobuf import symbol_database as _symbol_database
-from google.protobuf import descriptor_pb2
 # @@protoc_insertion_point(imports)
 
 _sym_db = _symbol_database.Default()
@@ -19,7 +17,9 @@ DESCRIPTOR = _descriptor.FileDescriptor(
   name='server_api.proto',
   package='MicroService',
   syntax='proto3',
-  serialized_pb=_b('\n\x10server_api.proto\x12\x0cMicroService\"\x07\n\x05\x45mpty\"\x1d\n\nResultBool\x12\x0f\n\x07success\x18\x01 \x01(\x08\"\x15\n\x05\x43hunk\x12\x0c\n\x04\x62lob\x18\x01 \x01(\x0c\"B\n\tSignupReq\x12\x10\n\x08username\x18\x01 \x01(\t\x12\r\n\x05\x65mail\x18\x03 \x01(\t\x12\x14\n\x0craw_password\x18\x06 \x01(\t\"0\n\x0eInitProfileReq\x12\x11\n\tfull_name\x18\x01 \x01(\t\x12\x0b\n\x03\x62io\x18\x03 \x01(\t\"2\n\x08LoginReq\x12\x10\n\x08username\x18\x01 \x01(\t\x12\x14\n\x0craw_password\x18\x03 \x01(\t\" \n\tLogoutReq\x12\x13\n\x0bsession_key\x18\x01 \x01(\t\"$\n\x10\x43heckUsernameReq\x12\x10\n\x08username\x18\x01 \x01(\t\"%\n\x11\x43hangeUsernameReq\x12\x10\n\x08username\x18\x01 \x01(\t\"\x1e\n\rCheckEmailReq\x12\r\n\x05\x65mail\x18\x01 \x01(\t\"2\n\x10\x43hangeProfileReq\x12\x11\n\tfull_name\x18\x03 \x01(\t\x12\x0b\n\x03\x62io\x18\x06 \x01(\t\"\x1f\n\x0e\x43hangeEmailReq\x12\r\n\x05\x65mail\x18\x01 \x01(\t\"!\n\nSignupResp\x12\x13\n\x0bsession_key\x18\x01 \x01(\t\" \n\tLoginResp\x12\x13\n\x0bsession_key\x18\x01 \x01(\t2\xc6\x06\n\tServerApi\x12\x38\n\nhey_server\x12\x13.MicroService.Empty\x1a\x13.MicroService.Empty\"\x00\x12=\n\x06signup\x12\x17.MicroService.SignupReq\x1a\x18.MicroService.SignupResp\"\x00\x12H\n\x0cinit_profile\x12\x1c.MicroService.InitProfileReq\x1a\x18.MicroService.ResultBool\"\x00\x12?\n\x0cis_logged_in\x12\x13.MicroService.Empty\x1a\x18.MicroService.ResultBool\"\x00\x12:\n\x05login\x12\x16.MicroService.LoginReq\x1a\x17.MicroService.LoginResp\"\x00\x12=\n\x06logout\x12\x17.MicroService.LogoutReq\x1a\x18.MicroService.ResultBool\"\x00\x12S\n\x15is_username_available\x12\x1e.MicroService.CheckUsernameReq\x1a\x18.MicroService.ResultBool\"\x00\x12M\n\x12is_email_available\x12\x1b.MicroService.CheckEmailReq\x1a\x18.MicroService.ResultBool\"\x00\x12L\n\x0e\x63hange_profile\x12\x1e.MicroService.ChangeProfileReq\x1a\x18.MicroService.ResultBool\"\x00\x12\x43\n\x0c\x63hange_email\x12\x1c.MicroService.ChangeEmailReq\x1a\x13.MicroService.Empty\"\x00\x12I\n\x0f\x63hange_username\x12\x1f.MicroService.ChangeUsernameReq\x1a\x13.MicroService.Empty\"\x00\x12\x38\n\x08get_file\x12\x13.MicroService.Empty\x1a\x13.MicroService.Chunk\"\x00\x30\x01\x42:\n\x1dio.grpc.trippapp.microserviceB\x11MicroServiceProtoP\x01\xa2\x02\x03\x41\x43Pb\x06proto3')
+  serialized_options=b'\n\035io.grpc.trippapp.microserviceB\021MicroServiceProtoP\001\242\002\003ACP',
+  create_key=_descriptor._internal_create_key,
+  serialized_pb=b'\n\x10server_api.proto\x12\x0cMicroService\"\x07\n\x05\x45mpty\"\x1d\n\nResultBool\x12\x0f\n\x07success\x18\x01 \x01(\x08\"\x15\n\x05\x43hunk\x12\x0c\n\x04\x62lob\x18\x01 \x01(\x0c\"/\n\x08Location\x12\x10\n\x08latitude\x18\x01 \x01(\x01\x12\x11\n\tlongitude\x18\x03 \x01(\x01\"G\n\x0b\x42oundingBox\x12\r\n\x05south\x18\x01 \x01(\x01\x12\x0c\n\x04west\x18\x03 \x01(\x01\x12\r\n\x05north\x18\x06 \x01(\x01\x12\x0c\n\x04\x65\x61st\x18\t \x01(\x01\"A\n\x0bUserSummary\x12\x0f\n\x07user_id\x18\x01 \x01(\x05\x12\x10\n\x08username\x18\x03 \x01(\t\x12\x0f\n\x07pic_url\x18\x06 \x01(\t\"<\n\x05\x43ount\x12\x11\n\tfollowers\x18\x01 \x01(\x05\x12\x11\n\tfollowing\x18\x03 \x01(\x05\x12\r\n\x05posts\x18\x06 \x01(\x05\"B\n\tSignupReq\x12\x10\n\x08username\x18\x01 \x01(\t\x12\r\n\x05\x65mail\x18\x03 \x01(\t\x12\x14\n\x0craw_password\x18\x06 \x01(\t\"0\n\x0eInitProfileReq\x12\x11\n\tfull_name\x18\x01 \x01(\t\x12\x0b\n\x03\x62io\x18\x03 \x01(\t\"2\n\x08LoginReq\x12\x10\n\x08username\x18\x01 \x01(\t\x12\x14\n\x0craw_password\x18\x03 \x01(\t\" \n\tLogoutReq\x12\x13\n\x0bsession_key\x18\x01 \x01(\t\"$\n\x10\x43heckUsernameReq\x12\x10\n\x08username\x18\x01 \x01(\t\"%\n\x11\x43hangeUsernameReq\x12\x10\n\x08username\x18\x01 \x01(\t\"\x1e\n\rCheckEmailReq\x12\r\n\x05\x65mail\x18\x01 \x01(\t\"2\n\x10\x43hangeProfileReq\x12\x11\n\tfull_name\x18\x03 \x01(\t\x12\x0b\n\x03\x62io\x18\x06 \x01(\t\"\x1f\n\x0e\x43hangeEmailReq\x12\r\n\x05\x65mail\x18\x01 \x01(\t\"\x82\x01\n\x11GetMediaNearbyReq\x12&\n\x06\x63\x65nter\x18\x01 \x01(\x0b\x32\x16.MicroService.Location\x12\x0e\n\x06radius\x18\x03 \x01(\x01\x12&\n\x03\x62ox\x18\x06 \x01(\x0b\x32\x19.MicroService.BoundingBox\x12\r\n\x05limit\x18\t \x01(\x05\"3\n\rGetMapTileReq\x12\x0c\n\x04zoom\x18\x01 \x01(\x05\x12\t\n\x01x\x18\x03 \x01(\x05\x12\t\n\x01y\x18\x06 \x01(\x05\"#\n\x0f\x43hangeAvatarReq\x12\x10\n\x08media_id\x18\x01 \x01(\x03\"A\n\nGetUserReq\x12\x0f\n\x07user_id\x18\x01 \x01(\x05\x12\x10\n\x08pic_size\x18\x03 \x01(\x05\x12\x10\n\x08pic_webp\x18\x06 \x01(\x08\"B\n\x0bGetUsersReq\x12\x0f\n\x07user_id\x18\x01 \x03(\x05\x12\x10\n\x08pic_size\x18\x03 \x01(\x05\x12\x10\n\x08pic_webp\x18\x06 \x01(\x08\"h\n\x0eGetFollowerReq\x12\x0f\n\x07user_id\x18\x01 \x01(\x05\x12\x11\n\tpage_size\x18\x03 \x01(\x05\x12\x0e\n\x06\x63ursor\x18\x06 \x01(\t\x12\x10\n\x08pic_size\x18\t \x01(\x05\x12\x10\n\x08pic_webp\x18\x0c \x01(\x08\"\xbb\x01\n\x0eUploadMediaReq\x12\x10\n\x08media_id\x18\x01 \x01(\x03\x12\x0c\n\x04name\x18\x03 \x01(\t\x12\x14\n\x0c\x63ontent_type\x18\x06 \x01(\t\x12\x0c\n\x04size\x18\t \x01(\x03\x12\x0e\n\x06sha256\x18\x0c \x01(\t\x12\x0e\n\x06offset\x18\x0f \x01(\x03\x12\x0c\n\x04\x64\x61ta\x18\x12 \x01(\x0c\x12\r\n\x05\x63rc32\x18\x15 \x01(\r\x12(\n\x08location\x18\x18 \x01(\x0b\x32\x16.MicroService.Location\"D\n\x10\x44ownloadMediaReq\x12\x10\n\x08media_id\x18\x01 \x01(\x03\x12\x0e\n\x06offset\x18\x03 \x01(\x03\x12\x0e\n\x06length\x18\x06 \x01(\x03\"R\n\nSignupResp\x12\x13\n\x0bsession_key\x18\x01 \x01(\t\x12/\n\x0cuser_summary\x18\x03 \x01(\x0b\x32\x19.MicroService.UserSummary\" \n\tLoginResp\x12\x13\n\x0bsession_key\x18\x01 \x01(\t\"\xa6\x01\n\x0bGetUserResp\x12\x0f\n\x07is_self\x18\x01 \x01(\x08\x12\x0f\n\x07user_id\x18\x03 \x01(\x05\x12\x10\n\x08username\x18\x06 \x01(\t\x12\x11\n\tfull_name\x18\t \x01(\t\x12\x0b\n\x03\x62io\x18\x0c \x01(\t\x12#\n\x06\x63ounts\x18\x0f \x01(\x0b\x32\x13.MicroService.Count\x12\r\n\x05\x66ound\x18\x12 \x01(\x08\x12\x0f\n\x07pic_url\x18\x15 \x01(\t\"8\n\x0cGetUsersResp\x12(\n\x05users\x18\x01 \x03(\x0b\x32\x19.MicroService.GetUserResp\"N\n\x0fGetFollowerResp\x12+\n\x08\x66ollower\x18\x01 \x01(\x0b\x32\x19.MicroService.UserSummary\x12\x0e\n\x06\x63ursor\x18\x03 \x01(\t\"G\n\x0fUploadMediaResp\x12\x10\n\x08media_id\x18\x01 \x01(\x03\x12\x10\n\x08received\x18\x03 \x01(\x03\x12\x10\n\x08\x63omplete\x18\x06 \x01(\x08\"W\n\nMediaChunk\x12\x0e\n\x06offset\x18\x01 \x01(\x03\x12\x0c\n\x04\x64\x61ta\x18\x03 \x01(\x0c\x12\r\n\x05\x63rc32\x18\x06 \x01(\r\x12\x0c\n\x04size\x18\t \x01(\x03\x12\x0e\n\x06sha256\x18\x0c \x01(\t\"\xe4\x01\n\rMediaLocation\x12\x10\n\x08media_id\x18\x01 \x01(\x03\x12\x10\n\x08owner_id\x18\x03 \x01(\x05\x12\x0c\n\x04name\x18\x06 \x01(\t\x12\x14\n\x0c\x63ontent_type\x18\t \x01(\t\x12\x0c\n\x04size\x18\x0c \x01(\x03\x12(\n\x08location\x18\x0f \x01(\x0b\x32\x16.MicroService.Location\x12\x10\n\x08\x64istance\x18\x12 \x01(\x01\x12\r\n\x05taken\x18\x15 \x01(\x03\x12\r\n\x05width\x18\x18 \x01(\x05\x12\x0e\n\x06height\x18\x1b \x01(\x05\x12\x13\n\x0borientation\x18\x1e \x01(\x05\"G\n\x0cMediaCluster\x12(\n\x08\x63\x65ntroid\x18\x01 \x01(\x0b\x32\x16.MicroService.Location\x12\r\n\x05\x63ount\x18\x03 \x01(\x05\"[\n\x07MapTile\x12\x0c\n\x04zoom\x18\x01 \x01(\x05\x12\t\n\x01x\x18\x03 \x01(\x05\x12\t\n\x01y\x18\x06 \x01(\x05\x12,\n\x08\x63lusters\x18\t \x03(\x0b\x32\x1a.MicroService.MediaCluster2\xfb\x0b\n\tServerApi\x12\x38\n\nhey_server\x12\x13.MicroService.Empty\x1a\x13.MicroService.Empty\"\x00\x12=\n\x06signup\x12\x17.MicroService.SignupReq\x1a\x18.MicroService.SignupResp\"\x00\x12H\n\x0cinit_profile\x12\x1c.MicroService.InitProfileReq\x1a\x18.MicroService.ResultBool\"\x00\x12?\n\x0cis_logged_in\x12\x13.MicroService.Empty\x1a\x18.MicroService.ResultBool\"\x00\x12:\n\x05login\x12\x16.MicroService.LoginReq\x1a\x17.MicroService.LoginResp\"\x00\x12=\n\x06logout\x12\x17.MicroService.LogoutReq\x1a\x18.MicroService.ResultBool\"\x00\x12S\n\x15is_username_available\x12\x1e.MicroService.CheckUsernameReq\x1a\x18.MicroService.ResultBool\"\x00\x12M\n\x12is_email_available\x12\x1b.MicroService.CheckEmailReq\x1a\x18.MicroService.ResultBool\"\x00\x12L\n\x0e\x63hange_profile\x12\x1e.MicroService.ChangeProfileReq\x1a\x18.MicroService.ResultBool\"\x00\x12\x43\n\x0c\x63hange_email\x12\x1c.MicroService.ChangeEmailReq\x1a\x13.MicroService.Empty\"\x00\x12I\n\x0f\x63hange_username\x12\x1f.MicroService.ChangeUsernameReq\x1a\x13.MicroService.Empty\"\x00\x12J\n\rchange_avatar\x12\x1d.MicroService.ChangeAvatarReq\x1a\x18.MicroService.ResultBool\"\x00\x12\x38\n\x08get_file\x12\x13.MicroService.Empty\x1a\x13.MicroService.Chunk\"\x00\x30\x01\x12\x41\n\x08get_user\x12\x18.MicroService.GetUserReq\x1a\x19.MicroService.GetUserResp\"\x00\x12\x44\n\tget_users\x12\x19.MicroService.GetUsersReq\x1a\x1a.MicroService.GetUsersResp\"\x00\x12O\n\x0cget_follower\x12\x1c.MicroService.GetFollowerReq\x1a\x1d.MicroService.GetFollowerResp\"\x00\x30\x01\x12P\n\rget_following\x12\x1c.MicroService.GetFollowerReq\x1a\x1d.MicroService.GetFollowerResp\"\x00\x30\x01\x12O\n\x0cupload_media\x12\x1c.MicroService.UploadMediaReq\x1a\x1d.MicroService.UploadMediaResp\"\x00(\x01\x12N\n\x0e\x64ownload_media\x12\x1e.MicroService.DownloadMediaReq\x1a\x18.MicroService.MediaChunk\"\x00\x30\x01\x12T\n\x10get_media_nearby\x12\x1f.MicroService.GetMediaNearbyReq\x1a\x1b.MicroService.MediaLocation\"\x00\x30\x01\x12\x44\n\x0cget_map_tile\x12\x1b.MicroService.GetMapTileReq\x1a\x15.MicroService.MapTile\"\x00\x42:\n\x1dio.grpc.trippapp.microserviceB\x11MicroServiceProtoP\x01\xa2\x02\x03\x41\x43Pb\x06proto3'
 )
 
 
@@ -31,6 +31,7 @@ _EMPTY = _descriptor.Descriptor(
   filename=None,
   file=DESCRIPTOR,
   containing_type=None,
+  create_key=_descriptor._internal_create_key,
   fields=[
   ],
   extensions=[
@@ -38,7 +39,7 @@ _EMPTY = _descriptor.Descriptor(
   nested_types=[],
   enum_types=[
   ],
-  options=None,
+  serialized_options=None,
   is_extendable=False,
   syntax='proto3',
   extension_ranges=[],
@@ -55,440 +56,1527 @@ _RESULTBOOL = _descriptor.Descriptor(
   filename=None,
   file=DESCRIPTOR,
   containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='success', full_name='MicroService.ResultBool.success', index=0,
+      number=1, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=43,
+  serialized_end=72,
+)
+
+
+_CHUNK = _descriptor.Descriptor(
+  name='Chunk',
+  full_name='MicroService.Chunk',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='blob', full_name='MicroService.Chunk.blob', index=0,
+      number=1, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=74,
+  serialized_end=95,
+)
+
+
+_LOCATION = _descriptor.Descriptor(
+  name='Location',
+  full_name='MicroService.Location',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='latitude', full_name='MicroService.Location.latitude', index=0,
+      number=1, type=1, cpp_type=5, label=1,
+      has_default_value=False, default_value=float(0),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='longitude', full_name='MicroService.Location.longitude', index=1,
+      number=3, type=1, cpp_type=5, label=1,
+      has_default_value=False, default_value=float(0),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=97,
+  serialized_end=144,
+)
+
+
+_BOUNDINGBOX = _descriptor.Descriptor(
+  name='BoundingBox',
+  full_name='MicroService.BoundingBox',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='south', full_name='MicroService.BoundingBox.south', index=0,
+      number=1, type=1, cpp_type=5, label=1,
+      has_default_value=False, default_value=float(0),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='west', full_name='MicroService.BoundingBox.west', index=1,
+      number=3, type=1, cpp_type=5, label=1,
+      has_default_value=False, default_value=float(0),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='north', full_name='MicroService.BoundingBox.north', index=2,
+      number=6, type=1, cpp_type=5, label=1,
+      has_default_value=False, default_value=float(0),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='east', full_name='MicroService.BoundingBox.east', index=3,
+      number=9, type=1, cpp_type=5, label=1,
+      has_default_value=False, default_value=float(0),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=146,
+  serialized_end=217,
+)
+
+
+_USERSUMMARY = _descriptor.Descriptor(
+  name='UserSummary',
+  full_name='MicroService.UserSummary',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='user_id', full_name='MicroService.UserSummary.user_id', index=0,
+      number=1, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='username', full_name='MicroService.UserSummary.username', index=1,
+      number=3, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='pic_url', full_name='MicroService.UserSummary.pic_url', index=2,
+      number=6, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=219,
+  serialized_end=284,
+)
+
+
+_COUNT = _descriptor.Descriptor(
+  name='Count',
+  full_name='MicroService.Count',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='followers', full_name='MicroService.Count.followers', index=0,
+      number=1, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='following', full_name='MicroService.Count.following', index=1,
+      number=3, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='posts', full_name='MicroService.Count.posts', index=2,
+      number=6, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=286,
+  serialized_end=346,
+)
+
+
+_SIGNUPREQ = _descriptor.Descriptor(
+  name='SignupReq',
+  full_name='MicroService.SignupReq',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='username', full_name='MicroService.SignupReq.username', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='email', full_name='MicroService.SignupReq.email', index=1,
+      number=3, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='raw_password', full_name='MicroService.SignupReq.raw_password', index=2,
+      number=6, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=348,
+  serialized_end=414,
+)
+
+
+_INITPROFILEREQ = _descriptor.Descriptor(
+  name='InitProfileReq',
+  full_name='MicroService.InitProfileReq',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='full_name', full_name='MicroService.InitProfileReq.full_name', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='bio', full_name='MicroService.InitProfileReq.bio', index=1,
+      number=3, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=416,
+  serialized_end=464,
+)
+
+
+_LOGINREQ = _descriptor.Descriptor(
+  name='LoginReq',
+  full_name='MicroService.LoginReq',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
   fields=[
     _descriptor.FieldDescriptor(
-      name='success', full_name='MicroService.ResultBool.success', index=0,
-      number=1, type=8, cpp_type=7, label=1,
+      name='username', full_name='MicroService.LoginReq.username', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='raw_password', full_name='MicroService.LoginReq.raw_password', index=1,
+      number=3, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=466,
+  serialized_end=516,
+)
+
+
+_LOGOUTREQ = _descriptor.Descriptor(
+  name='LogoutReq',
+  full_name='MicroService.LogoutReq',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='session_key', full_name='MicroService.LogoutReq.session_key', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=518,
+  serialized_end=550,
+)
+
+
+_CHECKUSERNAMEREQ = _descriptor.Descriptor(
+  name='CheckUsernameReq',
+  full_name='MicroService.CheckUsernameReq',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='username', full_name='MicroService.CheckUsernameReq.username', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=552,
+  serialized_end=588,
+)
+
+
+_CHANGEUSERNAMEREQ = _descriptor.Descriptor(
+  name='ChangeUsernameReq',
+  full_name='MicroService.ChangeUsernameReq',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='username', full_name='MicroService.ChangeUsernameReq.username', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=590,
+  serialized_end=627,
+)
+
+
+_CHECKEMAILREQ = _descriptor.Descriptor(
+  name='CheckEmailReq',
+  full_name='MicroService.CheckEmailReq',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='email', full_name='MicroService.CheckEmailReq.email', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=629,
+  serialized_end=659,
+)
+
+
+_CHANGEPROFILEREQ = _descriptor.Descriptor(
+  name='ChangeProfileReq',
+  full_name='MicroService.ChangeProfileReq',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='full_name', full_name='MicroService.ChangeProfileReq.full_name', index=0,
+      number=3, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='bio', full_name='MicroService.ChangeProfileReq.bio', index=1,
+      number=6, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=661,
+  serialized_end=711,
+)
+
+
+_CHANGEEMAILREQ = _descriptor.Descriptor(
+  name='ChangeEmailReq',
+  full_name='MicroService.ChangeEmailReq',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='email', full_name='MicroService.ChangeEmailReq.email', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=713,
+  serialized_end=744,
+)
+
+
+_GETMEDIANEARBYREQ = _descriptor.Descriptor(
+  name='GetMediaNearbyReq',
+  full_name='MicroService.GetMediaNearbyReq',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='center', full_name='MicroService.GetMediaNearbyReq.center', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='radius', full_name='MicroService.GetMediaNearbyReq.radius', index=1,
+      number=3, type=1, cpp_type=5, label=1,
+      has_default_value=False, default_value=float(0),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='box', full_name='MicroService.GetMediaNearbyReq.box', index=2,
+      number=6, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='limit', full_name='MicroService.GetMediaNearbyReq.limit', index=3,
+      number=9, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=747,
+  serialized_end=877,
+)
+
+
+_GETMAPTILEREQ = _descriptor.Descriptor(
+  name='GetMapTileReq',
+  full_name='MicroService.GetMapTileReq',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='zoom', full_name='MicroService.GetMapTileReq.zoom', index=0,
+      number=1, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='x', full_name='MicroService.GetMapTileReq.x', index=1,
+      number=3, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='y', full_name='MicroService.GetMapTileReq.y', index=2,
+      number=6, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=879,
+  serialized_end=930,
+)
+
+
+_CHANGEAVATARREQ = _descriptor.Descriptor(
+  name='ChangeAvatarReq',
+  full_name='MicroService.ChangeAvatarReq',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='media_id', full_name='MicroService.ChangeAvatarReq.media_id', index=0,
+      number=1, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=932,
+  serialized_end=967,
+)
+
+
+_GETUSERREQ = _descriptor.Descriptor(
+  name='GetUserReq',
+  full_name='MicroService.GetUserReq',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='user_id', full_name='MicroService.GetUserReq.user_id', index=0,
+      number=1, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='pic_size', full_name='MicroService.GetUserReq.pic_size', index=1,
+      number=3, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='pic_webp', full_name='MicroService.GetUserReq.pic_webp', index=2,
+      number=6, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=969,
+  serialized_end=1034,
+)
+
+
+_GETUSERSREQ = _descriptor.Descriptor(
+  name='GetUsersReq',
+  full_name='MicroService.GetUsersReq',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='user_id', full_name='MicroService.GetUsersReq.user_id', index=0,
+      number=1, type=5, cpp_type=1, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='pic_size', full_name='MicroService.GetUsersReq.pic_size', index=1,
+      number=3, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='pic_webp', full_name='MicroService.GetUsersReq.pic_webp', index=2,
+      number=6, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1036,
+  serialized_end=1102,
+)
+
+
+_GETFOLLOWERREQ = _descriptor.Descriptor(
+  name='GetFollowerReq',
+  full_name='MicroService.GetFollowerReq',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='user_id', full_name='MicroService.GetFollowerReq.user_id', index=0,
+      number=1, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='page_size', full_name='MicroService.GetFollowerReq.page_size', index=1,
+      number=3, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='cursor', full_name='MicroService.GetFollowerReq.cursor', index=2,
+      number=6, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='pic_size', full_name='MicroService.GetFollowerReq.pic_size', index=3,
+      number=9, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='pic_webp', full_name='MicroService.GetFollowerReq.pic_webp', index=4,
+      number=12, type=8, cpp_type=7, label=1,
       has_default_value=False, default_value=False,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
   ],
   extensions=[
   ],
   nested_types=[],
   enum_types=[
   ],
-  options=None,
+  serialized_options=None,
   is_extendable=False,
   syntax='proto3',
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=43,
-  serialized_end=72,
+  serialized_start=1104,
+  serialized_end=1208,
 )
 
 
-_CHUNK = _descriptor.Descriptor(
-  name='Chunk',
-  full_name='MicroService.Chunk',
+_UPLOADMEDIAREQ = _descriptor.Descriptor(
+  name='UploadMediaReq',
+  full_name='MicroService.UploadMediaReq',
   filename=None,
   file=DESCRIPTOR,
   containing_type=None,
+  create_key=_descriptor._internal_create_key,
   fields=[
     _descriptor.FieldDescriptor(
-      name='blob', full_name='MicroService.Chunk.blob', index=0,
-      number=1, type=12, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b(""),
+      name='media_id', full_name='MicroService.UploadMediaReq.media_id', index=0,
+      number=1, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='name', full_name='MicroService.UploadMediaReq.name', index=1,
+      number=3, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='content_type', full_name='MicroService.UploadMediaReq.content_type', index=2,
+      number=6, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='size', full_name='MicroService.UploadMediaReq.size', index=3,
+      number=9, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='sha256', full_name='MicroService.UploadMediaReq.sha256', index=4,
+      number=12, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='offset', full_name='MicroService.UploadMediaReq.offset', index=5,
+      number=15, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='data', full_name='MicroService.UploadMediaReq.data', index=6,
+      number=18, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='crc32', full_name='MicroService.UploadMediaReq.crc32', index=7,
+      number=21, type=13, cpp_type=3, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='location', full_name='MicroService.UploadMediaReq.location', index=8,
+      number=24, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
   ],
   extensions=[
   ],
   nested_types=[],
   enum_types=[
   ],
-  options=None,
+  serialized_options=None,
   is_extendable=False,
   syntax='proto3',
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=74,
-  serialized_end=95,
+  serialized_start=1211,
+  serialized_end=1398,
 )
 
 
-_SIGNUPREQ = _descriptor.Descriptor(
-  name='SignupReq',
-  full_name='MicroService.SignupReq',
+_DOWNLOADMEDIAREQ = _descriptor.Descriptor(
+  name='DownloadMediaReq',
+  full_name='MicroService.DownloadMediaReq',
   filename=None,
   file=DESCRIPTOR,
   containing_type=None,
+  create_key=_descriptor._internal_create_key,
   fields=[
     _descriptor.FieldDescriptor(
-      name='username', full_name='MicroService.SignupReq.username', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
+      name='media_id', full_name='MicroService.DownloadMediaReq.media_id', index=0,
+      number=1, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
     _descriptor.FieldDescriptor(
-      name='email', full_name='MicroService.SignupReq.email', index=1,
-      number=3, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
+      name='offset', full_name='MicroService.DownloadMediaReq.offset', index=1,
+      number=3, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
     _descriptor.FieldDescriptor(
-      name='raw_password', full_name='MicroService.SignupReq.raw_password', index=2,
-      number=6, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
+      name='length', full_name='MicroService.DownloadMediaReq.length', index=2,
+      number=6, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
   ],
   extensions=[
   ],
   nested_types=[],
   enum_types=[
   ],
-  options=None,
+  serialized_options=None,
   is_extendable=False,
   syntax='proto3',
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=97,
-  serialized_end=163,
+  serialized_start=1400,
+  serialized_end=1468,
 )
 
 
-_INITPROFILEREQ = _descriptor.Descriptor(
-  name='InitProfileReq',
-  full_name='MicroService.InitProfileReq',
+_SIGNUPRESP = _descriptor.Descriptor(
+  name='SignupResp',
+  full_name='MicroService.SignupResp',
   filename=None,
   file=DESCRIPTOR,
   containing_type=None,
+  create_key=_descriptor._internal_create_key,
   fields=[
     _descriptor.FieldDescriptor(
-      name='full_name', full_name='MicroService.InitProfileReq.full_name', index=0,
+      name='session_key', full_name='MicroService.SignupResp.session_key', index=0,
       number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
+      has_default_value=False, default_value=b"".decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
     _descriptor.FieldDescriptor(
-      name='bio', full_name='MicroService.InitProfileReq.bio', index=1,
-      number=3, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
+      name='user_summary', full_name='MicroService.SignupResp.user_summary', index=1,
+      number=3, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
   ],
   extensions=[
   ],
   nested_types=[],
   enum_types=[
   ],
-  options=None,
+  serialized_options=None,
   is_extendable=False,
   syntax='proto3',
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=165,
-  serialized_end=213,
+  serialized_start=1470,
+  serialized_end=1552,
 )
 
 
-_LOGINREQ = _descriptor.Descriptor(
-  name='LoginReq',
-  full_name='MicroService.LoginReq',
+_LOGINRESP = _descriptor.Descriptor(
+  name='LoginResp',
+  full_name='MicroService.LoginResp',
   filename=None,
   file=DESCRIPTOR,
   containing_type=None,
+  create_key=_descriptor._internal_create_key,
   fields=[
     _descriptor.FieldDescriptor(
-      name='username', full_name='MicroService.LoginReq.username', index=0,
+      name='session_key', full_name='MicroService.LoginResp.session_key', index=0,
       number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='raw_password', full_name='MicroService.LoginReq.raw_password', index=1,
-      number=3, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
+      has_default_value=False, default_value=b"".decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
   ],
   extensions=[
   ],
   nested_types=[],
   enum_types=[
   ],
-  options=None,
+  serialized_options=None,
   is_extendable=False,
   syntax='proto3',
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=215,
-  serialized_end=265,
+  serialized_start=1554,
+  serialized_end=1586,
 )
 
 
-_LOGOUTREQ = _descriptor.Descriptor(
-  name='LogoutReq',
-  full_name='MicroService.LogoutReq',
+_GETUSERRESP = _descriptor.Descriptor(
+  name='GetUserResp',
+  full_name='MicroService.GetUserResp',
   filename=None,
   file=DESCRIPTOR,
   containing_type=None,
+  create_key=_descriptor._internal_create_key,
   fields=[
     _descriptor.FieldDescriptor(
-      name='session_key', full_name='MicroService.LogoutReq.session_key', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
+      name='is_self', full_name='MicroService.GetUserResp.is_self', index=0,
+      number=1, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='user_id', full_name='MicroService.GetUserResp.user_id', index=1,
+      number=3, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='username', full_name='MicroService.GetUserResp.username', index=2,
+      number=6, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='full_name', full_name='MicroService.GetUserResp.full_name', index=3,
+      number=9, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='bio', full_name='MicroService.GetUserResp.bio', index=4,
+      number=12, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='counts', full_name='MicroService.GetUserResp.counts', index=5,
+      number=15, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='found', full_name='MicroService.GetUserResp.found', index=6,
+      number=18, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='pic_url', full_name='MicroService.GetUserResp.pic_url', index=7,
+      number=21, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
   ],
   extensions=[
   ],
   nested_types=[],
   enum_types=[
   ],
-  options=None,
+  serialized_options=None,
   is_extendable=False,
   syntax='proto3',
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=267,
-  serialized_end=299,
+  serialized_start=1589,
+  serialized_end=1755,
 )
 
 
-_CHECKUSERNAMEREQ = _descriptor.Descriptor(
-  name='CheckUsernameReq',
-  full_name='MicroService.CheckUsernameReq',
+_GETUSERSRESP = _descriptor.Descriptor(
+  name='GetUsersResp',
+  full_name='MicroService.GetUsersResp',
   filename=None,
   file=DESCRIPTOR,
   containing_type=None,
+  create_key=_descriptor._internal_create_key,
   fields=[
     _descriptor.FieldDescriptor(
-      name='username', full_name='MicroService.CheckUsernameReq.username', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
+      name='users', full_name='MicroService.GetUsersResp.users', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
   ],
   extensions=[
   ],
   nested_types=[],
   enum_types=[
   ],
-  options=None,
+  serialized_options=None,
   is_extendable=False,
   syntax='proto3',
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=301,
-  serialized_end=337,
+  serialized_start=1757,
+  serialized_end=1813,
 )
 
 
-_CHANGEUSERNAMEREQ = _descriptor.Descriptor(
-  name='ChangeUsernameReq',
-  full_name='MicroService.ChangeUsernameReq',
+_GETFOLLOWERRESP = _descriptor.Descriptor(
+  name='GetFollowerResp',
+  full_name='MicroService.GetFollowerResp',
   filename=None,
   file=DESCRIPTOR,
   containing_type=None,
+  create_key=_descriptor._internal_create_key,
   fields=[
     _descriptor.FieldDescriptor(
-      name='username', full_name='MicroService.ChangeUsernameReq.username', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
+      name='follower', full_name='MicroService.GetFollowerResp.follower', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='cursor', full_name='MicroService.GetFollowerResp.cursor', index=1,
+      number=3, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
   ],
   extensions=[
   ],
   nested_types=[],
   enum_types=[
   ],
-  options=None,
+  serialized_options=None,
   is_extendable=False,
   syntax='proto3',
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=339,
-  serialized_end=376,
+  serialized_start=1815,
+  serialized_end=1893,
 )
 
 
-_CHECKEMAILREQ = _descriptor.Descriptor(
-  name='CheckEmailReq',
-  full_name='MicroService.CheckEmailReq',
+_UPLOADMEDIARESP = _descriptor.Descriptor(
+  name='UploadMediaResp',
+  full_name='MicroService.UploadMediaResp',
   filename=None,
   file=DESCRIPTOR,
   containing_type=None,
+  create_key=_descriptor._internal_create_key,
   fields=[
     _descriptor.FieldDescriptor(
-      name='email', full_name='MicroService.CheckEmailReq.email', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
+      name='media_id', full_name='MicroService.UploadMediaResp.media_id', index=0,
+      number=1, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='received', full_name='MicroService.UploadMediaResp.received', index=1,
+      number=3, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='complete', full_name='MicroService.UploadMediaResp.complete', index=2,
+      number=6, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
   ],
   extensions=[
   ],
   nested_types=[],
   enum_types=[
   ],
-  options=None,
+  serialized_options=None,
   is_extendable=False,
   syntax='proto3',
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=378,
-  serialized_end=408,
+  serialized_start=1895,
+  serialized_end=1966,
 )
 
 
-_CHANGEPROFILEREQ = _descriptor.Descriptor(
-  name='ChangeProfileReq',
-  full_name='MicroService.ChangeProfileReq',
+_MEDIACHUNK = _descriptor.Descriptor(
+  name='MediaChunk',
+  full_name='MicroService.MediaChunk',
   filename=None,
   file=DESCRIPTOR,
   containing_type=None,
+  create_key=_descriptor._internal_create_key,
   fields=[
     _descriptor.FieldDescriptor(
-      name='full_name', full_name='MicroService.ChangeProfileReq.full_name', index=0,
-      number=3, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
+      name='offset', full_name='MicroService.MediaChunk.offset', index=0,
+      number=1, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
     _descriptor.FieldDescriptor(
-      name='bio', full_name='MicroService.ChangeProfileReq.bio', index=1,
-      number=6, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
+      name='data', full_name='MicroService.MediaChunk.data', index=1,
+      number=3, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='crc32', full_name='MicroService.MediaChunk.crc32', index=2,
+      number=6, type=13, cpp_type=3, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='size', full_name='MicroService.MediaChunk.size', index=3,
+      number=9, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='sha256', full_name='MicroService.MediaChunk.sha256', index=4,
+      number=12, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
   ],
   extensions=[
   ],
   nested_types=[],
   enum_types=[
   ],
-  options=None,
+  serialized_options=None,
   is_extendable=False,
   syntax='proto3',
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=410,
-  serialized_end=460,
+  serialized_start=1968,
+  serialized_end=2055,
 )
 
 
-_CHANGEEMAILREQ = _descriptor.Descriptor(
-  name='ChangeEmailReq',
-  full_name='MicroService.ChangeEmailReq',
+_MEDIALOCATION = _descriptor.Descriptor(
+  name='MediaLocation',
+  full_name='MicroService.MediaLocation',
   filename=None,
   file=DESCRIPTOR,
   containing_type=None,
+  create_key=_descriptor._internal_create_key,
   fields=[
     _descriptor.FieldDescriptor(
-      name='email', full_name='MicroService.ChangeEmailReq.email', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
+      name='media_id', full_name='MicroService.MediaLocation.media_id', index=0,
+      number=1, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='owner_id', full_name='MicroService.MediaLocation.owner_id', index=1,
+      number=3, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='name', full_name='MicroService.MediaLocation.name', index=2,
+      number=6, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='content_type', full_name='MicroService.MediaLocation.content_type', index=3,
+      number=9, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='size', full_name='MicroService.MediaLocation.size', index=4,
+      number=12, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='location', full_name='MicroService.MediaLocation.location', index=5,
+      number=15, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='distance', full_name='MicroService.MediaLocation.distance', index=6,
+      number=18, type=1, cpp_type=5, label=1,
+      has_default_value=False, default_value=float(0),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='taken', full_name='MicroService.MediaLocation.taken', index=7,
+      number=21, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='width', full_name='MicroService.MediaLocation.width', index=8,
+      number=24, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='height', full_name='MicroService.MediaLocation.height', index=9,
+      number=27, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='orientation', full_name='MicroService.MediaLocation.orientation', index=10,
+      number=30, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
   ],
   extensions=[
   ],
   nested_types=[],
   enum_types=[
   ],
-  options=None,
+  serialized_options=None,
   is_extendable=False,
   syntax='proto3',
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=462,
-  serialized_end=493,
+  serialized_start=2058,
+  serialized_end=2286,
 )
 
 
-_SIGNUPRESP = _descriptor.Descriptor(
-  name='SignupResp',
-  full_name='MicroService.SignupResp',
+_MEDIACLUSTER = _descriptor.Descriptor(
+  name='MediaCluster',
+  full_name='MicroService.MediaCluster',
   filename=None,
   file=DESCRIPTOR,
   containing_type=None,
+  create_key=_descriptor._internal_create_key,
   fields=[
     _descriptor.FieldDescriptor(
-      name='session_key', full_name='MicroService.SignupResp.session_key', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
+      name='centroid', full_name='MicroService.MediaCluster.centroid', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='count', full_name='MicroService.MediaCluster.count', index=1,
+      number=3, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
   ],
   extensions=[
   ],
   nested_types=[],
   enum_types=[
   ],
-  options=None,
+  serialized_options=None,
   is_extendable=False,
   syntax='proto3',
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=495,
-  serialized_end=528,
+  serialized_start=2288,
+  serialized_end=2359,
 )
 
 
-_LOGINRESP = _descriptor.Descriptor(
-  name='LoginResp',
-  full_name='MicroService.LoginResp',
+_MAPTILE = _descriptor.Descriptor(
+  name='MapTile',
+  full_name='MicroService.MapTile',
   filename=None,
   file=DESCRIPTOR,
   containing_type=None,
+  create_key=_descriptor._internal_create_key,
   fields=[
     _descriptor.FieldDescriptor(
-      name='session_key', full_name='MicroService.LoginResp.session_key', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
+      name='zoom', full_name='MicroService.MapTile.zoom', index=0,
+      number=1, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='x', full_name='MicroService.MapTile.x', index=1,
+      number=3, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='y', full_name='MicroService.MapTile.y', index=2,
+      number=6, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='clusters', full_name='MicroService.MapTile.clusters', index=3,
+      number=9, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
   ],
   extensions=[
   ],
   nested_types=[],
   enum_types=[
   ],
-  options=None,
+  serialized_options=None,
   is_extendable=False,
   syntax='proto3',
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=530,
-  serialized_end=562,
+  serialized_start=2361,
+  serialized_end=2452,
 )
 
+_GETMEDIANEARBYREQ.fields_by_name['center'].message_type = _LOCATION
+_GETMEDIANEARBYREQ.fields_by_name['box'].message_type = _BOUNDINGBOX
+_UPLOADMEDIAREQ.fields_by_name['location'].message_type = _LOCATION
+_SIGNUPRESP.fields_by_name['user_summary'].message_type = _USERSUMMARY
+_GETUSERRESP.fields_by_name['counts'].message_type = _COUNT
+_GETUSERSRESP.fields_by_name['users'].message_type = _GETUSERRESP
+_GETFOLLOWERRESP.fields_by_name['follower'].message_type = _USERSUMMARY
+_MEDIALOCATION.fields_by_name['location'].message_type = _LOCATION
+_MEDIACLUSTER.fields_by_name['centroid'].message_type = _LOCATION
+_MAPTILE.fields_by_name['clusters'].message_type = _MEDIACLUSTER
 DESCRIPTOR.message_types_by_name['Empty'] = _EMPTY
 DESCRIPTOR.message_types_by_name['ResultBool'] = _RESULTBOOL
 DESCRIPTOR.message_types_by_name['Chunk'] = _CHUNK
+DESCRIPTOR.message_types_by_name['Location'] = _LOCATION
+DESCRIPTOR.message_types_by_name['BoundingBox'] = _BOUNDINGBOX
+DESCRIPTOR.message_types_by_name['UserSummary'] = _USERSUMMARY
+DESCRIPTOR.message_types_by_name['Count'] = _COUNT
 DESCRIPTOR.message_types_by_name['SignupReq'] = _SIGNUPREQ
 DESCRIPTOR.message_types_by_name['InitProfileReq'] = _INITPROFILEREQ
 DESCRIPTOR.message_types_by_name['LoginReq'] = _LOGINREQ
@@ -498,120 +1586,276 @@ DESCRIPTOR.message_types_by_name['ChangeUsernameReq'] = _CHANGEUSERNAMEREQ
 DESCRIPTOR.message_types_by_name['CheckEmailReq'] = _CHECKEMAILREQ
 DESCRIPTOR.message_types_by_name['ChangeProfileReq'] = _CHANGEPROFILEREQ
 DESCRIPTOR.message_types_by_name['ChangeEmailReq'] = _CHANGEEMAILREQ
+DESCRIPTOR.message_types_by_name['GetMediaNearbyReq'] = _GETMEDIANEARBYREQ
+DESCRIPTOR.message_types_by_name['GetMapTileReq'] = _GETMAPTILEREQ
+DESCRIPTOR.message_types_by_name['ChangeAvatarReq'] = _CHANGEAVATARREQ
+DESCRIPTOR.message_types_by_name['GetUserReq'] = _GETUSERREQ
+DESCRIPTOR.message_types_by_name['GetUsersReq'] = _GETUSERSREQ
+DESCRIPTOR.message_types_by_name['GetFollowerReq'] = _GETFOLLOWERREQ
+DESCRIPTOR.message_types_by_name['UploadMediaReq'] = _UPLOADMEDIAREQ
+DESCRIPTOR.message_types_by_name['DownloadMediaReq'] = _DOWNLOADMEDIAREQ
 DESCRIPTOR.message_types_by_name['SignupResp'] = _SIGNUPRESP
 DESCRIPTOR.message_types_by_name['LoginResp'] = _LOGINRESP
+DESCRIPTOR.message_types_by_name['GetUserResp'] = _GETUSERRESP
+DESCRIPTOR.message_types_by_name['GetUsersResp'] = _GETUSERSRESP
+DESCRIPTOR.message_types_by_name['GetFollowerResp'] = _GETFOLLOWERRESP
+DESCRIPTOR.message_types_by_name['UploadMediaResp'] = _UPLOADMEDIARESP
+DESCRIPTOR.message_types_by_name['MediaChunk'] = _MEDIACHUNK
+DESCRIPTOR.message_types_by_name['MediaLocation'] = _MEDIALOCATION
+DESCRIPTOR.message_types_by_name['MediaCluster'] = _MEDIACLUSTER
+DESCRIPTOR.message_types_by_name['MapTile'] = _MAPTILE
 _sym_db.RegisterFileDescriptor(DESCRIPTOR)
 
-Empty = _reflection.GeneratedProtocolMessageType('Empty', (_message.Message,), dict(
-  DESCRIPTOR = _EMPTY,
-  __module__ = 'server_api_pb2'
+Empty = _reflection.GeneratedProtocolMessageType('Empty', (_message.Message,), {
+  'DESCRIPTOR' : _EMPTY,
+  '__module__' : 'server_api_pb2'
   # @@protoc_insertion_point(class_scope:MicroService.Empty)
-  ))
+  })
 _sym_db.RegisterMessage(Empty)
 
-ResultBool = _reflection.GeneratedProtocolMessageType('ResultBool', (_message.Message,), dict(
-  DESCRIPTOR = _RESULTBOOL,
-  __module__ = 'server_api_pb2'
+ResultBool = _reflection.GeneratedProtocolMessageType('ResultBool', (_message.Message,), {
+  'DESCRIPTOR' : _RESULTBOOL,
+  '__module__' : 'server_api_pb2'
   # @@protoc_insertion_point(class_scope:MicroService.ResultBool)
-  ))
+  })
 _sym_db.RegisterMessage(ResultBool)
 
-Chunk = _reflection.GeneratedProtocolMessageType('Chunk', (_message.Message,), dict(
-  DESCRIPTOR = _CHUNK,
-  __module__ = 'server_api_pb2'
+Chunk = _reflection.GeneratedProtocolMessageType('Chunk', (_message.Message,), {
+  'DESCRIPTOR' : _CHUNK,
+  '__module__' : 'server_api_pb2'
   # @@protoc_insertion_point(class_scope:MicroService.Chunk)
-  ))
+  })
 _sym_db.RegisterMessage(Chunk)
 
-SignupReq = _reflection.GeneratedProtocolMessageType('SignupReq', (_message.Message,), dict(
-  DESCRIPTOR = _SIGNUPREQ,
-  __module__ = 'server_api_pb2'
+Location = _reflection.GeneratedProtocolMessageType('Location', (_message.Message,), {
+  'DESCRIPTOR' : _LOCATION,
+  '__module__' : 'server_api_pb2'
+  # @@protoc_insertion_point(class_scope:MicroService.Location)
+  })
+_sym_db.RegisterMessage(Location)
+
+BoundingBox = _reflection.GeneratedProtocolMessageType('BoundingBox', (_message.Message,), {
+  'DESCRIPTOR' : _BOUNDINGBOX,
+  '__module__' : 'server_api_pb2'
+  # @@protoc_insertion_point(class_scope:MicroService.BoundingBox)
+  })
+_sym_db.RegisterMessage(BoundingBox)
+
+UserSummary = _reflection.GeneratedProtocolMessageType('UserSummary', (_message.Message,), {
+  'DESCRIPTOR' : _USERSUMMARY,
+  '__module__' : 'server_api_pb2'
+  # @@protoc_insertion_point(class_scope:MicroService.UserSummary)
+  })
+_sym_db.RegisterMessage(UserSummary)
+
+Count = _reflection.GeneratedProtocolMessageType('Count', (_message.Message,), {
+  'DESCRIPTOR' : _COUNT,
+  '__module__' : 'server_api_pb2'
+  # @@protoc_insertion_point(class_scope:MicroService.Count)
+  })
+_sym_db.RegisterMessage(Count)
+
+SignupReq = _reflection.GeneratedProtocolMessageType('SignupReq', (_message.Message,), {
+  'DESCRIPTOR' : _SIGNUPREQ,
+  '__module__' : 'server_api_pb2'
   # @@protoc_insertion_point(class_scope:MicroService.SignupReq)
-  ))
+  })
 _sym_db.RegisterMessage(SignupReq)
 
-InitProfileReq = _reflection.GeneratedProtocolMessageType('InitProfileReq', (_message.Message,), dict(
-  DESCRIPTOR = _INITPROFILEREQ,
-  __module__ = 'server_api_pb2'
+InitProfileReq = _reflection.GeneratedProtocolMessageType('InitProfileReq', (_message.Message,), {
+  'DESCRIPTOR' : _INITPROFILEREQ,
+  '__module__' : 'server_api_pb2'
   # @@protoc_insertion_point(class_scope:MicroService.InitProfileReq)
-  ))
+  })
 _sym_db.RegisterMessage(InitProfileReq)
 
-LoginReq = _reflection.GeneratedProtocolMessageType('LoginReq', (_message.Message,), dict(
-  DESCRIPTOR = _LOGINREQ,
-  __module__ = 'server_api_pb2'
+LoginReq = _reflection.GeneratedProtocolMessageType('LoginReq', (_message.Message,), {
+  'DESCRIPTOR' : _LOGINREQ,
+  '__module__' : 'server_api_pb2'
   # @@protoc_insertion_point(class_scope:MicroService.LoginReq)
-  ))
+  })
 _sym_db.RegisterMessage(LoginReq)
 
-LogoutReq = _reflection.GeneratedProtocolMessageType('LogoutReq', (_message.Message,), dict(
-  DESCRIPTOR = _LOGOUTREQ,
-  __module__ = 'server_api_pb2'
+LogoutReq = _reflection.GeneratedProtocolMessageType('LogoutReq', (_message.Message,), {
+  'DESCRIPTOR' : _LOGOUTREQ,
+  '__module__' : 'server_api_pb2'
   # @@protoc_insertion_point(class_scope:MicroService.LogoutReq)
-  ))
+  })
 _sym_db.RegisterMessage(LogoutReq)
 
-CheckUsernameReq = _reflection.GeneratedProtocolMessageType('CheckUsernameReq', (_message.Message,), dict(
-  DESCRIPTOR = _CHECKUSERNAMEREQ,
-  __module__ = 'server_api_pb2'
+CheckUsernameReq = _reflection.GeneratedProtocolMessageType('CheckUsernameReq', (_message.Message,), {
+  'DESCRIPTOR' : _CHECKUSERNAMEREQ,
+  '__module__' : 'server_api_pb2'
   # @@protoc_insertion_point(class_scope:MicroService.CheckUsernameReq)
-  ))
+  })
 _sym_db.RegisterMessage(CheckUsernameReq)
 
-ChangeUsernameReq = _reflection.GeneratedProtocolMessageType('ChangeUsernameReq', (_message.Message,), dict(
-  DESCRIPTOR = _CHANGEUSERNAMEREQ,
-  __module__ = 'server_api_pb2'
+ChangeUsernameReq = _reflection.GeneratedProtocolMessageType('ChangeUsernameReq', (_message.Message,), {
+  'DESCRIPTOR' : _CHANGEUSERNAMEREQ,
+  '__module__' : 'server_api_pb2'
   # @@protoc_insertion_point(class_scope:MicroService.ChangeUsernameReq)
-  ))
+  })
 _sym_db.RegisterMessage(ChangeUsernameReq)
 
-CheckEmailReq = _reflection.GeneratedProtocolMessageType('CheckEmailReq', (_message.Message,), dict(
-  DESCRIPTOR = _CHECKEMAILREQ,
-  __module__ = 'server_api_pb2'
+CheckEmailReq = _reflection.GeneratedProtocolMessageType('CheckEmailReq', (_message.Message,), {
+  'DESCRIPTOR' : _CHECKEMAILREQ,
+  '__module__' : 'server_api_pb2'
   # @@protoc_insertion_point(class_scope:MicroService.CheckEmailReq)
-  ))
+  })
 _sym_db.RegisterMessage(CheckEmailReq)
 
-ChangeProfileReq = _reflection.GeneratedProtocolMessageType('ChangeProfileReq', (_message.Message,), dict(
-  DESCRIPTOR = _CHANGEPROFILEREQ,
-  __module__ = 'server_api_pb2'
+ChangeProfileReq = _reflection.GeneratedProtocolMessageType('ChangeProfileReq', (_message.Message,), {
+  'DESCRIPTOR' : _CHANGEPROFILEREQ,
+  '__module__' : 'server_api_pb2'
   # @@protoc_insertion_point(class_scope:MicroService.ChangeProfileReq)
-  ))
+  })
 _sym_db.RegisterMessage(ChangeProfileReq)
 
-ChangeEmailReq = _reflection.GeneratedProtocolMessageType('ChangeEmailReq', (_message.Message,), dict(
-  DESCRIPTOR = _CHANGEEMAILREQ,
-  __module__ = 'server_api_pb2'
+ChangeEmailReq = _reflection.GeneratedProtocolMessageType('ChangeEmailReq', (_message.Message,), {
+  'DESCRIPTOR' : _CHANGEEMAILREQ,
+  '__module__' : 'server_api_pb2'
   # @@protoc_insertion_point(class_scope:MicroService.ChangeEmailReq)
-  ))
+  })
 _sym_db.RegisterMessage(ChangeEmailReq)
 
-SignupResp = _reflection.GeneratedProtocolMessageType('SignupResp', (_message.Message,), dict(
-  DESCRIPTOR = _SIGNUPRESP,
-  __module__ = 'server_api_pb2'
+GetMediaNearbyReq = _reflection.GeneratedProtocolMessageType('GetMediaNearbyReq', (_message.Message,), {
+  'DESCRIPTOR' : _GETMEDIANEARBYREQ,
+  '__module__' : 'server_api_pb2'
+  # @@protoc_insertion_point(class_scope:MicroService.GetMediaNearbyReq)
+  })
+_sym_db.RegisterMessage(GetMediaNearbyReq)
+
+GetMapTileReq = _reflection.GeneratedProtocolMessageType('GetMapTileReq', (_message.Message,), {
+  'DESCRIPTOR' : _GETMAPTILEREQ,
+  '__module__' : 'server_api_pb2'
+  # @@protoc_insertion_point(class_scope:MicroService.GetMapTileReq)
+  })
+_sym_db.RegisterMessage(GetMapTileReq)
+
+ChangeAvatarReq = _reflection.GeneratedProtocolMessageType('ChangeAvatarReq', (_message.Message,), {
+  'DESCRIPTOR' : _CHANGEAVATARREQ,
+  '__module__' : 'server_api_pb2'
+  # @@protoc_insertion_point(class_scope:MicroService.ChangeAvatarReq)
+  })
+_sym_db.RegisterMessage(ChangeAvatarReq)
+
+GetUserReq = _reflection.GeneratedProtocolMessageType('GetUserReq', (_message.Message,), {
+  'DESCRIPTOR' : _GETUSERREQ,
+  '__module__' : 'server_api_pb2'
+  # @@protoc_insertion_point(class_scope:MicroService.GetUserReq)
+  })
+_sym_db.RegisterMessage(GetUserReq)
+
+GetUsersReq = _reflection.GeneratedProtocolMessageType('GetUsersReq', (_message.Message,), {
+  'DESCRIPTOR' : _GETUSERSREQ,
+  '__module__' : 'server_api_pb2'
+  # @@protoc_insertion_point(class_scope:MicroService.GetUsersReq)
+  })
+_sym_db.RegisterMessage(GetUsersReq)
+
+GetFollowerReq = _reflection.GeneratedProtocolMessageType('GetFollowerReq', (_message.Message,), {
+  'DESCRIPTOR' : _GETFOLLOWERREQ,
+  '__module__' : 'server_api_pb2'
+  # @@protoc_insertion_point(class_scope:MicroService.GetFollowerReq)
+  })
+_sym_db.RegisterMessage(GetFollowerReq)
+
+UploadMediaReq = _reflection.GeneratedProtocolMessageType('UploadMediaReq', (_message.Message,), {
+  'DESCRIPTOR' : _UPLOADMEDIAREQ,
+  '__module__' : 'server_api_pb2'
+  # @@protoc_insertion_point(class_scope:MicroService.UploadMediaReq)
+  })
+_sym_db.RegisterMessage(UploadMediaReq)
+
+DownloadMediaReq = _reflection.GeneratedProtocolMessageType('DownloadMediaReq', (_message.Message,), {
+  'DESCRIPTOR' : _DOWNLOADMEDIAREQ,
+  '__module__' : 'server_api_pb2'
+  # @@protoc_insertion_point(class_scope:MicroService.DownloadMediaReq)
+  })
+_sym_db.RegisterMessage(DownloadMediaReq)
+
+SignupResp = _reflection.GeneratedProtocolMessageType('SignupResp', (_message.Message,), {
+  'DESCRIPTOR' : _SIGNUPRESP,
+  '__module__' : 'server_api_pb2'
   # @@protoc_insertion_point(class_scope:MicroService.SignupResp)
-  ))
+  })
 _sym_db.RegisterMessage(SignupResp)
 
-LoginResp = _reflection.GeneratedProtocolMessageType('LoginResp', (_message.Message,), dict(
-  DESCRIPTOR = _LOGINRESP,
-  __module__ = 'server_api_pb2'
+LoginResp = _reflection.GeneratedProtocolMessageType('LoginResp', (_message.Message,), {
+  'DESCRIPTOR' : _LOGINRESP,
+  '__module__' : 'server_api_pb2'
   # @@protoc_insertion_point(class_scope:MicroService.LoginResp)
-  ))
+  })
 _sym_db.RegisterMessage(LoginResp)
 
+GetUserResp = _reflection.GeneratedProtocolMessageType('GetUserResp', (_message.Message,), {
+  'DESCRIPTOR' : _GETUSERRESP,
+  '__module__' : 'server_api_pb2'
+  # @@protoc_insertion_point(class_scope:MicroService.GetUserResp)
+  })
+_sym_db.RegisterMessage(GetUserResp)
+
+GetUsersResp = _reflection.GeneratedProtocolMessageType('GetUsersResp', (_message.Message,), {
+  'DESCRIPTOR' : _GETUSERSRESP,
+  '__module__' : 'server_api_pb2'
+  # @@protoc_insertion_point(class_scope:MicroService.GetUsersResp)
+  })
+_sym_db.RegisterMessage(GetUsersResp)
+
+GetFollowerResp = _reflection.GeneratedProtocolMessageType('GetFollowerResp', (_message.Message,), {
+  'DESCRIPTOR' : _GETFOLLOWERRESP,
+  '__module__' : 'server_api_pb2'
+  # @@protoc_insertion_point(class_scope:MicroService.GetFollowerResp)
+  })
+_sym_db.RegisterMessage(GetFollowerResp)
+
+UploadMediaResp = _reflection.GeneratedProtocolMessageType('UploadMediaResp', (_message.Message,), {
+  'DESCRIPTOR' : _UPLOADMEDIARESP,
+  '__module__' : 'server_api_pb2'
+  # @@protoc_insertion_point(class_scope:MicroService.UploadMediaResp)
+  })
+_sym_db.RegisterMessage(UploadMediaResp)
+
+MediaChunk = _reflection.GeneratedProtocolMessageType('MediaChunk', (_message.Message,), {
+  'DESCRIPTOR' : _MEDIACHUNK,
+  '__module__' : 'server_api_pb2'
+  # @@protoc_insertion_point(class_scope:MicroService.MediaChunk)
+  })
+_sym_db.RegisterMessage(MediaChunk)
+
+MediaLocation = _reflection.GeneratedProtocolMessageType('MediaLocation', (_message.Message,), {
+  'DESCRIPTOR' : _MEDIALOCATION,
+  '__module__' : 'server_api_pb2'
+  # @@protoc_insertion_point(class_scope:MicroService.MediaLocation)
+  })
+_sym_db.RegisterMessage(MediaLocation)
+
+MediaCluster = _reflection.GeneratedProtocolMessageType('MediaCluster', (_message.Message,), {
+  'DESCRIPTOR' : _MEDIACLUSTER,
+  '__module__' : 'server_api_pb2'
+  # @@protoc_insertion_point(class_scope:MicroService.MediaCluster)
+  })
+_sym_db.RegisterMessage(MediaCluster)
 
-DESCRIPTOR.has_options = True
-DESCRIPTOR._options = _descriptor._ParseOptions(descriptor_pb2.FileOptions(), _b('\n\035io.grpc.trippapp.microserviceB\021MicroServiceProtoP\001\242\002\003ACP'))
+MapTile = _reflection.GeneratedProtocolMessageType('MapTile', (_message.Message,), {
+  'DESCRIPTOR' : _MAPTILE,
+  '__module__' : 'server_api_pb2'
+  # @@protoc_insertion_point(class_scope:MicroService.MapTile)
+  })
+_sym_db.RegisterMessage(MapTile)
+
+
+DESCRIPTOR._options = None
 
 _SERVERAPI = _descriptor.ServiceDescriptor(
   name='ServerApi',
   full_name='MicroService.ServerApi',
   file=DESCRIPTOR,
   index=0,
-  options=None,
-  serialized_start=565,
-  serialized_end=1403,
+  serialized_options=None,
+  create_key=_descriptor._internal_create_key,
+  serialized_start=2455,
+  serialized_end=3986,
   methods=[
   _descriptor.MethodDescriptor(
     name='hey_server',
@@ -620,7 +1864,8 @@ _SERVERAPI = _descriptor.ServiceDescriptor(
     containing_service=None,
     input_type=_EMPTY,
     output_type=_EMPTY,
-    options=None,
+    serialized_options=None,
+    create_key=_descriptor._internal_create_key,
   ),
   _descriptor.MethodDescriptor(
     name='signup',
@@ -629,7 +1874,8 @@ _SERVERAPI = _descriptor.ServiceDescriptor(
     containing_service=None,
     input_type=_SIGNUPREQ,
     output_type=_SIGNUPRESP,
-    options=None,
+    serialized_options=None,
+    create_key=_descriptor._internal_create_key,
   ),
   _descriptor.MethodDescriptor(
     name='init_profile',
@@ -638,7 +1884,8 @@ _SERVERAPI = _descriptor.ServiceDescriptor(
     containing_service=None,
     input_type=_INITPROFILEREQ,
     output_type=_RESULTBOOL,
-    options=None,
+    serialized_options=None,
+    create_key=_descriptor._internal_create_key,
   ),
   _descriptor.MethodDescriptor(
     name='is_logged_in',
@@ -647,7 +1894,8 @@ _SERVERAPI = _descriptor.ServiceDescriptor(
     containing_service=None,
     input_type=_EMPTY,
     output_type=_RESULTBOOL,
-    options=None,
+    serialized_options=None,
+    create_key=_descriptor._internal_create_key,
   ),
   _descriptor.MethodDescriptor(
     name='login',
@@ -656,7 +1904,8 @@ _SERVERAPI = _descriptor.ServiceDescriptor(
     containing_service=None,
     input_type=_LOGINREQ,
     output_type=_LOGINRESP,
-    options=None,
+    serialized_options=None,
+    create_key=_descriptor._internal_create_key,
   ),
   _descriptor.MethodDescriptor(
     name='logout',
@@ -665,7 +1914,8 @@ _SERVERAPI = _descriptor.ServiceDescriptor(
     containing_service=None,
     input_type=_LOGOUTREQ,
     output_type=_RESULTBOOL,
-    options=None,
+    serialized_options=None,
+    create_key=_descriptor._internal_create_key,
   ),
   _descriptor.MethodDescriptor(
     name='is_username_available',
@@ -674,7 +1924,8 @@ _SERVERAPI = _descriptor.ServiceDescriptor(
     containing_service=None,
     input_type=_CHECKUSERNAMEREQ,
     output_type=_RESULTBOOL,
-    options=None,
+    serialized_options=None,
+    create_key=_descriptor._internal_create_key,
   ),
   _descriptor.MethodDescriptor(
     name='is_email_available',
@@ -683,7 +1934,8 @@ _SERVERAPI = _descriptor.ServiceDescriptor(
     containing_service=None,
     input_type=_CHECKEMAILREQ,
     output_type=_RESULTBOOL,
-    options=None,
+    serialized_options=None,
+    create_key=_descriptor._internal_create_key,
   ),
   _descriptor.MethodDescriptor(
     name='change_profile',
@@ -692,7 +1944,8 @@ _SERVERAPI = _descriptor.ServiceDescriptor(
     containing_service=None,
     input_type=_CHANGEPROFILEREQ,
     output_type=_RESULTBOOL,
-    options=None,
+    serialized_options=None,
+    create_key=_descriptor._internal_create_key,
   ),
   _descriptor.MethodDescriptor(
     name='change_email',
@@ -701,7 +1954,8 @@ _SERVERAPI = _descriptor.ServiceDescriptor(
     containing_service=None,
     input_type=_CHANGEEMAILREQ,
     output_type=_EMPTY,
-    options=None,
+    serialized_options=None,
+    create_key=_descriptor._internal_create_key,
   ),
   _descriptor.MethodDescriptor(
     name='change_username',
@@ -710,16 +1964,108 @@ _SERVERAPI = _descriptor.ServiceDescriptor(
     containing_service=None,
     input_type=_CHANGEUSERNAMEREQ,
     output_type=_EMPTY,
-    options=None,
+    serialized_options=None,
+    create_key=_descriptor._internal_create_key,
+  ),
+  _descriptor.MethodDescriptor(
+    name='change_avatar',
+    full_name='MicroService.ServerApi.change_avatar',
+    index=11,
+    containing_service=None,
+    input_type=_CHANGEAVATARREQ,
+    output_type=_RESULTBOOL,
+    serialized_options=None,
+    create_key=_descriptor._internal_create_key,
   ),
   _descriptor.MethodDescriptor(
     name='get_file',
     full_name='MicroService.ServerApi.get_file',
-    index=11,
+    index=12,
     containing_service=None,
     input_type=_EMPTY,
     output_type=_CHUNK,
-    options=None,
+    serialized_options=None,
+    create_key=_descriptor._internal_create_key,
+  ),
+  _descriptor.MethodDescriptor(
+    name='get_user',
+    full_name='MicroService.ServerApi.get_user',
+    index=13,
+    containing_service=None,
+    input_type=_GETUSERREQ,
+    output_type=_GETUSERRESP,
+    serialized_options=None,
+    create_key=_descriptor._internal_create_key,
+  ),
+  _descriptor.MethodDescriptor(
+    name='get_users',
+    full_name='MicroService.ServerApi.get_users',
+    index=14,
+    containing_service=None,
+    input_type=_GETUSERSREQ,
+    output_type=_GETUSERSRESP,
+    serialized_options=None,
+    create_key=_descriptor._internal_create_key,
+  ),
+  _descriptor.MethodDescriptor(
+    name='get_follower',
+    full_name='MicroService.ServerApi.get_follower',
+    index=15,
+    containing_service=None,
+    input_type=_GETFOLLOWERREQ,
+    output_type=_GETFOLLOWERRESP,
+    serialized_options=None,
+    create_key=_descriptor._internal_create_key,
+  ),
+  _descriptor.MethodDescriptor(
+    name='get_following',
+    full_name='MicroService.ServerApi.get_following',
+    index=16,
+    containing_service=None,
+    input_type=_GETFOLLOWERREQ,
+    output_type=_GETFOLLOWERRESP,
+    serialized_options=None,
+    create_key=_descriptor._internal_create_key,
+  ),
+  _descriptor.MethodDescriptor(
+    name='upload_media',
+    full_name='MicroService.ServerApi.upload_media',
+    index=17,
+    containing_service=None,
+    input_type=_UPLOADMEDIAREQ,
+    output_type=_UPLOADMEDIARESP,
+    serialized_options=None,
+    create_key=_descriptor._internal_create_key,
+  ),
+  _descriptor.MethodDescriptor(
+    name='download_media',
+    full_name='MicroService.ServerApi.download_media',
+    index=18,
+    containing_service=None,
+    input_type=_DOWNLOADMEDIAREQ,
+    output_type=_MEDIACHUNK,
+    serialized_options=None,
+    create_key=_descriptor._internal_create_key,
+  ),
+  _descriptor.MethodDescriptor(
+    name='get_media_nearby',
+    full_name='MicroService.ServerApi.get_media_nearby',
+    index=19,
+    containing_service=None,
+    input_type=_GETMEDIANEARBYREQ,
+    output_type=_MEDIALOCATION,
+    serialized_options=None,
+    create_key=_descriptor._internal_create_key,
+  ),
+  _descriptor.MethodDescriptor(
+    name='get_map_tile',
+    full_name='MicroService.ServerApi.get_map_tile',
+    index=20,
+    containing_service=None,
+    input_type=_GETMAPTILEREQ,
+    output_type=_MAPTILE,
+    serialized_options=None,
+    create_key=_descriptor._internal_create_key,
   ),
 ])
 _sym_db.RegisterServiceDescriptor(_SERVERAPI)
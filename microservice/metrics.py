@@ -0,0 +1,206 @@
+"""Metrics of the gRPC server, served over http in prometheus text format."""
+
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+
+from tripmedia import settings
+
+
+def _escape(value):
+    return str(value).replace('\\', r'\\').replace('"', r'\"').replace('\n', r'\n')
+
+
+def _format_sample(name, labels, value):
+    if labels:
+        name = "{}{{{}}}".format(name, ",".join('{}="{}"'.format(label, _escape(v)) for (label, v) in labels))
+    return "{} {}".format(name, repr(float(value)) if isinstance(value, float) else value)
+
+
+class Counter:
+    """
+    Value of each combination of labels, that only goes up
+    """
+    type = 'counter'
+
+    def __init__(self, name, documentation, labels=()):
+        self.name = name
+        self.documentation = documentation
+        self.labels = labels
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, values=(), amount=1):
+        with self._lock:
+            self._values[values] = self._values.get(values, 0) + amount
+
+    def samples(self):
+        with self._lock:
+            values = list(self._values.items())
+        for (label_values, value) in values:
+            yield self.name, tuple(zip(self.labels, label_values)), value
+
+
+class Gauge(Counter):
+    """
+    Value of each combination of labels, that goes up and down
+    """
+    type = 'gauge'
+
+    def dec(self, values=(), amount=1):
+        self.inc(values, -amount)
+
+
+class Histogram:
+    """
+    Count of observed values in each bucket, with their sum, for each combination of labels
+    """
+    type = 'histogram'
+
+    def __init__(self, name, documentation, labels=(), buckets=()):
+        self.name = name
+        self.documentation = documentation
+        self.labels = labels
+        self.buckets = sorted(buckets)
+        self._values = {}  # label values -> [count of each bucket and +Inf, sum]
+        self._lock = threading.Lock()
+
+    def observe(self, amount, values=()):
+        index = bisect_left(self.buckets, amount)
+        with self._lock:
+            counts = self._values.get(values)
+            if counts is None:
+                counts = self._values[values] = [0] * (len(self.buckets) + 1) + [0]
+            counts[index] += 1
+            counts[-1] += amount
+
+    def samples(self):
+        with self._lock:
+            values = [(label_values, list(counts)) for (label_values, counts) in self._values.items()]
+        for (label_values, counts) in values:
+            labels = tuple(zip(self.labels, label_values))
+            total = 0
+            for (bound, count) in zip(self.buckets + ['+Inf'], counts):
+                total += count
+                yield self.name + '_bucket', labels + (('le', bound),), total
+            yield self.name + '_sum', labels, counts[-1]
+            yield self.name + '_count', labels, total
+
+
+class StatsCollector:
+    """
+    Gauges read from a stats() function when metrics are rendered.
+    function returns {stat: value}, or {key: {stat: value}} when label names the key
+    """
+    type = 'gauge'
+
+    def __init__(self, name, documentation, function, label=None):
+        self.name = name
+        self.documentation = documentation
+        self.function = function
+        self.label = label
+
+    def samples(self):
+        stats = self.function()
+        if self.label is None:
+            stats = {None: stats}
+        for (key, values) in stats.items():
+            labels = ((self.label, key),) if self.label else ()
+            for (stat, value) in values.items():
+                if value is not None:
+                    yield self.name, labels + (('stat', stat),), value
+
+
+class Registry:
+    def __init__(self):
+        self._metrics = []
+        self._lock = threading.Lock()
+
+    def register(self, metric):
+        with self._lock:
+            self._metrics = [m for m in self._metrics if m.name != metric.name] + [metric]
+        return metric
+
+    def render(self):
+        lines = []
+        for metric in self._metrics:
+            lines.append("# HELP {} {}".format(metric.name, metric.documentation))
+            lines.append("# TYPE {} {}".format(metric.name, metric.type))
+            lines.extend(_format_sample(*sample) for sample in metric.samples())
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
+
+calls_started = registry.register(Counter(
+    "grpc_server_started_total", "Calls started on the server.", ("grpc_method",)))
+calls_handled = registry.register(Counter(
+    "grpc_server_handled_total", "Calls completed on the server, by status code.", ("grpc_method", "grpc_code")))
+calls_in_flight = registry.register(Gauge(
+    "grpc_server_in_flight", "Calls being handled.", ("grpc_method",)))
+handling_seconds = registry.register(Histogram(
+    "grpc_server_handling_seconds", "Seconds from the start of a call until its last response is sent.",
+    ("grpc_method",), settings.metrics.get("buckets")))
+messages_received = registry.register(Counter(
+    "grpc_server_msg_received_total", "Messages received on streaming calls.", ("grpc_method",)))
+messages_sent = registry.register(Counter(
+    "grpc_server_msg_sent_total", "Messages sent on streaming calls.", ("grpc_method",)))
+queries = registry.register(Counter(
+    "grpc_server_queries_total", "Database queries of calls, counted when runservices --profile is on.",
+    ("grpc_method",)))
+query_seconds = registry.register(Counter(
+    "grpc_server_query_seconds_total",
+    "Seconds of database queries of calls, counted when runservices --profile is on.", ("grpc_method",)))
+
+
+@contextmanager
+def track_call(method, status):
+    """
+    Record a call of method while the block runs, with the status code status.code has when it ends.
+    status.fail(error) is called for an error that leaves the block
+    """
+    started = time.perf_counter()
+    calls_started.inc((method,))
+    calls_in_flight.inc((method,))
+    try:
+        yield
+    except BaseException as error:
+        status.fail(error)
+        raise
+    finally:
+        calls_in_flight.dec((method,))
+        calls_handled.inc((method, status.code.name))
+        handling_seconds.observe(time.perf_counter() - started, (method,))
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.partition('?')[0] != '/metrics':
+            self.send_error(404)
+            return
+        body = registry.render().encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # scrapes are not worth a log line
+        pass
+
+
+class _MetricsServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+def start_http_server(host, port):
+    """
+    Serve /metrics from a daemon thread, return the http server so it can be shut down
+    """
+    server = _MetricsServer((host, port), _MetricsHandler)
+    threading.Thread(target=server.serve_forever, name='metrics', daemon=True).start()
+    return server
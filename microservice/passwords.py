@@ -0,0 +1,115 @@
+"""
+Password hashing on a pool of processes.
+PBKDF2 holds the GIL for tens of milliseconds, so gRPC worker threads only wait on a future while it runs.
+"""
+
+import multiprocessing
+import os
+import threading
+from concurrent import futures
+from concurrent.futures import ProcessPoolExecutor
+from django.contrib.auth.backends import ModelBackend
+from django.contrib.auth.signals import user_login_failed
+
+from account.models import User
+from microservice import hashing
+from tripmedia import settings
+
+_executor = None
+_executor_lock = threading.Lock()
+_dummy_password = None
+_processes = None
+
+
+def create_executor(processes):
+    # spawn, since forking a process that runs grpc threads is not safe
+    return ProcessPoolExecutor(max_workers=processes,
+                               mp_context=multiprocessing.get_context('spawn'),
+                               initializer=hashing.setup,
+                               initargs=(os.environ.get('DJANGO_SETTINGS_MODULE', 'tripmedia.settings'),))
+
+
+def get_executor():
+    """
+    Process pool of this process, created on first use so forked servers each spawn their own.
+    None when hashing runs in the calling thread
+    """
+    global _executor
+    processes = _processes if _processes is not None else settings.password_hashing.get("processes")
+    if not processes:
+        return None
+    with _executor_lock:
+        if _executor is None:
+            _executor = create_executor(processes)
+        return _executor
+
+
+def configure(server_processes):
+    """
+    Size the pool of a server process so the server processes of the host share its cpus,
+    unless settings.password_hashing sets how many processes each one has
+    """
+    global _processes
+    if settings.password_hashing.get("processes") is None:
+        _processes = max(1, (os.cpu_count() or 1) // server_processes)
+
+
+def warm():
+    """
+    Start the hashing processes and hash the dummy password before the first login needs them
+    """
+    global _dummy_password
+    if _dummy_password is None:
+        _dummy_password = make_password("dummy password")
+
+
+def shutdown():
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=True)
+
+
+def _run(function, *args):
+    executor = get_executor()
+    if executor is None:
+        return function(*args)
+    future = executor.submit(function, *args)
+    try:
+        return future.result(timeout=settings.password_hashing.get("timeout"))
+    except futures.TimeoutError:
+        # a call that gave up does not keep its place in the queue
+        future.cancel()
+        raise
+
+
+def make_password(raw_password):
+    return _run(hashing.hash_password, raw_password)
+
+
+def check_password(raw_password, encoded):
+    return _run(hashing.verify_password, raw_password, encoded)
+
+
+def authenticate(username, raw_password):
+    """
+    Return the user with username and raw_password that may authenticate, or None, as ModelBackend would.
+    it stands in for django.contrib.auth.authenticate, so AUTHENTICATION_BACKENDS are not consulted,
+    but user_login_failed is sent all the same.
+    unknown usernames are hashed against a dummy password too, so response time does not tell whether they exist.
+    concurrent.futures.TimeoutError is raised when no hashing process took the password within timeout
+    """
+    user = User.objects.filter(username=User.normalize_username(username)).first()
+    if user is None:
+        warm()
+        check_password(raw_password, _dummy_password)
+    else:
+        valid, updated = check_password(raw_password, user.password)
+        if valid and updated:
+            user.password = updated
+            user.save(update_fields=['password'])
+        if valid and ModelBackend().user_can_authenticate(user):
+            return user
+    user_login_failed.send(sender=__name__, credentials={'username': username})
+    return None
@@ -0,0 +1,182 @@
+"""Database connection pool shared by worker threads of one gRPC server process."""
+
+import threading
+import time
+from collections import deque
+from django.db import connections
+
+from tripmedia import settings
+
+POOLED_ENGINES = {'django.db.backends.postgresql': 'microservice.backends.postgresql_pool'}
+
+_pools = {}
+_pools_lock = threading.Lock()
+_overrides = {}
+
+
+class PoolTimeout(Exception):
+    pass
+
+
+class ConnectionPool:
+    """
+    Bounded pool of psycopg2 connections.
+    Connections older than max_age are replaced, connections idle longer than check_after
+    are pinged before reuse, and a call waits up to timeout seconds when all connections are checked out
+    """
+
+    def __init__(self, connect, max_size, max_age, check_after, timeout):
+        self._connect = connect
+        self.max_size = max_size
+        self.max_age = max_age
+        self.check_after = check_after
+        self.timeout = timeout
+
+        self._idle = deque()  # (connection, returned_at)
+        self._created = {}  # connection -> created_at
+        self._condition = threading.Condition()
+        self.size = 0
+        self.checked_out = 0
+        self.waits = 0
+        self.timeouts = 0
+        self.reconnects = 0
+
+    def getconn(self):
+        deadline = time.monotonic() + self.timeout
+        with self._condition:
+            if not self._idle and self.size >= self.max_size:
+                self.waits += 1
+            while not self._idle and self.size >= self.max_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self.timeouts += 1
+                    raise PoolTimeout("No database connection is free after %s seconds." % self.timeout)
+                self._condition.wait(remaining)
+            if self._idle:
+                connection, returned_at = self._idle.pop()
+            else:
+                connection, returned_at = None, None
+                self.size += 1
+            self.checked_out += 1
+
+        try:
+            if connection is not None and not self._is_healthy(connection, returned_at):
+                self._discard(connection)
+                with self._condition:
+                    self.reconnects += 1
+                connection = None
+            if connection is None:
+                connection = self._connect()
+                self._created[connection] = time.monotonic()
+        except Exception:
+            with self._condition:
+                self.size -= 1
+                self.checked_out -= 1
+                self._condition.notify()
+            raise
+        return connection
+
+    def putconn(self, connection):
+        reusable = self._reset(connection)
+        with self._condition:
+            self.checked_out -= 1
+            if reusable:
+                self._idle.append((connection, time.monotonic()))
+            else:
+                self.size -= 1
+            self._condition.notify()
+        if not reusable:
+            self._discard(connection)
+
+    def close_idle(self):
+        with self._condition:
+            idle = list(self._idle)
+            self._idle.clear()
+            self.size -= len(idle)
+            self._condition.notify_all()
+        for connection, _ in idle:
+            self._discard(connection)
+
+    def stats(self):
+        with self._condition:
+            return {
+                "size": self.size,
+                "max_size": self.max_size,
+                "idle": len(self._idle),
+                "checked_out": self.checked_out,
+                "waits": self.waits,
+                "timeouts": self.timeouts,
+                "reconnects": self.reconnects,
+            }
+
+    def _is_healthy(self, connection, returned_at):
+        if connection.closed:
+            return False
+        if time.monotonic() - self._created.get(connection, 0) > self.max_age:
+            return False
+        if time.monotonic() - returned_at > self.check_after:
+            try:
+                with connection.cursor() as cursor:
+                    cursor.execute("SELECT 1")
+            except Exception:
+                return False
+        return True
+
+    def _reset(self, connection):
+        # hand back connections out of any transaction, drop the broken ones
+        from psycopg2 import extensions
+
+        if connection.closed:
+            return False
+        status = connection.get_transaction_status()
+        if status == extensions.TRANSACTION_STATUS_UNKNOWN:
+            return False
+        if status != extensions.TRANSACTION_STATUS_IDLE:
+            try:
+                connection.rollback()
+            except Exception:
+                return False
+        return time.monotonic() - self._created.get(connection, 0) <= self.max_age
+
+    def _discard(self, connection):
+        self._created.pop(connection, None)
+        try:
+            connection.close()
+        except Exception:
+            pass
+
+
+def configure(**options):
+    """
+    Override settings.db_pool for pools created after this call, runservices sizes pools to its workers
+    """
+    _overrides.update(options)
+
+
+def use_pooled_engines():
+    """
+    Give the postgres databases of this process the pooled backend, before any connection to them is opened.
+    only runservices does, other commands and the web app keep the engine of settings.DATABASES
+    """
+    for settings_dict in connections.databases.values():
+        settings_dict['ENGINE'] = POOLED_ENGINES.get(settings_dict['ENGINE'], settings_dict['ENGINE'])
+
+
+def get_pool(alias, connect=None):
+    with _pools_lock:
+        if alias not in _pools:
+            options = dict(settings.db_pool, **_overrides)
+            _pools[alias] = ConnectionPool(connect, **options)
+        return _pools[alias]
+
+
+def close_pools():
+    with _pools_lock:
+        pools = list(_pools.values())
+    for pool in pools:
+        pool.close_idle()
+
+
+def pool_stats():
+    with _pools_lock:
+        return {alias: pool.stats() for alias, pool in _pools.items()}
@@ -0,0 +1,188 @@
+"""
+Opt-in instrumentation of calls: queries and database time of each call, and reports of slow calls.
+only the threaded server can run it, since execute_wrapper and cProfile see the thread they are set on
+"""
+
+import cProfile
+import io
+import logging
+import pstats
+import random
+import re
+import sys
+import threading
+import time
+import traceback
+from collections import Counter
+from contextlib import ExitStack, contextmanager
+
+from django.db import connections
+
+from microservice import metrics
+
+logger = logging.getLogger(__name__)
+
+_literals = re.compile(r"'(?:[^']|'')*'|\b\d+\b")
+
+
+class QueryRecorder:
+    """
+    execute_wrapper that keeps sql and duration of each query
+    """
+
+    def __init__(self):
+        self.queries = []  # (sql, seconds)
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries.append((sql, time.perf_counter() - started))
+
+    @property
+    def seconds(self):
+        return sum(seconds for (sql, seconds) in self.queries)
+
+    def most_repeated(self):
+        """
+        Return the select that ran most often, literals aside, with its count. an N+1 shows up here
+        """
+        shapes = Counter(_literals.sub('?', sql) for (sql, seconds) in self.queries if sql.startswith('SELECT'))
+        return shapes.most_common(1)[0] if shapes else (None, 0)
+
+
+class _Call:
+    def __init__(self, method):
+        self.method = method
+        self.thread_id = threading.get_ident()
+        self.started = time.perf_counter()
+        self.stack = None
+
+
+class _MethodStats:
+    def __init__(self):
+        self.calls = 0
+        self.seconds = 0
+        self.max_seconds = 0
+        self.queries = 0
+        self.max_queries = 0
+        self.query_seconds = 0
+        self.slow_calls = 0
+
+
+class Profiler:
+    """
+    Count queries and time of each call, per method.
+    calls slower than slow_call seconds are logged with their queries, and with the cProfile stats
+    of the call when it was sampled by profile_rate, or else the stack it was at once it got slow
+    """
+
+    def __init__(self, slow_call, profile_rate, logged_queries, **options):
+        self.slow_call = slow_call
+        self.profile_rate = profile_rate
+        self.logged_queries = logged_queries
+        self._stats = {}
+        self._running = {}  # thread id -> _Call
+        self._lock = threading.Lock()
+        self._watchdog = None
+
+    @contextmanager
+    def profile(self, method):
+        self._start_watchdog()
+        call = _Call(method)
+        recorder = QueryRecorder()
+        profile = self._start_profile() if random.random() < self.profile_rate else None
+        with self._lock:
+            self._running[call.thread_id] = call
+        try:
+            with ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(recorder))
+                yield
+        finally:
+            if profile is not None:
+                profile.disable()
+            with self._lock:
+                self._running.pop(call.thread_id, None)
+            self._record(call, time.perf_counter() - call.started, recorder, profile)
+
+    def dump(self):
+        """
+        Return the aggregates of each method as a table, slowest methods first
+        """
+        with self._lock:
+            stats = sorted(self._stats.items(), key=lambda item: item[1].seconds, reverse=True)
+        lines = ["{:<24} {:>8} {:>10} {:>10} {:>10} {:>10} {:>10} {:>6}".format(
+            "method", "calls", "avg ms", "max ms", "queries", "max", "db ms", "slow")]
+        for (method, s) in stats:
+            lines.append("{:<24} {:>8} {:>10.1f} {:>10.1f} {:>10.1f} {:>10} {:>10.1f} {:>6}".format(
+                method, s.calls, s.seconds / s.calls * 1000, s.max_seconds * 1000, s.queries / s.calls,
+                s.max_queries, s.query_seconds / s.calls * 1000, s.slow_calls))
+        return "\n".join(lines)
+
+    def _start_profile(self):
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError:
+            # python 3.12+ runs one profiler at a time, this call goes without
+            return None
+        return profile
+
+    def _start_watchdog(self):
+        if self._watchdog is not None:
+            return
+        with self._lock:
+            if self._watchdog is None:
+                self._watchdog = threading.Thread(target=self._watch, name='profiling-watchdog', daemon=True)
+                self._watchdog.start()
+
+    def _watch(self):
+        # take the stack of each call once it gets slow, while it is still running
+        while True:
+            time.sleep(max(self.slow_call / 2, 0.05))
+            now = time.perf_counter()
+            with self._lock:
+                slow = [call for call in self._running.values()
+                        if call.stack is None and now - call.started > self.slow_call]
+            frames = sys._current_frames()
+            for call in slow:
+                frame = frames.get(call.thread_id)
+                if frame is not None:
+                    call.stack = "".join(traceback.format_stack(frame))
+
+    def _record(self, call, seconds, recorder, profile):
+        slow = seconds > self.slow_call
+        with self._lock:
+            stats = self._stats.setdefault(call.method, _MethodStats())
+            stats.calls += 1
+            stats.seconds += seconds
+            stats.max_seconds = max(stats.max_seconds, seconds)
+            stats.queries += len(recorder.queries)
+            stats.max_queries = max(stats.max_queries, len(recorder.queries))
+            stats.query_seconds += recorder.seconds
+            stats.slow_calls += slow
+        metrics.queries.inc((call.method,), len(recorder.queries))
+        metrics.query_seconds.inc((call.method,), recorder.seconds)
+        if slow:
+            self._log_slow_call(call, seconds, recorder, profile)
+
+    def _log_slow_call(self, call, seconds, recorder, profile):
+        (repeated, repeats) = recorder.most_repeated()
+        lines = ["slow call {} took {:.1f}ms, {} queries in {:.1f}ms".format(
+            call.method, seconds * 1000, len(recorder.queries), recorder.seconds * 1000)]
+        if repeats > 1:
+            lines.append("most repeated select ran {} times: {}".format(repeats, repeated))
+        for (sql, query_seconds) in recorder.queries[:self.logged_queries]:
+            lines.append("  {:8.1f}ms {}".format(query_seconds * 1000, sql))
+        if len(recorder.queries) > self.logged_queries:
+            lines.append("  ... {} more queries".format(len(recorder.queries) - self.logged_queries))
+
+        if profile is not None:
+            output = io.StringIO()
+            pstats.Stats(profile, stream=output).sort_stats('cumulative').print_stats(25)
+            lines.append(output.getvalue())
+        elif call.stack:
+            lines.append("stack once it got slow:\n" + call.stack)
+        logger.warning("\n".join(lines))
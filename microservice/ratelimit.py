@@ -0,0 +1,66 @@
+"""Token buckets that throttle calls of one key, such as a client address or a username."""
+
+import threading
+import time
+
+
+class _Shard:
+    def __init__(self):
+        self.buckets = {}  # key -> [tokens, updated_at]
+        self.lock = threading.Lock()
+        self.evicted_at = time.monotonic()
+        # counted under the lock of the shard, stats() sums them
+        self.allowed = 0
+        self.rejected = 0
+
+
+class TokenBucketLimiter:
+    """
+    Allow each key burst calls at once and rate calls per second after that.
+    keys are spread over shards with a lock each, and every shard drops its idle buckets
+    at most once per evict_every seconds. an idle bucket is full, so dropping it changes nothing
+    """
+
+    def __init__(self, rate, burst, shards=16, evict_every=60):
+        self.rate = rate
+        self.burst = burst
+        self.evict_every = evict_every
+        self._shards = [_Shard() for _ in range(shards)]
+
+    def allow(self, key, cost=1):
+        now = time.monotonic()
+        shard = self._shards[hash(key) % len(self._shards)]
+        with shard.lock:
+            if now - shard.evicted_at >= self.evict_every:
+                self._evict_idle(shard, now)
+
+            bucket = shard.buckets.get(key)
+            if bucket is None:
+                bucket = shard.buckets[key] = [self.burst, now]
+            else:
+                bucket[0] = min(self.burst, bucket[0] + (now - bucket[1]) * self.rate)
+                bucket[1] = now
+
+            if bucket[0] >= cost:
+                bucket[0] -= cost
+                shard.allowed += 1
+                return True
+            shard.rejected += 1
+            return False
+
+    def _evict_idle(self, shard, now):
+        refill_time = self.burst / self.rate
+        idle = [key for (key, (tokens, updated_at)) in shard.buckets.items() if now - updated_at >= refill_time]
+        for key in idle:
+            del shard.buckets[key]
+        shard.evicted_at = now
+
+    def __len__(self):
+        return sum(len(shard.buckets) for shard in self._shards)
+
+    def stats(self):
+        return {
+            "buckets": len(self),
+            "allowed": sum(shard.allowed for shard in self._shards),
+            "rejected": sum(shard.rejected for shard in self._shards),
+        }
@@ -1,247 +1,776 @@
 # Generated by the gRPC Python protocol compiler plugin. DO NOT EDIT!
+"""Client and server classes corresponding to protobuf-defined services."""
 import grpc
 
 from microservice.message import server_api_pb2 as server__api__pb2
 
 
 class ServerApiStub(object):
-  # missing associated documentation comment in .proto file
-  pass
-
-  def __init__(self, channel):
-    """Constructor.
-
-    Args:
-      channel: A grpc.Channel.
-    """
-    self.hey_server = channel.unary_unary(
-        '/MicroService.ServerApi/hey_server',
-        request_serializer=server__api__pb2.Empty.SerializeToString,
-        response_deserializer=server__api__pb2.Empty.FromString,
-        )
-    self.signup = channel.unary_unary(
-        '/MicroService.ServerApi/signup',
-        request_serializer=server__api__pb2.SignupReq.SerializeToString,
-        response_deserializer=server__api__pb2.SignupResp.FromString,
-        )
-    self.init_profile = channel.unary_unary(
-        '/MicroService.ServerApi/init_profile',
-        request_serializer=server__api__pb2.InitProfileReq.SerializeToString,
-        response_deserializer=server__api__pb2.ResultBool.FromString,
-        )
-    self.is_logged_in = channel.unary_unary(
-        '/MicroService.ServerApi/is_logged_in',
-        request_serializer=server__api__pb2.Empty.SerializeToString,
-        response_deserializer=server__api__pb2.ResultBool.FromString,
-        )
-    self.login = channel.unary_unary(
-        '/MicroService.ServerApi/login',
-        request_serializer=server__api__pb2.LoginReq.SerializeToString,
-        response_deserializer=server__api__pb2.LoginResp.FromString,
-        )
-    self.logout = channel.unary_unary(
-        '/MicroService.ServerApi/logout',
-        request_serializer=server__api__pb2.LogoutReq.SerializeToString,
-        response_deserializer=server__api__pb2.ResultBool.FromString,
-        )
-    self.is_username_available = channel.unary_unary(
-        '/MicroService.ServerApi/is_username_available',
-        request_serializer=server__api__pb2.CheckUsernameReq.SerializeToString,
-        response_deserializer=server__api__pb2.ResultBool.FromString,
-        )
-    self.is_email_available = channel.unary_unary(
-        '/MicroService.ServerApi/is_email_available',
-        request_serializer=server__api__pb2.CheckEmailReq.SerializeToString,
-        response_deserializer=server__api__pb2.ResultBool.FromString,
-        )
-    self.change_profile = channel.unary_unary(
-        '/MicroService.ServerApi/change_profile',
-        request_serializer=server__api__pb2.ChangeProfileReq.SerializeToString,
-        response_deserializer=server__api__pb2.ResultBool.FromString,
-        )
-    self.change_email = channel.unary_unary(
-        '/MicroService.ServerApi/change_email',
-        request_serializer=server__api__pb2.ChangeEmailReq.SerializeToString,
-        response_deserializer=server__api__pb2.Empty.FromString,
-        )
-    self.change_username = channel.unary_unary(
-        '/MicroService.ServerApi/change_username',
-        request_serializer=server__api__pb2.ChangeUsernameReq.SerializeToString,
-        response_deserializer=server__api__pb2.Empty.FromString,
-        )
-    self.get_file = channel.unary_stream(
-        '/MicroService.ServerApi/get_file',
-        request_serializer=server__api__pb2.Empty.SerializeToString,
-        response_deserializer=server__api__pb2.Chunk.FromString,
-        )
+    """Missing associated documentation comment in .proto file."""
+
+    def __init__(self, channel):
+        """Constructor.
+
+        Args:
+            channel: A grpc.Channel.
+        """
+        self.hey_server = channel.unary_unary(
+                '/MicroService.ServerApi/hey_server',
+                request_serializer=server__api__pb2.Empty.SerializeToString,
+                response_deserializer=server__api__pb2.Empty.FromString,
+                )
+        self.signup = channel.unary_unary(
+                '/MicroService.ServerApi/signup',
+                request_serializer=server__api__pb2.SignupReq.SerializeToString,
+                response_deserializer=server__api__pb2.SignupResp.FromString,
+                )
+        self.init_profile = channel.unary_unary(
+                '/MicroService.ServerApi/init_profile',
+                request_serializer=server__api__pb2.InitProfileReq.SerializeToString,
+                response_deserializer=server__api__pb2.ResultBool.FromString,
+                )
+        self.is_logged_in = channel.unary_unary(
+                '/MicroService.ServerApi/is_logged_in',
+                request_serializer=server__api__pb2.Empty.SerializeToString,
+                response_deserializer=server__api__pb2.ResultBool.FromString,
+                )
+        self.login = channel.unary_unary(
+                '/MicroService.ServerApi/login',
+                request_serializer=server__api__pb2.LoginReq.SerializeToString,
+                response_deserializer=server__api__pb2.LoginResp.FromString,
+                )
+        self.logout = channel.unary_unary(
+                '/MicroService.ServerApi/logout',
+                request_serializer=server__api__pb2.LogoutReq.SerializeToString,
+                response_deserializer=server__api__pb2.ResultBool.FromString,
+                )
+        self.is_username_available = channel.unary_unary(
+                '/MicroService.ServerApi/is_username_available',
+                request_serializer=server__api__pb2.CheckUsernameReq.SerializeToString,
+                response_deserializer=server__api__pb2.ResultBool.FromString,
+                )
+        self.is_email_available = channel.unary_unary(
+                '/MicroService.ServerApi/is_email_available',
+                request_serializer=server__api__pb2.CheckEmailReq.SerializeToString,
+                response_deserializer=server__api__pb2.ResultBool.FromString,
+                )
+        self.change_profile = channel.unary_unary(
+                '/MicroService.ServerApi/change_profile',
+                request_serializer=server__api__pb2.ChangeProfileReq.SerializeToString,
+                response_deserializer=server__api__pb2.ResultBool.FromString,
+                )
+        self.change_email = channel.unary_unary(
+                '/MicroService.ServerApi/change_email',
+                request_serializer=server__api__pb2.ChangeEmailReq.SerializeToString,
+                response_deserializer=server__api__pb2.Empty.FromString,
+                )
+        self.change_username = channel.unary_unary(
+                '/MicroService.ServerApi/change_username',
+                request_serializer=server__api__pb2.ChangeUsernameReq.SerializeToString,
+                response_deserializer=server__api__pb2.Empty.FromString,
+                )
+        self.change_avatar = channel.unary_unary(
+                '/MicroService.ServerApi/change_avatar',
+                request_serializer=server__api__pb2.ChangeAvatarReq.SerializeToString,
+                response_deserializer=server__api__pb2.ResultBool.FromString,
+                )
+        self.get_file = channel.unary_stream(
+                '/MicroService.ServerApi/get_file',
+                request_serializer=server__api__pb2.Empty.SerializeToString,
+                response_deserializer=server__api__pb2.Chunk.FromString,
+                )
+        self.get_user = channel.unary_unary(
+                '/MicroService.ServerApi/get_user',
+                request_serializer=server__api__pb2.GetUserReq.SerializeToString,
+                response_deserializer=server__api__pb2.GetUserResp.FromString,
+                )
+        self.get_users = channel.unary_unary(
+                '/MicroService.ServerApi/get_users',
+                request_serializer=server__api__pb2.GetUsersReq.SerializeToString,
+                response_deserializer=server__api__pb2.GetUsersResp.FromString,
+                )
+        self.get_follower = channel.unary_stream(
+                '/MicroService.ServerApi/get_follower',
+                request_serializer=server__api__pb2.GetFollowerReq.SerializeToString,
+                response_deserializer=server__api__pb2.GetFollowerResp.FromString,
+                )
+        self.get_following = channel.unary_stream(
+                '/MicroService.ServerApi/get_following',
+                request_serializer=server__api__pb2.GetFollowerReq.SerializeToString,
+                response_deserializer=server__api__pb2.GetFollowerResp.FromString,
+                )
+        self.upload_media = channel.stream_unary(
+                '/MicroService.ServerApi/upload_media',
+                request_serializer=server__api__pb2.UploadMediaReq.SerializeToString,
+                response_deserializer=server__api__pb2.UploadMediaResp.FromString,
+                )
+        self.download_media = channel.unary_stream(
+                '/MicroService.ServerApi/download_media',
+                request_serializer=server__api__pb2.DownloadMediaReq.SerializeToString,
+                response_deserializer=server__api__pb2.MediaChunk.FromString,
+                )
+        self.get_media_nearby = channel.unary_stream(
+                '/MicroService.ServerApi/get_media_nearby',
+                request_serializer=server__api__pb2.GetMediaNearbyReq.SerializeToString,
+                response_deserializer=server__api__pb2.MediaLocation.FromString,
+                )
+        self.get_map_tile = channel.unary_unary(
+                '/MicroService.ServerApi/get_map_tile',
+                request_serializer=server__api__pb2.GetMapTileReq.SerializeToString,
+                response_deserializer=server__api__pb2.MapTile.FromString,
+                )
 
 
 class ServerApiServicer(object):
-  # missing associated documentation comment in .proto file
-  pass
-
-  def hey_server(self, request, context):
-    """
-    Don't do anything
-    """
-    context.set_code(grpc.StatusCode.UNIMPLEMENTED)
-    context.set_details('Method not implemented!')
-    raise NotImplementedError('Method not implemented!')
-
-  def signup(self, request, context):
-    """
-    Create new user by username, email, passsword and other optional information
-    Active a new session for client to comminucate server
-    """
-    context.set_code(grpc.StatusCode.UNIMPLEMENTED)
-    context.set_details('Method not implemented!')
-    raise NotImplementedError('Method not implemented!')
-
-  def init_profile(self, request, context):
-    """
-    Set public informations like bio, full_name and other
-    """
-    context.set_code(grpc.StatusCode.UNIMPLEMENTED)
-    context.set_details('Method not implemented!')
-    raise NotImplementedError('Method not implemented!')
-
-  def is_logged_in(self, request, context):
-    """
-    Check this current session is active
-    """
-    context.set_code(grpc.StatusCode.UNIMPLEMENTED)
-    context.set_details('Method not implemented!')
-    raise NotImplementedError('Method not implemented!')
-
-  def login(self, request, context):
-    """
-    Authenticate user and active current session
-    """
-    context.set_code(grpc.StatusCode.UNIMPLEMENTED)
-    context.set_details('Method not implemented!')
-    raise NotImplementedError('Method not implemented!')
-
-  def logout(self, request, context):
-    """
-    Delete user session
-    """
-    context.set_code(grpc.StatusCode.UNIMPLEMENTED)
-    context.set_details('Method not implemented!')
-    raise NotImplementedError('Method not implemented!')
-
-  def is_username_available(self, request, context):
-    """
-    Check that the username is available
-    """
-    context.set_code(grpc.StatusCode.UNIMPLEMENTED)
-    context.set_details('Method not implemented!')
-    raise NotImplementedError('Method not implemented!')
-
-  def is_email_available(self, request, context):
-    """
-    Check that the email is valid and avaialable
-    """
-    context.set_code(grpc.StatusCode.UNIMPLEMENTED)
-    context.set_details('Method not implemented!')
-    raise NotImplementedError('Method not implemented!')
-
-  def change_profile(self, request, context):
-    """
-    Change public informations like bio, full_name and other
-    """
-    context.set_code(grpc.StatusCode.UNIMPLEMENTED)
-    context.set_details('Method not implemented!')
-    raise NotImplementedError('Method not implemented!')
-
-  def change_email(self, request, context):
-    """
-    Change and Set new email
-    Send token to confirm new email
-    """
-    context.set_code(grpc.StatusCode.UNIMPLEMENTED)
-    context.set_details('Method not implemented!')
-    raise NotImplementedError('Method not implemented!')
-
-  def change_username(self, request, context):
-    """
-    Change and Set new username
-    """
-    context.set_code(grpc.StatusCode.UNIMPLEMENTED)
-    context.set_details('Method not implemented!')
-    raise NotImplementedError('Method not implemented!')
-
-  def get_file(self, request, context):
-    """
-    Upload file test
-    """
-    context.set_code(grpc.StatusCode.UNIMPLEMENTED)
-    context.set_details('Method not implemented!')
-    raise NotImplementedError('Method not implemented!')
+    """Missing associated documentation comment in .proto file."""
+
+    def hey_server(self, request, context):
+        """
+        Don't do anything
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def signup(self, request, context):
+        """
+        Create new user by username, email, passsword and other optional information
+        Active a new session for client to comminucate server
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def init_profile(self, request, context):
+        """
+        Set public informations like bio, full_name and other
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def is_logged_in(self, request, context):
+        """
+        Check this current session is active
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def login(self, request, context):
+        """
+        Authenticate user and active current session
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def logout(self, request, context):
+        """
+        Delete user session
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def is_username_available(self, request, context):
+        """
+        Check that the username is available
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def is_email_available(self, request, context):
+        """
+        Check that the email is valid and avaialable
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def change_profile(self, request, context):
+        """
+        Change public informations like bio, full_name and other
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def change_email(self, request, context):
+        """
+        Change and Set new email
+        Send token to confirm new email
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def change_username(self, request, context):
+        """
+        Change and Set new username
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def change_avatar(self, request, context):
+        """
+        Set an uploaded trip media image as avatar of current user and render its thumbnails
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def get_file(self, request, context):
+        """
+        Upload file test
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def get_user(self, request, context):
+        """
+        Get public informations and counts of a user
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def get_users(self, request, context):
+        """
+        Get public informations and counts of many users in the requested order
+        Users that do not exist are returned with found unset
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def get_follower(self, request, context):
+        """
+        Stream followers of a user, a page of them if page_size is set
+        Each response carries cursor to continue the stream after it
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def get_following(self, request, context):
+        """
+        Stream users that current user follows, a page of them if page_size is set
+        Each response carries cursor to continue the stream after it
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def upload_media(self, request_iterator, context):
+        """
+        Store a trip media file sent in chunks, the first message starts a new upload or names one to resume
+        Response tells how many bytes are stored, an interrupted upload is resumed from there
+        A stream with no data only asks how many bytes of media_id are stored
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def download_media(self, request, context):
+        """
+        Stream a stored trip media file in chunks, from offset to resume an interrupted download
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def get_media_nearby(self, request, context):
+        """
+        Stream geotagged trip media within radius meters of center, or inside box, nearest to the center first
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def get_map_tile(self, request, context):
+        """
+        Get clusters of geotagged trip media inside a web mercator tile, with their centroids and counts
+        Tiles past the deepest clustered zoom are refused, get_media_nearby lists their media instead
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
 
 
 def add_ServerApiServicer_to_server(servicer, server):
-  rpc_method_handlers = {
-      'hey_server': grpc.unary_unary_rpc_method_handler(
-          servicer.hey_server,
-          request_deserializer=server__api__pb2.Empty.FromString,
-          response_serializer=server__api__pb2.Empty.SerializeToString,
-      ),
-      'signup': grpc.unary_unary_rpc_method_handler(
-          servicer.signup,
-          request_deserializer=server__api__pb2.SignupReq.FromString,
-          response_serializer=server__api__pb2.SignupResp.SerializeToString,
-      ),
-      'init_profile': grpc.unary_unary_rpc_method_handler(
-          servicer.init_profile,
-          request_deserializer=server__api__pb2.InitProfileReq.FromString,
-          response_serializer=server__api__pb2.ResultBool.SerializeToString,
-      ),
-      'is_logged_in': grpc.unary_unary_rpc_method_handler(
-          servicer.is_logged_in,
-          request_deserializer=server__api__pb2.Empty.FromString,
-          response_serializer=server__api__pb2.ResultBool.SerializeToString,
-      ),
-      'login': grpc.unary_unary_rpc_method_handler(
-          servicer.login,
-          request_deserializer=server__api__pb2.LoginReq.FromString,
-          response_serializer=server__api__pb2.LoginResp.SerializeToString,
-      ),
-      'logout': grpc.unary_unary_rpc_method_handler(
-          servicer.logout,
-          request_deserializer=server__api__pb2.LogoutReq.FromString,
-          response_serializer=server__api__pb2.ResultBool.SerializeToString,
-      ),
-      'is_username_available': grpc.unary_unary_rpc_method_handler(
-          servicer.is_username_available,
-          request_deserializer=server__api__pb2.CheckUsernameReq.FromString,
-          response_serializer=server__api__pb2.ResultBool.SerializeToString,
-      ),
-      'is_email_available': grpc.unary_unary_rpc_method_handler(
-          servicer.is_email_available,
-          request_deserializer=server__api__pb2.CheckEmailReq.FromString,
-          response_serializer=server__api__pb2.ResultBool.SerializeToString,
-      ),
-      'change_profile': grpc.unary_unary_rpc_method_handler(
-          servicer.change_profile,
-          request_deserializer=server__api__pb2.ChangeProfileReq.FromString,
-          response_serializer=server__api__pb2.ResultBool.SerializeToString,
-      ),
-      'change_email': grpc.unary_unary_rpc_method_handler(
-          servicer.change_email,
-          request_deserializer=server__api__pb2.ChangeEmailReq.FromString,
-          response_serializer=server__api__pb2.Empty.SerializeToString,
-      ),
-      'change_username': grpc.unary_unary_rpc_method_handler(
-          servicer.change_username,
-          request_deserializer=server__api__pb2.ChangeUsernameReq.FromString,
-          response_serializer=server__api__pb2.Empty.SerializeToString,
-      ),
-      'get_file': grpc.unary_stream_rpc_method_handler(
-          servicer.get_file,
-          request_deserializer=server__api__pb2.Empty.FromString,
-          response_serializer=server__api__pb2.Chunk.SerializeToString,
-      ),
-  }
-  generic_handler = grpc.method_handlers_generic_handler(
-      'MicroService.ServerApi', rpc_method_handlers)
-  server.add_generic_rpc_handlers((generic_handler,))
+    rpc_method_handlers = {
+            'hey_server': grpc.unary_unary_rpc_method_handler(
+                    servicer.hey_server,
+                    request_deserializer=server__api__pb2.Empty.FromString,
+                    response_serializer=server__api__pb2.Empty.SerializeToString,
+            ),
+            'signup': grpc.unary_unary_rpc_method_handler(
+                    servicer.signup,
+                    request_deserializer=server__api__pb2.SignupReq.FromString,
+                    response_serializer=server__api__pb2.SignupResp.SerializeToString,
+            ),
+            'init_profile': grpc.unary_unary_rpc_method_handler(
+                    servicer.init_profile,
+                    request_deserializer=server__api__pb2.InitProfileReq.FromString,
+                    response_serializer=server__api__pb2.ResultBool.SerializeToString,
+            ),
+            'is_logged_in': grpc.unary_unary_rpc_method_handler(
+                    servicer.is_logged_in,
+                    request_deserializer=server__api__pb2.Empty.FromString,
+                    response_serializer=server__api__pb2.ResultBool.SerializeToString,
+            ),
+            'login': grpc.unary_unary_rpc_method_handler(
+                    servicer.login,
+                    request_deserializer=server__api__pb2.LoginReq.FromString,
+                    response_serializer=server__api__pb2.LoginResp.SerializeToString,
+            ),
+            'logout': grpc.unary_unary_rpc_method_handler(
+                    servicer.logout,
+                    request_deserializer=server__api__pb2.LogoutReq.FromString,
+                    response_serializer=server__api__pb2.ResultBool.SerializeToString,
+            ),
+            'is_username_available': grpc.unary_unary_rpc_method_handler(
+                    servicer.is_username_available,
+                    request_deserializer=server__api__pb2.CheckUsernameReq.FromString,
+                    response_serializer=server__api__pb2.ResultBool.SerializeToString,
+            ),
+            'is_email_available': grpc.unary_unary_rpc_method_handler(
+                    servicer.is_email_available,
+                    request_deserializer=server__api__pb2.CheckEmailReq.FromString,
+                    response_serializer=server__api__pb2.ResultBool.SerializeToString,
+            ),
+            'change_profile': grpc.unary_unary_rpc_method_handler(
+                    servicer.change_profile,
+                    request_deserializer=server__api__pb2.ChangeProfileReq.FromString,
+                    response_serializer=server__api__pb2.ResultBool.SerializeToString,
+            ),
+            'change_email': grpc.unary_unary_rpc_method_handler(
+                    servicer.change_email,
+                    request_deserializer=server__api__pb2.ChangeEmailReq.FromString,
+                    response_serializer=server__api__pb2.Empty.SerializeToString,
+            ),
+            'change_username': grpc.unary_unary_rpc_method_handler(
+                    servicer.change_username,
+                    request_deserializer=server__api__pb2.ChangeUsernameReq.FromString,
+                    response_serializer=server__api__pb2.Empty.SerializeToString,
+            ),
+            'change_avatar': grpc.unary_unary_rpc_method_handler(
+                    servicer.change_avatar,
+                    request_deserializer=server__api__pb2.ChangeAvatarReq.FromString,
+                    response_serializer=server__api__pb2.ResultBool.SerializeToString,
+            ),
+            'get_file': grpc.unary_stream_rpc_method_handler(
+                    servicer.get_file,
+                    request_deserializer=server__api__pb2.Empty.FromString,
+                    response_serializer=server__api__pb2.Chunk.SerializeToString,
+            ),
+            'get_user': grpc.unary_unary_rpc_method_handler(
+                    servicer.get_user,
+                    request_deserializer=server__api__pb2.GetUserReq.FromString,
+                    response_serializer=server__api__pb2.GetUserResp.SerializeToString,
+            ),
+            'get_users': grpc.unary_unary_rpc_method_handler(
+                    servicer.get_users,
+                    request_deserializer=server__api__pb2.GetUsersReq.FromString,
+                    response_serializer=server__api__pb2.GetUsersResp.SerializeToString,
+            ),
+            'get_follower': grpc.unary_stream_rpc_method_handler(
+                    servicer.get_follower,
+                    request_deserializer=server__api__pb2.GetFollowerReq.FromString,
+                    response_serializer=server__api__pb2.GetFollowerResp.SerializeToString,
+            ),
+            'get_following': grpc.unary_stream_rpc_method_handler(
+                    servicer.get_following,
+                    request_deserializer=server__api__pb2.GetFollowerReq.FromString,
+                    response_serializer=server__api__pb2.GetFollowerResp.SerializeToString,
+            ),
+            'upload_media': grpc.stream_unary_rpc_method_handler(
+                    servicer.upload_media,
+                    request_deserializer=server__api__pb2.UploadMediaReq.FromString,
+                    response_serializer=server__api__pb2.UploadMediaResp.SerializeToString,
+            ),
+            'download_media': grpc.unary_stream_rpc_method_handler(
+                    servicer.download_media,
+                    request_deserializer=server__api__pb2.DownloadMediaReq.FromString,
+                    response_serializer=server__api__pb2.MediaChunk.SerializeToString,
+            ),
+            'get_media_nearby': grpc.unary_stream_rpc_method_handler(
+                    servicer.get_media_nearby,
+                    request_deserializer=server__api__pb2.GetMediaNearbyReq.FromString,
+                    response_serializer=server__api__pb2.MediaLocation.SerializeToString,
+            ),
+            'get_map_tile': grpc.unary_unary_rpc_method_handler(
+                    servicer.get_map_tile,
+                    request_deserializer=server__api__pb2.GetMapTileReq.FromString,
+                    response_serializer=server__api__pb2.MapTile.SerializeToString,
+            ),
+    }
+    generic_handler = grpc.method_handlers_generic_handler(
+            'MicroService.ServerApi', rpc_method_handlers)
+    server.add_generic_rpc_handlers((generic_handler,))
+
+
+ # This class is part of an EXPERIMENTAL API.
+class ServerApi(object):
+    """Missing associated documentation comment in .proto file."""
+
+    @staticmethod
+    def hey_server(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/MicroService.ServerApi/hey_server',
+            server__api__pb2.Empty.SerializeToString,
+            server__api__pb2.Empty.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def signup(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/MicroService.ServerApi/signup',
+            server__api__pb2.SignupReq.SerializeToString,
+            server__api__pb2.SignupResp.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def init_profile(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/MicroService.ServerApi/init_profile',
+            server__api__pb2.InitProfileReq.SerializeToString,
+            server__api__pb2.ResultBool.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def is_logged_in(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/MicroService.ServerApi/is_logged_in',
+            server__api__pb2.Empty.SerializeToString,
+            server__api__pb2.ResultBool.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def login(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/MicroService.ServerApi/login',
+            server__api__pb2.LoginReq.SerializeToString,
+            server__api__pb2.LoginResp.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def logout(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/MicroService.ServerApi/logout',
+            server__api__pb2.LogoutReq.SerializeToString,
+            server__api__pb2.ResultBool.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def is_username_available(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/MicroService.ServerApi/is_username_available',
+            server__api__pb2.CheckUsernameReq.SerializeToString,
+            server__api__pb2.ResultBool.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def is_email_available(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/MicroService.ServerApi/is_email_available',
+            server__api__pb2.CheckEmailReq.SerializeToString,
+            server__api__pb2.ResultBool.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def change_profile(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/MicroService.ServerApi/change_profile',
+            server__api__pb2.ChangeProfileReq.SerializeToString,
+            server__api__pb2.ResultBool.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def change_email(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/MicroService.ServerApi/change_email',
+            server__api__pb2.ChangeEmailReq.SerializeToString,
+            server__api__pb2.Empty.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def change_username(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/MicroService.ServerApi/change_username',
+            server__api__pb2.ChangeUsernameReq.SerializeToString,
+            server__api__pb2.Empty.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def change_avatar(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/MicroService.ServerApi/change_avatar',
+            server__api__pb2.ChangeAvatarReq.SerializeToString,
+            server__api__pb2.ResultBool.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def get_file(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(request, target, '/MicroService.ServerApi/get_file',
+            server__api__pb2.Empty.SerializeToString,
+            server__api__pb2.Chunk.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def get_user(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/MicroService.ServerApi/get_user',
+            server__api__pb2.GetUserReq.SerializeToString,
+            server__api__pb2.GetUserResp.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def get_users(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/MicroService.ServerApi/get_users',
+            server__api__pb2.GetUsersReq.SerializeToString,
+            server__api__pb2.GetUsersResp.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def get_follower(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(request, target, '/MicroService.ServerApi/get_follower',
+            server__api__pb2.GetFollowerReq.SerializeToString,
+            server__api__pb2.GetFollowerResp.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def get_following(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(request, target, '/MicroService.ServerApi/get_following',
+            server__api__pb2.GetFollowerReq.SerializeToString,
+            server__api__pb2.GetFollowerResp.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def upload_media(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_unary(request_iterator, target, '/MicroService.ServerApi/upload_media',
+            server__api__pb2.UploadMediaReq.SerializeToString,
+            server__api__pb2.UploadMediaResp.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def download_media(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(request, target, '/MicroService.ServerApi/download_media',
+            server__api__pb2.DownloadMediaReq.SerializeToString,
+            server__api__pb2.MediaChunk.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def get_media_nearby(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(request, target, '/MicroService.ServerApi/get_media_nearby',
+            server__api__pb2.GetMediaNearbyReq.SerializeToString,
+            server__api__pb2.MediaLocation.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def get_map_tile(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/MicroService.ServerApi/get_map_tile',
+            server__api__pb2.GetMapTileReq.SerializeToString,
+            server__api__pb2.MapTile.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
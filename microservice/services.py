@@ -1,21 +1,145 @@
+import binascii
 import grpc
 import logging
-from django.contrib.auth import authenticate
-from django.contrib.sessions.backends.db import SessionStore
-from django.contrib.sessions.models import Session
+import os
+import re
+import zlib
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from concurrent import futures
 from django.core.exceptions import ValidationError
 from django.core.validators import validate_email
+from django.db import IntegrityError, close_old_connections, transaction
+from django.db.models import Exists, OuterRef, Q
+from django.utils.dateparse import parse_datetime
 from django.utils.timezone import now
+from itertools import chain
 
-from account.models import User, UserConnection, ConnectionType
+from account.avatars import avatar_url, render_avatar
+from account.models import Profile, User, UserConnection, ConnectionType
 from account.validators import UsernameValidator
+from microservice import passwords
+from microservice.auth import get_auth_context
+from microservice.availability import availability_index
+from microservice.cache import LRUCache
 from microservice.decorators import grpc_require_auth, grpc_check_user_state
+from microservice.sessions import delete_session, get_session_store
+from trip import clusters, geo
+from trip.files import ChunkWriter, FileLock, read_chunks
+from trip.models import Blob, MediaCluster, TripMedia
 from tripmedia import settings
 from .message import server_api_pb2 as msg
 from .rpc import server_api_pb2_grpc as rpc
 
 logger = logging.getLogger(__name__)
 
+_sha256_hex = re.compile(r'[0-9a-f]{64}')
+
+# map tiles of this process by (zoom, x, y), media added by other processes show up once they expire
+tile_cache = LRUCache(max_size=settings.map_tiles.get("cache_size"), ttl=settings.map_tiles.get("cache_ttl"))
+
+
+class MediaUpload:
+    """
+    Chunks of one upload_media call, written at the end of the stored part of its media while the call holds the
+    lock of its file, so two calls resuming it do not write it at once.
+    each chunk is checked by its crc32 and the whole file by its sha256 once every byte is stored, then it moves
+    into the blob store. chunks from before the end are cut to the bytes that are new, so a client may resend its
+    last chunks. every step is a call of its own, the asyncio server runs them on its workers between messages
+    """
+
+    def __init__(self, media, context):
+        self.media = media
+        self._context = context
+        self._lock = None
+        self._writer = None
+        self._chunk_size = settings.trip_media.get("chunk_size")
+
+    @property
+    def writing(self):
+        return self._writer is not None
+
+    def open(self):
+        """
+        Lock the file of media and open it for writing, there is nothing to write to complete media
+        """
+        if self.media.is_complete:
+            return self
+        path = self.media.file.path
+        lock = FileLock(path)
+        try:
+            lock.acquire()
+        except BlockingIOError:
+            self._context.abort(grpc.StatusCode.ABORTED, "Media is being uploaded by another call, resume it later.")
+        self._lock = lock
+        try:
+            # a call that held the lock before may have stored more of it, or completed it
+            self.media.refresh_from_db(fields=['file', 'received', 'completed'])
+            if self.media.is_complete:
+                # its file moved into the blob store, the lock made an empty one in its place
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+                self.close()
+                return self
+            self._writer = ChunkWriter(path, self.media.received, self._chunk_size).open()
+        except BaseException:
+            self.close()
+            raise
+        # chunks are written without the database, give the connection back for as long as it takes
+        close_old_connections()
+        return self
+
+    def write(self, request):
+        if not request.data:
+            return
+        (context, writer) = (self._context, self._writer)
+        if len(request.data) > self._chunk_size:
+            context.abort(grpc.StatusCode.INVALID_ARGUMENT, "Chunks must be at most %d bytes." % self._chunk_size)
+        if zlib.crc32(request.data) != request.crc32:
+            context.abort(grpc.StatusCode.DATA_LOSS, "Chunk at offset %d is corrupt, send it again." % request.offset)
+        if request.offset > writer.offset:
+            context.abort(grpc.StatusCode.OUT_OF_RANGE, "Upload continues at offset %d." % writer.offset)
+        data = memoryview(request.data)[writer.offset - request.offset:]
+        if writer.offset + len(data) > self.media.size:
+            context.abort(grpc.StatusCode.OUT_OF_RANGE, "Chunks go past the size of media.")
+        writer.write(data)
+
+    def save(self):
+        """
+        Store what was written, an interrupted upload keeps what reached the disk
+        """
+        if self._writer is None:
+            return
+        self._writer.sync()
+        self.media.received = self._writer.offset
+        self.media.save(update_fields=['received'])
+
+    def finish(self):
+        """
+        Complete media once all of it is stored and return the response of the call
+        """
+        media = self.media
+        if self._writer is not None and media.received == media.size:
+            if self._writer.hexdigest() != media.sha256:
+                media.received = 0
+                media.save(update_fields=['received'])
+                self._context.abort(grpc.StatusCode.DATA_LOSS, "Media does not match its sha256, upload it again.")
+            media.complete()
+        if media.is_complete and media.is_geotagged:
+            # the uploader sees the media on the map at once, on tiles of this process at least
+            for key in clusters.tiles(media.latitude, media.longitude):
+                tile_cache.delete(key)
+        return msg.UploadMediaResp(media_id=media.id, received=media.received, complete=media.is_complete)
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        if self._lock is not None:
+            self._lock.release()
+            self._lock = None
+
 
 class ServerApi(rpc.ServerApiServicer):
     username_validator = UsernameValidator()
@@ -45,12 +169,23 @@ class ServerApi(rpc.ServerApiServicer):
             context.set_details(e.message)
             return msg.SignupResp(session_key=None)
 
-        # register new user
-        user = User.objects.create_user(request.username, request.email, raw_password)
+        # register new user, unique columns stay the last word when another process took the username
+        try:
+            user = User(username=username, email=email, password=passwords.make_password(raw_password))
+            user.save(force_insert=True)
+        except futures.TimeoutError:
+            self._set_hashing_busy(context)
+            return msg.SignupResp(session_key=None)
+        except IntegrityError:
+            context.set_code(grpc.StatusCode.ALREADY_EXISTS)
+            context.set_details("Username or email is not available.")
+            return msg.SignupResp(session_key=None)
+
         if user:
+            availability_index.add(username=user.username, email=user.email)
             session_key = self._create_session(user=user)
             user_summary = msg.UserSummary(user_id=user.id, username=user.username)
-            logger.debug("Successfully user created, User:%s" % user.username)
+            logger.debug("Successfully user created, User:%s", user.username)
             return msg.SignupResp(session_key=session_key, user_summary=user_summary)
 
         return msg.SignupResp(session_key=session_key)
@@ -81,8 +216,12 @@ class ServerApi(rpc.ServerApiServicer):
         username = str.lower(request.username)
         raw_password = request.raw_password
 
-        # create new session for user
-        user = authenticate(username=username, password=raw_password)
+        # create new session for user, password is checked on the hashing processes
+        try:
+            user = passwords.authenticate(username, raw_password)
+        except futures.TimeoutError:
+            self._set_hashing_busy(context)
+            return msg.LoginResp(session_key=None)
         if user:
             session_key = self._create_session(user=user)
         else:
@@ -146,12 +285,19 @@ class ServerApi(rpc.ServerApiServicer):
         try:
             self._validate_username(username=username)
             user.username = username
-            user.save()
+            # the unique column stays the last word when another process took the username
+            with transaction.atomic():
+                user.save(update_fields=['username'])
+            availability_index.add(username=username)
             return msg.ResultBool(success=True)
 
         except ValidationError as e:
             context.set_code(e.code)
             context.set_details(e.message)
+        except IntegrityError:
+            availability_index.add(username=username)
+            context.set_code(grpc.StatusCode.ALREADY_EXISTS)
+            context.set_details("Username is not available.")
 
         return msg.ResultBool(success=False)
 
@@ -186,40 +332,181 @@ class ServerApi(rpc.ServerApiServicer):
             is_self = True
         else:
             try:
-                target = User.objects.get(pk=target_id)
+                target = User.objects.select_related('profile').get(pk=target_id)
                 is_self = False
             except User.DoesNotExist:
                 context.set_code(grpc.StatusCode.UNAVAILABLE)
                 context.set_details("User profile is not exist.")
                 return msg.GetUserResp()
 
-        # set data to response
-        username = target.username
-        full_name = target.profile.full_name
-        bio = target.profile.bio
-        # get counts
-        counts = msg.Count(followers=target.profile.count_followers(), following=target.profile.count_following(),
-                           posts=10)
-        return msg.GetUserResp(is_self=is_self, user_id=target.id, username=username, full_name=full_name,
-                               bio=bio, counts=counts)
+        return self._user_response(target, is_self, request.pic_size or settings.avatars.get("profile_size"),
+                                   request.pic_webp)
+
+    @grpc_require_auth
+    def get_users(self, request, context):
+        viewer_id = get_auth_context(context).user_id
+
+        # clean data
+        user_ids = list(request.user_id)
+        if len(user_ids) > settings.max_users_per_request:
+            context.abort(grpc.StatusCode.INVALID_ARGUMENT,
+                          "At most %d users can be requested at once." % settings.max_users_per_request)
+            return
+
+        # load all users with their profiles in one query, answer in the requested order
+        users = User.objects.select_related('profile').in_bulk(set(user_ids))
+        pic_size = request.pic_size or settings.avatars.get("profile_size")
+        return msg.GetUsersResp(users=[
+            self._user_response(users[user_id], user_id == viewer_id, pic_size, request.pic_webp) if user_id in users
+            else msg.GetUserResp(user_id=user_id, found=False)
+            for user_id in user_ids
+        ])
 
     @grpc_require_auth
     def get_follower(self, request, context):
-        user = self._get_user(context)
+        viewer_id = get_auth_context(context).user_id
         target_id = request.user_id
-        for relation in UserConnection.objects.filter(one__user_id=target_id,
-                                                      type=ConnectionType.FOLLOW.name).iterator(20):
-            yield msg.GetFollowerResp(
-                follower=msg.UserSummary(user_id=relation.user.user.id, username=relation.user.user.username))
+
+        # target who blocked the viewer hides its followers
+        if self._is_blocked(blocker_id=target_id, blocked_id=viewer_id):
+            context.abort(grpc.StatusCode.PERMISSION_DENIED, "User profile is not available.")
+            return
+
+        connections = UserConnection.objects.filter(one__user_id=target_id, type=ConnectionType.FOLLOW.name)
+        yield from self._stream_connected_users(request, context, connections, 'user', viewer_id)
 
     @grpc_require_auth
     def get_following(self, request, context):
-        user = self._get_user(context)
-        user_id = user.id
-        for relation in UserConnection.objects.filter(user_id=user_id,
-                                                      type=ConnectionType.FOLLOW.name).iterator(20):
-            yield msg.GetFollowerResp(
-                follower=msg.UserSummary(user_id=relation.user.user.id, username=relation.user.user.username))
+        user_id = get_auth_context(context).user_id
+        connections = UserConnection.objects.filter(user__user_id=user_id, type=ConnectionType.FOLLOW.name)
+        yield from self._stream_connected_users(request, context, connections, 'one', user_id)
+
+    @grpc_require_auth
+    def get_media_nearby(self, request, context):
+        viewer_id = get_auth_context(context).user_id
+
+        (center, box) = self._get_area(request, context)
+        max_results = settings.geo.get("max_results")
+        limit = request.limit if 0 < request.limit < max_results else max_results
+
+        # owners who blocked the viewer hide their media
+        blocked_by = UserConnection.objects.filter(one__user_id=viewer_id, type=ConnectionType.BLOCK.name) \
+            .values('user__user_id')
+        media = TripMedia.objects.exclude(owner_id__in=blocked_by) \
+            .values_list('id', 'owner_id', 'name', 'content_type', 'size', 'taken', 'width', 'height', 'orientation',
+                         'latitude', 'longitude')
+        # the box holds the circle, its corners are out of the radius
+        nearest = TripMedia.nearest(media, center[0], center[1], box,
+                                    radius=request.radius if request.radius > 0 else float('inf'), limit=limit,
+                                    max_cells=settings.geo.get("max_cells"),
+                                    split_rows=settings.geo.get("split_rows"))
+
+        for (distance, (media_id, owner_id, name, content_type, size, taken, width, height, orientation, latitude,
+                        longitude)) in nearest:
+            yield msg.MediaLocation(media_id=media_id, owner_id=owner_id, name=name, content_type=content_type,
+                                    size=size, location=msg.Location(latitude=latitude, longitude=longitude),
+                                    distance=distance, taken=int(taken.timestamp()) if taken else 0,
+                                    width=width or 0, height=height or 0, orientation=orientation or 0)
+
+    @grpc_require_auth
+    def get_map_tile(self, request, context):
+        # clean data
+        max_zoom = settings.map_tiles.get("max_zoom")
+        if not 0 <= request.zoom <= max_zoom:
+            context.abort(grpc.StatusCode.INVALID_ARGUMENT, "Zoom of map tiles must be 0 to %d." % max_zoom)
+            return
+        if not (0 <= request.x < 2 ** request.zoom and 0 <= request.y < 2 ** request.zoom):
+            context.abort(grpc.StatusCode.INVALID_ARGUMENT, "Tile is out of the map.")
+            return
+
+        key = (request.zoom, request.x, request.y)
+        tile = tile_cache.get(key)
+        if tile is None:
+            tile = msg.MapTile(zoom=request.zoom, x=request.x, y=request.y, clusters=[
+                msg.MediaCluster(centroid=msg.Location(latitude=latitude, longitude=longitude), count=count)
+                for (latitude, longitude, count) in MediaCluster.tile(*key)
+            ])
+            tile_cache.set(key, tile)
+        return tile
+
+    @grpc_require_auth
+    def change_avatar(self, request, context):
+        user_id = get_auth_context(context).user_id
+
+        media = TripMedia.objects.filter(pk=request.media_id, owner_id=user_id, completed__isnull=False).first()
+        if media is None:
+            context.abort(grpc.StatusCode.NOT_FOUND, "Media is not exist.")
+            return
+        if media.size > settings.avatars.get("max_source_size"):
+            context.abort(grpc.StatusCode.INVALID_ARGUMENT, "Media is too large for an avatar.")
+            return
+
+        # stored media is checked by its sha256 already, thumbnails are named by it
+        try:
+            with open(media.file.path, 'rb') as file:
+                digest = render_avatar(file, media.sha256)
+        except OSError:
+            context.abort(grpc.StatusCode.INVALID_ARGUMENT, "Media is not an image.")
+            return
+        # the avatar shares the blob of the media
+        with transaction.atomic():
+            profile = Profile.objects.select_for_update().only('id', 'pic_url').get(user_id=user_id)
+            Blob.replace(profile.pic_url.name, media.file.name, media.content_type)
+            Profile.objects.filter(pk=profile.pk).update(pic_url=media.file.name, pic_digest=digest)
+        return msg.ResultBool(success=True)
+
+    @grpc_require_auth
+    def upload_media(self, request_iterator, context):
+        first = next(request_iterator, None)
+        upload = self._open_upload(first, context)
+        try:
+            try:
+                if upload.writing:
+                    for request in chain((first,), request_iterator):
+                        upload.write(request)
+            finally:
+                upload.save()
+            return upload.finish()
+        finally:
+            upload.close()
+
+    @grpc_require_auth
+    def open_upload(self, request, context):
+        """
+        Return MediaUpload of the first request of an upload_media call, None for a call with no request.
+        the asyncio server writes the rest of the stream to it one chunk at a time
+        """
+        return self._open_upload(request, context)
+
+    @grpc_require_auth
+    def download_media(self, request, context):
+        viewer_id = get_auth_context(context).user_id
+
+        media = TripMedia.objects.filter(pk=request.media_id, completed__isnull=False).first()
+        if media is None:
+            context.abort(grpc.StatusCode.NOT_FOUND, "Media is not exist.")
+            return
+        # owner who blocked the viewer hides its media
+        if media.owner_id != viewer_id and self._is_blocked(blocker_id=media.owner_id, blocked_id=viewer_id):
+            context.abort(grpc.StatusCode.PERMISSION_DENIED, "Media is not available.")
+            return
+        if not 0 <= request.offset <= media.size:
+            context.abort(grpc.StatusCode.OUT_OF_RANGE, "Offset is past the end of media.")
+            return
+        end = media.size if request.length <= 0 else min(media.size, request.offset + request.length)
+
+        # the file is streamed without the database, give the connection back for as long as it takes
+        close_old_connections()
+        try:
+            for (offset, chunk) in read_chunks(media.file.path, request.offset, end,
+                                               settings.trip_media.get("chunk_size")):
+                data = bytes(chunk)
+                # size and sha256 come with every chunk, so a resumed download can check the whole file too
+                yield msg.MediaChunk(offset=offset, data=data, crc32=zlib.crc32(data), size=media.size,
+                                     sha256=media.sha256)
+        except (OSError, EOFError):
+            logger.exception("Stored file of media %d is not readable", media.id)
+            context.abort(grpc.StatusCode.DATA_LOSS, "Media is not available.")
 
     # def get_file(self, request, context):
     #     file_path = os.path.join(BASE_DIR, "a.MP4")
@@ -228,46 +515,183 @@ class ServerApi(rpc.ServerApiServicer):
     #         yield msg.Chunk(blob=file.read())
 
     @classmethod
-    def _get_user(cls, context):
-        auth_meta_keys = settings.auth_meta_keys
-        metadata = dict(context.invocation_metadata())
-        session_key = metadata[auth_meta_keys["auth_session_key"]]
+    def _get_upload(cls, request, owner_id, context):
+        # resume an upload of the owner
+        if request.media_id:
+            media = TripMedia.objects.filter(pk=request.media_id, owner_id=owner_id).first()
+            if media is None:
+                context.abort(grpc.StatusCode.NOT_FOUND, "Media is not exist.")
+            return media
+
+        # or start a new one
+        sha256 = request.sha256.lower()
+        max_size = settings.trip_media.get("max_size")
+        if not 0 < request.size <= max_size:
+            context.abort(grpc.StatusCode.INVALID_ARGUMENT, "Size of media must be 1 to %d bytes." % max_size)
+        if not _sha256_hex.fullmatch(sha256):
+            context.abort(grpc.StatusCode.INVALID_ARGUMENT, "sha256 of media must be 64 hex digits.")
+        (latitude, longitude) = (None, None)
+        if request.HasField('location'):
+            (latitude, longitude) = cls._get_location(request.location, context)
+        return TripMedia.start_upload(owner_id=owner_id, name=request.name[:200],
+                                      content_type=request.content_type[:100], size=request.size, sha256=sha256,
+                                      latitude=latitude, longitude=longitude)
+
+    @classmethod
+    def _get_location(cls, location, context):
+        if not (-90 <= location.latitude <= 90 and -180 <= location.longitude <= 180):
+            context.abort(grpc.StatusCode.INVALID_ARGUMENT, "Location is out of range.")
+        return location.latitude, location.longitude
+
+    @classmethod
+    def _get_area(cls, request, context):
+        """
+        Return (center, box) of a circle or of a box of request, as (latitude, longitude)
+        and (south, west, north, east)
+        """
+        if request.radius > 0:
+            if not request.HasField('center'):
+                context.abort(grpc.StatusCode.INVALID_ARGUMENT, "Center of the circle is missing.")
+            center = cls._get_location(request.center, context)
+            return center, geo.circle_box(*center, request.radius)
+
+        if not request.HasField('box'):
+            context.abort(grpc.StatusCode.INVALID_ARGUMENT, "A radius or a box is needed.")
+        box = request.box
+        (south, west) = cls._get_location(msg.Location(latitude=box.south, longitude=box.west), context)
+        (north, east) = cls._get_location(msg.Location(latitude=box.north, longitude=box.east), context)
+        if south > north:
+            context.abort(grpc.StatusCode.INVALID_ARGUMENT, "South of the box is above its north.")
+        # the middle longitude of a box across the antimeridian is on its far side
+        middle = west + ((east - west) % 360) / 2
+        return ((south + north) / 2, middle - 360 if middle > 180 else middle), (south, west, north, east)
 
-        session = Session.objects.get(pk=session_key)
-        data = session.get_decoded()
+    @classmethod
+    def _open_upload(cls, request, context):
+        if request is None:
+            context.abort(grpc.StatusCode.INVALID_ARGUMENT, "Upload has no message.")
+        media = cls._get_upload(request, get_auth_context(context).user_id, context)
+        return MediaUpload(media, context).open()
 
-        return User.objects.get(pk=data[auth_meta_keys.get("auth_user_key")])
+    @classmethod
+    def _user_response(cls, target, is_self, pic_size, pic_webp):
+        # set data to response
+        username = target.username
+        full_name = target.profile.full_name
+        bio = target.profile.bio
+        pic_url = avatar_url(target.profile.pic_digest, pic_size, pic_webp)
+        # get counts
+        counts = msg.Count(followers=target.profile.followers_count, following=target.profile.following_count,
+                           posts=target.profile.posts_count)
+        return msg.GetUserResp(is_self=is_self, user_id=target.id, username=username, full_name=full_name,
+                               bio=bio, counts=counts, found=True, pic_url=pic_url)
+
+    @classmethod
+    def _is_blocked(cls, blocker_id, blocked_id):
+        return UserConnection.objects.filter(user__user_id=blocker_id, one__user_id=blocked_id,
+                                             type=ConnectionType.BLOCK.name).exists()
+
+    @classmethod
+    def _stream_connected_users(cls, request, context, connections, side, viewer_id):
+        try:
+            position = cls._decode_cursor(request.cursor) if request.cursor else None
+        except ValueError:
+            context.abort(grpc.StatusCode.INVALID_ARGUMENT, "Cursor is not valid.")
+            return
+
+        pic_size = request.pic_size or settings.avatars.get("list_size")
+        for (user_id, username, pic_digest, cursor) in cls._iter_connected_users(
+                connections, side, viewer_id, position=position, limit=request.page_size):
+            follower = msg.UserSummary(user_id=user_id, username=username,
+                                       pic_url=avatar_url(pic_digest, pic_size, request.pic_webp))
+            yield msg.GetFollowerResp(follower=follower, cursor=cursor)
+
+    @classmethod
+    def _iter_connected_users(cls, connections, side, viewer_id, position=None, limit=0):
+        """
+        Yield (user_id, username, pic_digest, cursor) of users on the given side of connections in (created, id) order,
+        skipping users that blocked or are blocked by viewer.
+        each batch is one joined query that continues after (created, id) of the last connection,
+        so any page is a range scan of the connection page indexes
+        """
+        blocks = UserConnection.objects.filter(type=ConnectionType.BLOCK.name)
+        connections = connections.annotate(
+            blocked=Exists(blocks.filter(user__user_id=viewer_id, one=OuterRef(side))),
+            blocking=Exists(blocks.filter(user=OuterRef(side), one__user_id=viewer_id)),
+        ).filter(blocked=False, blocking=False)
+        rows = connections.order_by('created', 'id').values_list('created', 'id', side + '__user_id',
+                                                                 side + '__user__username', side + '__pic_digest')
+
+        remaining = limit if limit > 0 else None
+        while remaining is None or remaining > 0:
+            batch_size = settings.stream_batch_size
+            if remaining is not None:
+                batch_size = min(batch_size, remaining)
+            page = rows
+            if position is not None:
+                (created, connection_id) = position
+                # the leading created >= bound keeps the scan a range of the index, the rest only drops ties
+                page = rows.filter(Q(created__gte=created), Q(created__gt=created) | Q(id__gt=connection_id))
+            batch = list(page[:batch_size])
+
+            for (created, connection_id, user_id, username, pic_digest) in batch:
+                yield user_id, username, pic_digest, cls._encode_cursor(created, connection_id)
+            if len(batch) < batch_size:
+                break
+            position = batch[-1][:2]
+            if remaining is not None:
+                remaining -= len(batch)
+
+    @staticmethod
+    def _encode_cursor(created, connection_id):
+        return urlsafe_b64encode("{}|{}".format(created.isoformat(), connection_id).encode()).decode()
+
+    @staticmethod
+    def _decode_cursor(cursor):
+        """
+        Return (created, id) of the connection that cursor points to, raise ValueError for broken cursors
+        """
+        try:
+            (created, connection_id) = urlsafe_b64decode(cursor.encode()).decode().split('|')
+            created = parse_datetime(created)
+            connection_id = int(connection_id)
+        except (TypeError, ValueError, UnicodeError, binascii.Error):
+            raise ValueError("Cursor is not valid.")
+        if created is None:
+            raise ValueError("Cursor is not valid.")
+        return created, connection_id
+
+    @classmethod
+    def _get_user(cls, context):
+        return get_auth_context(context).user
 
     @classmethod
     def _create_session(cls, user=None):
         auth_meta_keys = settings.auth_meta_keys
         client_meta_keys = settings.client_meta_key
-        session = SessionStore()
+        session = get_session_store()
         session[auth_meta_keys.get("auth_key")] = \
             auth_meta_keys.get("auth_value") if user else auth_meta_keys.get("anonymous_value")
         if user:
             session[auth_meta_keys.get("auth_user_key")] = user.id
             session[auth_meta_keys.get("auth_client_state")] = True
         session[client_meta_keys.get("client_last_seen")] = now().timestamp()
-        session.create()
+        session.save()
         return session.session_key
 
+    @staticmethod
+    def _set_hashing_busy(context):
+        # passwords waited longer than password_hashing timeout for a hashing process, the call may be retried
+        context.set_code(grpc.StatusCode.UNAVAILABLE)
+        context.set_details("Server is busy, try again later.")
+
     @classmethod
     def _delete_session(cls, context):
-        metadata = dict(context.invocation_metadata())
-        session_key = metadata[settings.auth_meta_keys.get("auth_session_key")]
-        Session.objects.get(pk=session_key).delete()
+        delete_session(get_auth_context(context).session_key)
 
     @classmethod
     def _session_is_active(cls, context):
-        metadata = dict(context.invocation_metadata())
-        auth_meta_keys = settings.auth_meta_keys
-
-        session_key = metadata[auth_meta_keys.get("auth_session_key")]
-        session = Session.objects.get(pk=session_key)
-        data = session.get_decoded()
-
-        return data[auth_meta_keys.get("auth_client_state")]
+        return get_auth_context(context).is_active
 
     @classmethod
     def _validate_username(cls, username):
@@ -277,12 +701,9 @@ class ServerApi(rpc.ServerApiServicer):
         except ValidationError as e:
             raise ValidationError(e.message, grpc.StatusCode.FAILED_PRECONDITION)
 
-        # check username is available
-        try:
-            old_user = User.objects.get(username=username)
+        # check username is available, database is asked only if the index can not rule the username out
+        if availability_index.may_have_username(username) and User.objects.filter(username=username).exists():
             raise ValidationError(message="Username is not available.", code=grpc.StatusCode.ALREADY_EXISTS)
-        except User.DoesNotExist:
-            pass
 
     @classmethod
     def _validate_email(cls, email):
@@ -292,9 +713,6 @@ class ServerApi(rpc.ServerApiServicer):
         except ValidationError as e:
             raise ValidationError(e.message, grpc.StatusCode.FAILED_PRECONDITION)
 
-        # check email is available
-        try:
-            old_user = User.objects.get(email=email)
+        # check email is available, database is asked only if the index can not rule the email out
+        if availability_index.may_have_email(email) and User.objects.filter(email=email).exists():
             raise ValidationError(message="Email is not available.", code=grpc.StatusCode.ALREADY_EXISTS)
-        except User.DoesNotExist:
-            pass
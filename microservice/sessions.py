@@ -0,0 +1,89 @@
+"""Session backend of the gRPC server, chosen by settings.grpc_session."""
+
+from datetime import datetime, timedelta
+from django.conf import settings as django_settings
+from django.contrib.sessions.backends import db, file, signed_cookies
+from django.utils import baseconv, timezone
+from importlib import import_module
+
+from microservice.cache import LRUCache
+from tripmedia import settings
+
+SESSION_BACKENDS = {
+    "db": "django.contrib.sessions.backends.db",
+    "cached_db": "django.contrib.sessions.backends.cached_db",
+    "file": "django.contrib.sessions.backends.file",
+    "signed": "django.contrib.sessions.backends.signed_cookies",
+}
+
+# decoded sessions of this process, so read-only calls skip the session backend
+session_cache = LRUCache(max_size=settings.grpc_session.get("cache_max_size"),
+                         ttl=settings.grpc_session.get("cache_ttl"))
+
+_session_store_class = None
+
+
+def get_session_store_class():
+    global _session_store_class
+    if _session_store_class is None:
+        backend = settings.grpc_session.get("backend")
+        _session_store_class = import_module(SESSION_BACKENDS.get(backend, backend)).SessionStore
+    return _session_store_class
+
+
+def get_session_store(session_key=None):
+    """
+    Return django SessionStore of the configured backend
+    """
+    return get_session_store_class()(session_key)
+
+
+def load_session(session_key):
+    """
+    Return decoded data of the session or None if session does not exist or is expired
+    """
+    data = session_cache.get(session_key)
+    if data is not None:
+        return data
+
+    # every backend loads an empty session for a missing, expired or tampered key
+    session = get_session_store(session_key)
+    (data, expiry) = _load(session)
+    if not data:
+        return None
+
+    # the cache keeps it for the configured ttl at most, and never past the expiry of the session
+    session_cache.set(session_key, data, ttl=session.get_expiry_age(expiry=expiry))
+    return data
+
+
+def _load(session):
+    """
+    Return (data, expiry) of a session as its backend decides them, expiry is a datetime or seconds from now
+    """
+    if isinstance(session, db.SessionStore):
+        # the row holds its expire date, read it instead of load so it is still one query.
+        # cached_db sessions skip the shared cache, session_cache stands in front of the table in its place
+        row = session._get_session_from_db()
+        return (session.decode(row.session_data), row.expire_date) if row else ({}, None)
+
+    data = session.load()
+    if not data:
+        return data, None
+    if isinstance(session, file.SessionStore):
+        return data, session._expiry_date(data)
+    if isinstance(session, signed_cookies.SessionStore):
+        # signed keys expire a cookie age after the time stamp they were signed with
+        signed = datetime.fromtimestamp(baseconv.base62.decode(session.session_key.rsplit(':', 2)[-2]), timezone.utc)
+        return data, signed + timedelta(seconds=django_settings.SESSION_COOKIE_AGE)
+    # other backends do not tell, a session of theirs is kept for the configured ttl
+    return data, data.get('_session_expiry')
+
+
+def delete_session(session_key):
+    """
+    Delete the session and evict it from cache of this process.
+    signed sessions are stateless and stay valid for other processes until they expire
+    """
+    session_cache.delete(session_key)
+    get_session_store(session_key).delete(session_key)
@@ -1,3 +1,138 @@
-from django.test import TestCase
+import random
+import threading
+from django.test import SimpleTestCase, TestCase
+from unittest import mock
 
-# Create your tests here.
+from account.models import User
+from microservice.availability import AvailabilityIndex, BloomFilter
+from microservice.ratelimit import TokenBucketLimiter
+from tripmedia import settings
+
+
+class TokenBucketLimiterTest(SimpleTestCase):
+
+    def setUp(self):
+        clock = mock.patch('microservice.ratelimit.time.monotonic', return_value=1000.0)
+        self.clock = clock.start()
+        self.addCleanup(clock.stop)
+
+    def advance(self, seconds):
+        self.clock.return_value += seconds
+
+    def test_burst_then_rejected(self):
+        limiter = TokenBucketLimiter(rate=1, burst=3)
+        self.assertEqual([limiter.allow('peer') for _ in range(4)], [True, True, True, False])
+        self.assertEqual(limiter.stats(), {"buckets": 1, "allowed": 3, "rejected": 1})
+
+    def test_keys_have_buckets_of_their_own(self):
+        limiter = TokenBucketLimiter(rate=1, burst=1)
+        self.assertTrue(limiter.allow(('peer', 'ann')))
+        self.assertFalse(limiter.allow(('peer', 'ann')))
+        self.assertTrue(limiter.allow(('other peer', 'ann')))
+
+    def test_refill_at_rate_up_to_burst(self):
+        limiter = TokenBucketLimiter(rate=2, burst=3)
+        for _ in range(3):
+            limiter.allow('peer')
+        self.advance(1)
+        self.assertEqual([limiter.allow('peer') for _ in range(3)], [True, True, False])
+        # a long idle time fills the bucket, never beyond the burst
+        self.advance(60)
+        self.assertEqual([limiter.allow('peer') for _ in range(4)], [True, True, True, False])
+
+    def test_eviction_drops_full_buckets_only(self):
+        limiter = TokenBucketLimiter(rate=1, burst=10, shards=1, evict_every=60)
+        limiter.allow('idle')
+        self.advance(55)
+        for _ in range(10):
+            limiter.allow('busy')
+        # idle refilled its burst by now, busy only half of it
+        self.advance(5)
+        limiter.allow('caller')
+        self.assertEqual(len(limiter), 2)
+        self.assertEqual([limiter.allow('busy') for _ in range(6)], [True] * 5 + [False])
+
+    def test_eviction_waits_for_evict_every(self):
+        limiter = TokenBucketLimiter(rate=1, burst=1, shards=1, evict_every=60)
+        limiter.allow('idle')
+        self.advance(30)
+        limiter.allow('caller')
+        self.assertEqual(len(limiter), 2)
+
+    def test_stats_count_every_call_of_every_thread(self):
+        self.clock.stop()
+        limiter = TokenBucketLimiter(rate=1e9, burst=1e9, shards=4)
+
+        def call():
+            for key in range(5000):
+                limiter.allow(key % 50)
+
+        threads = [threading.Thread(target=call) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(limiter.stats(), {"buckets": 50, "allowed": 40000, "rejected": 0})
+
+
+class BloomFilterTest(SimpleTestCase):
+
+    def test_no_false_negatives(self):
+        rng = random.Random(3)
+        values = ["user{}".format(rng.getrandbits(64)) for _ in range(5000)]
+        bloom = BloomFilter(5000, 0.01)
+        for value in values:
+            bloom.add(value)
+        self.assertTrue(all(value in bloom for value in values))
+        self.assertEqual(bloom.count, 5000)
+
+    def test_false_positives_near_error_rate(self):
+        bloom = BloomFilter(5000, 0.01)
+        for i in range(5000):
+            bloom.add("taken{}".format(i))
+        false_positives = sum("free{}".format(i) in bloom for i in range(20000))
+        self.assertLess(false_positives / 20000, 0.03)
+
+
+class AvailabilityIndexTest(TestCase):
+
+    def setUp(self):
+        for i in range(50):
+            User.objects.create(username='user{}'.format(i), email='user{}@test.local'.format(i))
+        self.index = AvailabilityIndex()
+
+    def test_cold_index_checks_everything(self):
+        self.assertTrue(self.index.may_have_username('nobody'))
+        self.assertTrue(self.index.may_have_email('nobody@test.local'))
+
+    def test_no_false_negatives_after_warm(self):
+        self.index.warm()
+        for i in range(50):
+            self.assertTrue(self.index.may_have_username('User{}'.format(i)))
+            self.assertTrue(self.index.may_have_email('user{}@test.local'.format(i)))
+
+    def test_no_false_negatives_after_add(self):
+        self.index.warm()
+        self.index.add(username='Added', email='added@test.local')
+        self.assertTrue(self.index.may_have_username('added'))
+        self.assertTrue(self.index.may_have_email('Added@test.local'))
+
+    def test_refresh_reads_users_added_and_renamed_elsewhere(self):
+        self.index.warm()
+        User.objects.create(username='newcomer', email='newcomer@test.local')
+        renamed = User.objects.get(username='user7')
+        renamed.username = 'renamed'
+        renamed.email = 'renamed@test.local'
+        renamed.save(update_fields=['username', 'email'])
+        self.assertFalse(self.index.may_have_username('renamed'))
+
+        self.index.refresh()
+        for username in ('newcomer', 'renamed', 'user0'):
+            self.assertTrue(self.index.may_have_username(username), username)
+        for email in ('newcomer@test.local', 'renamed@test.local'):
+            self.assertTrue(self.index.may_have_email(email), email)
+
+    def test_stale_index_checks_everything(self):
+        self.index.warm()
+        self.index._caught_up -= settings.availability_index.get("max_lag") + 1
+        self.assertTrue(self.index.may_have_username('nobody'))
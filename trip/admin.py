@@ -0,0 +1,9 @@
+from django.contrib import admin
+
+from trip.models import Blob, ClusterChange, MediaCluster, MetadataJob, TripMedia
+
+admin.site.register(Blob)
+admin.site.register(TripMedia)
+admin.site.register(MediaCluster)
+admin.site.register(MetadataJob)
+admin.site.register(ClusterChange)
@@ -0,0 +1,9 @@
+from django.apps import AppConfig
+
+
+class TripConfig(AppConfig):
+    name = 'trip'
+
+    def ready(self):
+        # connect signal receivers
+        from trip import signals  # noqa: F401
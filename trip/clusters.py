@@ -0,0 +1,75 @@
+"""
+Grids of clusters of geotagged media, one for each zoom level of a web mercator map.
+a tile of zoom z is split into grid x grid cells, and each cell keeps the count and the sums of the locations
+of its media, so a tile is read as at most grid * grid rows whatever the number of media in it.
+locations are binned with numpy, a whole table of them at once or one of them alike
+"""
+
+import numpy as np
+
+from tripmedia import settings
+
+MAX_LATITUDE = 85.0511287798  # degrees, edges of the square web mercator map
+
+
+def grid_bits():
+    # cells of a tile of zoom z are the tiles of zoom z + grid_bits
+    return int(settings.map_tiles.get("grid")).bit_length() - 1
+
+
+def project(latitude, longitude):
+    """
+    Return web mercator (x, y) of locations, each in [0, 1], x from the antimeridian eastwards
+    and y from the north edge southwards. numpy arrays of locations are projected element-wise
+    """
+    phi = np.radians(np.clip(latitude, -MAX_LATITUDE, MAX_LATITUDE))
+    x = (np.asarray(longitude, dtype=np.float64) + 180.0) / 360.0
+    y = (1.0 - np.log(np.tan(phi) + 1.0 / np.cos(phi)) / np.pi) / 2.0
+    return x, y
+
+
+def bin_cells(x, y, zoom):
+    """
+    Return (x, y) of the cells of zoom holding projected locations
+    """
+    side = 2 ** (zoom + grid_bits())
+    return (np.clip(np.floor(x * side), 0, side - 1).astype(np.int64),
+            np.clip(np.floor(y * side), 0, side - 1).astype(np.int64))
+
+
+def cells(latitude, longitude):
+    """
+    Return [(zoom, x, y)] of the cell holding a location at each clustered zoom level
+    """
+    (x, y) = project(latitude, longitude)
+    return [(zoom,) + tuple(int(index) for index in bin_cells(x, y, zoom))
+            for zoom in range(settings.map_tiles.get("max_zoom") + 1)]
+
+
+def tiles(latitude, longitude):
+    """
+    Return [(zoom, x, y)] of the tile holding a location at each clustered zoom level
+    """
+    bits = grid_bits()
+    return [(zoom, x >> bits, y >> bits) for (zoom, x, y) in cells(latitude, longitude)]
+
+
+def bin_locations(latitudes, longitudes, x, y, zoom):
+    """
+    Return arrays (x, y, count, latitude sum, longitude sum) with one element for each cell of zoom
+    holding any of the locations, x and y are their projections
+    """
+    side = 2 ** (zoom + grid_bits())
+    (columns, rows) = bin_cells(x, y, zoom)
+    (keys, inverse) = np.unique(columns * side + rows, return_inverse=True)
+    inverse = inverse.reshape(-1)
+    return (keys // side, keys % side, np.bincount(inverse),
+            np.bincount(inverse, weights=latitudes), np.bincount(inverse, weights=longitudes))
+
+
+def tile_cells(x, y):
+    """
+    Return (first x, first y, after x, after y) of the cells of a tile
+    """
+    grid = settings.map_tiles.get("grid")
+    return x * grid, y * grid, (x + 1) * grid, (y + 1) * grid
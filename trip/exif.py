@@ -0,0 +1,113 @@
+"""
+Metadata of media files read from their headers with pillow, no pixel is decoded.
+it runs in the processes of trip.metadata and imports no django, so they start fast
+"""
+
+from datetime import datetime, timedelta, timezone
+from PIL import Image
+
+_ORIENTATION = 0x0112
+_DATETIME = 0x0132
+_DATETIME_ORIGINAL = 0x9003
+_OFFSET_TIME_ORIGINAL = 0x9011
+_GPS_INFO = 0x8825
+(_GPS_LATITUDE_REF, _GPS_LATITUDE, _GPS_LONGITUDE_REF, _GPS_LONGITUDE) = (1, 2, 3, 4)
+(_GPS_TIME_STAMP, _GPS_DATE_STAMP) = (7, 29)
+
+
+def read_metadata(path):
+    """
+    Return {width, height, orientation, taken, latitude, longitude} of the image at path, without the keys it has
+    no value for, so files that are not images give {}. taken is an aware datetime.
+    raise OSError when the file can not be read
+    """
+    with open(path, 'rb') as file:
+        try:
+            # open only reads the header, pixels are decoded by load, which is never called
+            image = Image.open(file)
+        except Exception:
+            # pillow raises all kinds of errors on files it does not know or that are broken
+            return {}
+        metadata = {'width': image.size[0], 'height': image.size[1]}
+        try:
+            tags = image._getexif() if hasattr(image, '_getexif') else None
+        except Exception:
+            tags = None
+    if not tags:
+        return metadata
+
+    orientation = tags.get(_ORIENTATION)
+    if isinstance(orientation, int) and 1 <= orientation <= 8:
+        metadata['orientation'] = orientation
+    gps = tags.get(_GPS_INFO)
+    if not isinstance(gps, dict):
+        gps = {}
+    taken = _gps_time(gps) or _camera_time(tags)
+    if taken is not None:
+        metadata['taken'] = taken
+    location = _gps_location(gps)
+    if location is not None:
+        (metadata['latitude'], metadata['longitude']) = location
+    return metadata
+
+
+def _number(value):
+    # pillow 5 gives rationals as (numerator, denominator), later versions as numbers
+    if isinstance(value, tuple):
+        return value[0] / value[1]
+    return float(value)
+
+
+def _text(value):
+    if isinstance(value, bytes):
+        value = value.decode('ascii', 'replace')
+    return str(value).strip('\x00 ')
+
+
+def _gps_location(gps):
+    try:
+        (latitude, longitude) = (_degrees(gps[_GPS_LATITUDE]), _degrees(gps[_GPS_LONGITUDE]))
+        if _text(gps.get(_GPS_LATITUDE_REF, 'N')).upper() == 'S':
+            latitude = -latitude
+        if _text(gps.get(_GPS_LONGITUDE_REF, 'E')).upper() == 'W':
+            longitude = -longitude
+    except (KeyError, IndexError, TypeError, ValueError, ZeroDivisionError):
+        return None
+    # cameras with no fix write zeros
+    if not (-90 <= latitude <= 90 and -180 <= longitude <= 180) or latitude == longitude == 0:
+        return None
+    return latitude, longitude
+
+
+def _degrees(dms):
+    (degrees, minutes, seconds) = (_number(part) for part in dms)
+    return degrees + minutes / 60 + seconds / 3600
+
+
+def _gps_time(gps):
+    # gps time is utc, the clock of the camera has no time zone unless it writes its offset
+    try:
+        day = datetime.strptime(_text(gps[_GPS_DATE_STAMP]), '%Y:%m:%d')
+        (hours, minutes, seconds) = (_number(part) for part in gps[_GPS_TIME_STAMP])
+        return (day + timedelta(hours=hours, minutes=minutes, seconds=seconds)).replace(tzinfo=timezone.utc)
+    except (KeyError, IndexError, TypeError, ValueError, ZeroDivisionError, OverflowError):
+        return None
+
+
+def _camera_time(tags):
+    """
+    Return time the camera wrote, in the time zone of its offset if it wrote one, or else taken as utc
+    """
+    try:
+        taken = datetime.strptime(_text(tags.get(_DATETIME_ORIGINAL) or tags[_DATETIME]), '%Y:%m:%d %H:%M:%S')
+    except (KeyError, TypeError, ValueError):
+        return None
+    zone = timezone.utc
+    offset = _text(tags.get(_OFFSET_TIME_ORIGINAL, ''))
+    if len(offset) == 6 and offset[0] in '+-' and offset[3] == ':':
+        try:
+            delta = timedelta(hours=int(offset[1:3]), minutes=int(offset[4:6]))
+            zone = timezone(-delta if offset[0] == '-' else delta)
+        except ValueError:
+            pass
+    return taken.replace(tzinfo=zone)
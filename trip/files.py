@@ -0,0 +1,111 @@
+"""
+Chunked reads and writes of media files.
+both keep one buffer of at most a chunk, so memory stays flat whatever the size of the file
+"""
+
+import fcntl
+import hashlib
+import os
+
+
+def read_chunks(path, start, end, chunk_size):
+    """
+    Yield (offset, view) for bytes start..end of the file at path, or of a file opened in binary mode that is closed
+    once read, read into one reused buffer. a view is only valid until the next one is read, copy it to keep it
+    """
+    buffer = memoryview(bytearray(chunk_size))
+    with open(path, 'rb', buffering=0) if isinstance(path, str) else path as file:
+        file.seek(start)
+        offset = start
+        while offset < end:
+            read = file.readinto(buffer[:min(chunk_size, end - offset)])
+            if not read:
+                raise EOFError("%s ends at %d, before %d" % (file.name, offset, end))
+            yield offset, buffer[:read]
+            offset += read
+
+
+class FileLock:
+    """
+    Exclusive lock of the file at path, created when it is missing, against every other lock of it,
+    in this process or another server process
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._descriptor = None
+
+    def acquire(self):
+        """
+        Take the lock, raise BlockingIOError when it is held already
+        """
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        descriptor = os.open(self.path, os.O_RDWR | os.O_CREAT)
+        try:
+            fcntl.flock(descriptor, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            os.close(descriptor)
+            raise
+        self._descriptor = descriptor
+
+    def release(self):
+        # closing the file releases the lock
+        if self._descriptor is not None:
+            os.close(self._descriptor)
+            self._descriptor = None
+
+
+class ChunkWriter:
+    """
+    Append chunks to a partly stored file, hashing them as they are written.
+    bytes stored before offset are hashed again when it opens, so a resumed upload is checked as a whole,
+    and bytes after offset, left by an interrupted write, are cut off
+    """
+
+    def __init__(self, path, offset, chunk_size):
+        self.path = path
+        self.offset = offset
+        self.chunk_size = chunk_size
+        self._digest = hashlib.sha256()
+        self._file = None
+
+    def open(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self._file = open(self.path, 'r+b' if os.path.exists(self.path) else 'w+b')
+        try:
+            stored = 0
+            for (_, chunk) in read_chunks(self.path, 0, self.offset, self.chunk_size):
+                self._digest.update(chunk)
+                stored += len(chunk)
+        except EOFError:
+            # the file lost bytes it had, the upload goes on from what is left
+            self.offset = stored
+        self._file.truncate(self.offset)
+        self._file.seek(self.offset)
+        return self
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self.open()
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def write(self, data):
+        self._file.write(data)
+        self._digest.update(data)
+        self.offset += len(data)
+
+    def sync(self):
+        """
+        Flush written chunks to disk, offset can be saved as stored after it
+        """
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def hexdigest(self):
+        return self._digest.hexdigest()
@@ -0,0 +1,173 @@
+"""
+Geohash index of locations, in plain python so it runs on sqlite and postgres alike.
+a geohash is a string whose prefixes are ever smaller cells around a location, so the locations inside a box
+are found by a few range scans of an ordinary index on the geohash column
+"""
+
+import math
+
+EARTH_RADIUS = 6371008.8  # meters, mean radius
+PRECISION = 12  # characters of stored geohashes, cells of a few centimeters
+_BASE32 = '0123456789bcdefghjkmnpqrstuvwxyz'
+_AFTER_BASE32 = '{'  # sorts right after every geohash character
+
+
+def encode(latitude, longitude, precision=PRECISION):
+    (south, north, west, east) = (-90.0, 90.0, -180.0, 180.0)
+    characters = []
+    (bits, bit_count, even) = (0, 0, True)
+    while len(characters) < precision:
+        # bits alternate between longitude and latitude, longitude first
+        if even:
+            middle = (west + east) / 2
+            if longitude >= middle:
+                (bits, west) = (bits * 2 + 1, middle)
+            else:
+                (bits, east) = (bits * 2, middle)
+        else:
+            middle = (south + north) / 2
+            if latitude >= middle:
+                (bits, south) = (bits * 2 + 1, middle)
+            else:
+                (bits, north) = (bits * 2, middle)
+        even = not even
+        bit_count += 1
+        if bit_count == 5:
+            characters.append(_BASE32[bits])
+            (bits, bit_count) = (0, 0)
+    return ''.join(characters)
+
+
+def cell_size(precision):
+    """
+    Return (height, width) in degrees of the cells of geohashes of precision characters
+    """
+    bits = precision * 5
+    return 180.0 / 2 ** (bits // 2), 360.0 / 2 ** ((bits + 1) // 2)
+
+
+def decode_cell(prefix):
+    """
+    Return (south, west, north, east) of the cell of a geohash prefix
+    """
+    (south, north, west, east) = (-90.0, 90.0, -180.0, 180.0)
+    even = True
+    for character in prefix:
+        bits = _BASE32.index(character)
+        for shift in range(4, -1, -1):
+            bit = (bits >> shift) & 1
+            if even:
+                middle = (west + east) / 2
+                (west, east) = (middle, east) if bit else (west, middle)
+            else:
+                middle = (south + north) / 2
+                (south, north) = (middle, north) if bit else (south, middle)
+            even = not even
+    return south, west, north, east
+
+
+def covering_cells(south, west, north, east, max_cells):
+    """
+    Return geohash prefixes of the cells that cover the box, at the finest precision that needs at most
+    max_cells of them. a box with west > east crosses the antimeridian
+    """
+    if west > east:
+        return covering_cells(south, west, north, 180.0, max_cells // 2) + \
+               covering_cells(south, -180.0, north, east, max_cells // 2)
+
+    precision = PRECISION
+    while precision > 1:
+        (height, width) = cell_size(precision)
+        rows = math.floor(north / height) - math.floor(south / height) + 1
+        columns = math.floor(east / width) - math.floor(west / width) + 1
+        if rows * columns <= max_cells:
+            break
+        precision -= 1
+    (height, width) = cell_size(precision)
+
+    prefixes = set()
+    latitude = south
+    while True:
+        longitude = west
+        while True:
+            prefixes.add(encode(min(latitude, 90.0), min(longitude, 180.0), precision))
+            if longitude >= east:
+                break
+            longitude = min(longitude + width, east)
+        if latitude >= north:
+            break
+        latitude = min(latitude + height, north)
+    return sorted(prefixes)
+
+
+def cell_range(prefix):
+    """
+    Return (first, after) geohashes of the cell of prefix, an index range scan reads it
+    """
+    return prefix, prefix + _AFTER_BASE32
+
+
+def children(prefix, south, west, north, east):
+    """
+    Return prefixes of the 32 cells inside the cell of prefix that overlap the box
+    """
+    boxes = [(west, east)] if west <= east else [(west, 180.0), (-180.0, east)]
+    overlapping = []
+    for character in _BASE32:
+        (cell_south, cell_west, cell_north, cell_east) = decode_cell(prefix + character)
+        if cell_south <= north and cell_north >= south and \
+                any(cell_west <= box_east and cell_east >= box_west for (box_west, box_east) in boxes):
+            overlapping.append(prefix + character)
+    return overlapping
+
+
+def cell_distance(latitude, longitude, prefix):
+    """
+    Return the distance in meters from a location to the nearest point of the cell of prefix, 0 inside it.
+    TripMedia.nearest stops at the first cell farther than the media it found, so it is never more than that
+    """
+    (south, west, north, east) = decode_cell(prefix)
+    if west <= longitude <= east:
+        # on the meridian of the location, the nearest point is straight north or south
+        return distance(latitude, longitude, min(max(latitude, south), north), longitude)
+
+    # off its meridians, the nearest point is on the edge meridian nearer either way round the antimeridian
+    edge = min((west, east), key=lambda meridian: abs((longitude - meridian + 180) % 360 - 180))
+    # the point of the great circle of that meridian nearest to the location, it is beyond a pole when the
+    # meridian is more than a quarter turn away. distance grows away from it along the circle, so the nearest
+    # point of the edge is that one when the edge holds it, or else one of the corners
+    (phi, dlambda) = (math.radians(latitude), math.radians(longitude - edge))
+    foot = math.degrees(math.atan2(math.sin(phi), math.cos(phi) * math.cos(dlambda)))
+    candidates = [south, north] + ([foot] if south <= foot <= north else [])
+    return min(distance(latitude, longitude, candidate, edge) for candidate in candidates)
+
+
+def distance(latitude, longitude, other_latitude, other_longitude):
+    """
+    Return great circle distance in meters, by the haversine formula
+    """
+    (phi, other_phi) = (math.radians(latitude), math.radians(other_latitude))
+    half_dphi = (other_phi - phi) / 2
+    half_dlambda = math.radians(other_longitude - longitude) / 2
+    a = math.sin(half_dphi) ** 2 + math.cos(phi) * math.cos(other_phi) * math.sin(half_dlambda) ** 2
+    return 2 * EARTH_RADIUS * math.asin(min(1.0, math.sqrt(a)))
+
+
+def circle_box(latitude, longitude, radius):
+    """
+    Return (south, west, north, east) of a box around the circle of radius meters
+    """
+    angle = math.degrees(radius / EARTH_RADIUS)
+    (south, north) = (latitude - angle, latitude + angle)
+    if south <= -90.0 or north >= 90.0:
+        # a circle around a pole takes every longitude
+        return max(south, -90.0), -180.0, min(north, 90.0), 180.0
+    spread = math.degrees(math.asin(min(1.0, math.sin(radius / EARTH_RADIUS) / math.cos(math.radians(latitude)))))
+    (west, east) = (longitude - spread, longitude + spread)
+    if west < -180.0:
+        west += 360.0
+    if east > 180.0:
+        east -= 360.0
+    if east - west >= 360.0 or spread >= 180.0:
+        return south, -180.0, north, 180.0
+    return south, west, north, east
@@ -0,0 +1,69 @@
+import numpy as np
+from django.core.management import BaseCommand
+from django.db import connection, transaction
+from itertools import chain
+
+from trip import clusters
+from trip.models import ClusterChange, MediaCluster, TripMedia
+from tripmedia import settings
+
+
+class Command(BaseCommand):
+    help = "Cluster complete geotagged trip media again from scratch for every zoom level of the map. " \
+           "counting queued changes into the clusters is locked out meanwhile, media keep being added"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=10000,
+                            help="Media read, and clusters written, at a time.")
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+
+        written = 0
+        with transaction.atomic():
+            # the clusters are built from one snapshot of the media, with MediaCluster.apply_changes locked out.
+            # the queued changes of the media read are dropped, those committed after the snapshot stay queued
+            # and are counted once it is done, so no change is lost or counted twice
+            self.lock_clusters()
+            MediaCluster.objects.all().delete()
+            located = TripMedia.objects.filter(completed__isnull=False, latitude__isnull=False,
+                                               longitude__isnull=False).values_list('latitude', 'longitude')
+            points = np.fromiter(chain.from_iterable(located.iterator(chunk_size=batch_size)), dtype=np.float64)
+            ClusterChange.objects.all().delete()
+            (latitudes, longitudes) = (points[0::2], points[1::2])
+            # locations are projected once, each zoom level only bins them into its cells
+            (x, y) = clusters.project(latitudes, longitudes)
+            self.stderr.write("\t✓ {} media located".format(len(latitudes)))
+
+            for zoom in range(settings.map_tiles.get("max_zoom") + 1):
+                binned = clusters.bin_locations(latitudes, longitudes, x, y, zoom)
+                written += self.write_clusters(zoom, *binned, batch_size=batch_size)
+        MediaCluster.apply_changes()
+        self.stderr.write("✓ Cluster completed, {} media in {} clusters".format(len(latitudes), written))
+
+    @staticmethod
+    def lock_clusters():
+        # postgres takes the snapshot at the first statement after the lock, and keeps it with repeatable read.
+        # sqlite has one writer at a time, the delete of the clusters takes the database before the media are read
+        if connection.vendor != 'postgresql':
+            return
+        with connection.cursor() as cursor:
+            cursor.execute("SET TRANSACTION ISOLATION LEVEL REPEATABLE READ")
+            cursor.execute("LOCK TABLE {} IN EXCLUSIVE MODE".format(
+                connection.ops.quote_name(MediaCluster._meta.db_table)))
+
+    @staticmethod
+    def write_clusters(zoom, xs, ys, counts, latitude_sums, longitude_sums, batch_size):
+        # rows go straight from the arrays to one prepared insert, model instances would cost more than binning
+        quote = connection.ops.quote_name
+        meta = MediaCluster._meta
+        fields = ('zoom', 'x', 'y', 'count', 'latitude_sum', 'longitude_sum')
+        sql = "INSERT INTO {} ({}) VALUES ({})".format(
+            quote(meta.db_table), ", ".join(quote(meta.get_field(field).column) for field in fields),
+            ", ".join(["%s"] * len(fields)))
+        with connection.cursor() as cursor:
+            for start in range(0, len(counts), batch_size):
+                stop = start + batch_size
+                columns = [values[start:stop].tolist() for values in (xs, ys, counts, latitude_sums, longitude_sums)]
+                cursor.executemany(sql, [(zoom,) + row for row in zip(*columns)])
+        return len(counts)
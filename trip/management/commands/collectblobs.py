@@ -0,0 +1,46 @@
+import os
+import time
+from datetime import timedelta
+from django.core.management import BaseCommand
+from django.db import transaction
+from django.utils.timezone import now
+
+from trip.models import Blob
+from trip.storage import blob_name, blob_storage
+
+
+class Command(BaseCommand):
+    help = "Remove blobs no model refers to any more, once they were unused for the grace time"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--grace', type=int, default=60 * 60,
+                            help="Seconds a blob with no references is kept, an upload of the same content "
+                                 "takes it back meanwhile.")
+
+    def handle(self, *args, **options):
+        cutoff = now() - timedelta(seconds=options['grace'])
+
+        removed = 0
+        released = Blob.objects.filter(refs=0, released__lt=cutoff).values_list('digest', flat=True)
+        for digest in list(released):
+            # the row stays locked until it is deleted along with its file, so an upload of the same content
+            # either counts its reference first or stores the file again after
+            with transaction.atomic():
+                blob = Blob.objects.select_for_update() \
+                    .filter(digest=digest, refs=0, released__lt=cutoff).first()
+                if blob is None:
+                    continue
+                blob.delete()
+                blob_storage.delete(blob_name(digest))
+            removed += 1
+        self.stderr.write("\t✓ {} blobs removed".format(removed))
+
+        # files of saves that never finished
+        temporary = blob_storage.path('blobs/tmp')
+        stale = 0
+        if os.path.isdir(temporary):
+            for entry in os.scandir(temporary):
+                if entry.stat().st_mtime < time.time() - options['grace']:
+                    os.remove(entry.path)
+                    stale += 1
+        self.stderr.write("✓ Collect completed, {} blobs and {} temporary files removed".format(removed, stale))
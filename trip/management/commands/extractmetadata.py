@@ -0,0 +1,51 @@
+import time
+from django.core.management import BaseCommand
+from django.db import close_old_connections
+
+from trip import metadata
+from trip.models import MetadataJob, TripMedia
+from tripmedia import settings
+
+
+class Command(BaseCommand):
+    help = "Read location, capture time, orientation and dimensions of complete trip media from their files"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--processes', type=int, default=settings.media_metadata.get("processes"),
+                            help="Processes reading file headers, 0 reads them on the main thread.")
+        parser.add_argument('--once', action='store_true',
+                            help="Stop once the queue is empty, instead of waiting for new media.")
+        parser.add_argument('--queue-existing', action='store_true',
+                            help="First queue complete media that have no dimensions and no job, "
+                                 "such as those uploaded before this command ran.")
+
+    def handle(self, *args, **options):
+        if options['queue_existing']:
+            queued = self.queue_existing()
+            self.stderr.write("\t✓ {} media queued".format(queued))
+
+        executor = metadata.create_executor(options['processes'])
+        processed = 0
+        try:
+            while True:
+                # a worker runs for days, stale connections are dropped between batches as they are between calls
+                close_old_connections()
+                taken = metadata.process_batch(executor)
+                processed += taken
+                if not taken:
+                    if options['once']:
+                        break
+                    time.sleep(settings.media_metadata.get("poll_interval"))
+        except KeyboardInterrupt:
+            pass
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True)
+        self.stderr.write("✓ Extract completed, {} media read".format(processed))
+
+    @staticmethod
+    def queue_existing():
+        media = TripMedia.objects.filter(completed__isnull=False, width__isnull=True, metadata_job__isnull=True)
+        return len(MetadataJob.objects.bulk_create(
+            [MetadataJob(media_id=media_id) for media_id in media.values_list('id', flat=True).iterator()],
+            batch_size=1000))
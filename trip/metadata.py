@@ -0,0 +1,103 @@
+"""
+Metadata of complete trip media, read off the request path.
+completing a media queues a MetadataJob in the same transaction, extractmetadata leases batches of them, reads the
+headers of their files on a pool of processes and writes what it found to all media of a batch in one update
+"""
+
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from django.db import transaction
+from django.db.models import Case, F, Q, Value, When
+
+from trip import exif, geo
+from trip.models import MediaCluster, MetadataJob, TripMedia
+from trip.storage import blob_storage
+from tripmedia import settings
+
+logger = logging.getLogger(__name__)
+
+FIELDS = ('taken', 'width', 'height', 'orientation')
+
+
+def create_executor(processes):
+    """
+    Return a pool of processes reading headers, None reads them on the calling thread
+    """
+    if not processes:
+        return None
+    # spawn, like the password hashing processes, fork copies whatever the parent is running
+    return ProcessPoolExecutor(max_workers=processes, mp_context=multiprocessing.get_context('spawn'))
+
+
+def process_batch(executor):
+    """
+    Read metadata of a batch of queued media and write it back, return the number of jobs taken
+    """
+    options = settings.media_metadata
+    jobs = MetadataJob.lease(options.get("batch_size"), options.get("lease"))
+    if not jobs:
+        return 0
+    files = dict(TripMedia.objects.filter(pk__in=[media_id for (media_id, _) in jobs]).values_list('id', 'file'))
+    # media deleted meanwhile took their jobs with them
+    jobs = [(media_id, attempts) for (media_id, attempts) in jobs if media_id in files]
+
+    reads = {}
+    for (media_id, _) in jobs:
+        path = blob_storage.path(files[media_id])
+        reads[media_id] = executor.submit(exif.read_metadata, path) if executor is not None else path
+
+    found = {}
+    dropped = []
+    for (media_id, attempts) in jobs:
+        read = reads[media_id]
+        try:
+            found[media_id] = read.result() if executor is not None else exif.read_metadata(read)
+        except OSError:
+            # the job is taken again once its lease runs out, or dropped after its last attempt
+            if attempts >= options.get("max_attempts"):
+                logger.warning("File of media %d is not readable, its metadata is dropped", media_id)
+                dropped.append(media_id)
+            else:
+                logger.info("File of media %d is not readable, attempt %d", media_id, attempts, exc_info=True)
+
+    write_metadata(found)
+    MetadataJob.objects.filter(pk__in=dropped).delete()
+    return len(jobs)
+
+
+def write_metadata(found):
+    """
+    Write {media id: metadata} to all of the media in one update and remove their jobs.
+    media uploaded with no location take the one of their file, and are counted into the clusters of the map
+    """
+    if not found:
+        return
+    with transaction.atomic():
+        unlocated = set(TripMedia.objects.select_for_update().filter(pk__in=list(found))
+                        .filter(Q(latitude__isnull=True) | Q(longitude__isnull=True)).values_list('id', flat=True))
+        values = {field: [] for field in FIELDS + ('latitude', 'longitude', 'geohash')}
+        located = []
+        for (media_id, metadata) in found.items():
+            for field in FIELDS:
+                if field in metadata:
+                    values[field].append((media_id, metadata[field]))
+            if media_id in unlocated and 'latitude' in metadata:
+                location = (metadata['latitude'], metadata['longitude'])
+                values['latitude'].append((media_id, location[0]))
+                values['longitude'].append((media_id, location[1]))
+                values['geohash'].append((media_id, geo.encode(*location)))
+                located.append(location)
+
+        updates = {}
+        for (field, pairs) in values.items():
+            if pairs:
+                output_field = TripMedia._meta.get_field(field)
+                updates[field] = Case(*(When(pk=media_id, then=Value(value, output_field=output_field))
+                                        for (media_id, value) in pairs), default=F(field), output_field=output_field)
+        if updates:
+            TripMedia.objects.filter(pk__in=list(found)).update(**updates)
+        # the update skips the signals that cluster media as they are saved
+        for (latitude, longitude) in located:
+            MediaCluster.add(latitude, longitude)
+        MetadataJob.objects.filter(pk__in=list(found)).delete()
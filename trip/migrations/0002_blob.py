@@ -0,0 +1,29 @@
+# Generated by Django 2.1 on 2026-10-18 15:20
+
+from django.db import migrations, models
+import trip.storage
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('trip', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Blob',
+            fields=[
+                ('digest', models.CharField(max_length=64, primary_key=True, serialize=False)),
+                ('size', models.BigIntegerField()),
+                ('content_type', models.CharField(blank=True, max_length=100)),
+                ('refs', models.PositiveIntegerField(default=0)),
+                ('released', models.DateTimeField(blank=True, null=True)),
+            ],
+        ),
+        migrations.AlterField(
+            model_name='tripmedia',
+            name='file',
+            field=models.FileField(editable=False, max_length=200, storage=trip.storage.ContentAddressedStorage(), upload_to=''),
+        ),
+    ]
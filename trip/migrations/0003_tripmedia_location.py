@@ -0,0 +1,28 @@
+# Generated by Django 2.1 on 2026-10-18 15:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('trip', '0002_blob'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='tripmedia',
+            name='geohash',
+            field=models.CharField(blank=True, db_index=True, editable=False, max_length=12),
+        ),
+        migrations.AddField(
+            model_name='tripmedia',
+            name='latitude',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='tripmedia',
+            name='longitude',
+            field=models.FloatField(blank=True, null=True),
+        ),
+    ]
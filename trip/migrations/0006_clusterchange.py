@@ -0,0 +1,22 @@
+# Generated by Django 2.1 on 2026-10-18 19:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('trip', '0005_tripmedia_metadata'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ClusterChange',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('latitude', models.FloatField()),
+                ('longitude', models.FloatField()),
+                ('count', models.SmallIntegerField()),
+            ],
+        ),
+    ]
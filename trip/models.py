@@ -0,0 +1,386 @@
+import heapq
+import logging
+import os
+from datetime import timedelta
+from django.conf import settings
+from django.db import IntegrityError, OperationalError, connection, models, transaction
+from django.db.models import Case, F, Q, Value, When
+from django.utils.timezone import now
+from uuid import uuid4
+
+from trip import clusters, geo
+from trip.storage import blob_digest, blob_name, blob_storage
+
+logger = logging.getLogger(__name__)
+
+# cells matched by one query, their parameters stay below the limits of sqlite
+CELLS_PER_QUERY = 256
+
+
+def media_file_name(owner_id):
+    """
+    Return name of a new media file under MEDIA_ROOT, names are random so they can not be guessed or taken twice
+    """
+    return os.path.join('trip', str(owner_id), uuid4().hex)
+
+
+class Blob(models.Model):
+    """
+    File of the content-addressed store, with the number of references models hold to it
+    """
+
+    digest = models.CharField(max_length=64, primary_key=True)
+    size = models.BigIntegerField()
+    content_type = models.CharField(max_length=100, blank=True)
+    refs = models.PositiveIntegerField(default=0)
+    # when refs last dropped to 0, collectblobs removes the file once it is unused for a while
+    released = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self):
+        return self.digest
+
+    @property
+    def name(self):
+        return blob_name(self.digest)
+
+    @classmethod
+    def adopt(cls, path, digest, content_type=''):
+        """
+        Move the file at path, whose content has digest, into the store and return its name.
+        the row of the blob is locked meanwhile, so collectblobs can not remove the stored file it was found to
+        duplicate. a blob with no references is released again, the grace of collectblobs keeps it until the
+        reference that follows is counted
+        """
+        with transaction.atomic():
+            blob = cls._lock(digest, size=os.path.getsize(path), content_type=content_type)
+            name = blob_storage.adopt(path, digest)
+            if blob.refs == 0:
+                cls.objects.filter(digest=digest).update(released=now())
+        return name
+
+    @classmethod
+    def acquire(cls, name, content_type=''):
+        """
+        Count a new reference to the blob named name and return True, or False when its file is not stored any more.
+        names of files stored elsewhere are ignored
+        """
+        digest = blob_digest(name)
+        if digest is None:
+            return True
+        with transaction.atomic():
+            # collectblobs removes files with their row locked, a file that is there once it is locked stays
+            blob = cls.objects.select_for_update().filter(digest=digest).first()
+            if blob is None:
+                if not blob_storage.exists(name):
+                    return False
+                cls._lock(digest, size=blob_storage.size(name), content_type=content_type)
+            if not blob_storage.exists(name):
+                return False
+            cls.objects.filter(digest=digest).update(refs=F('refs') + 1, released=None)
+        return True
+
+    @classmethod
+    def release(cls, name):
+        digest = blob_digest(name)
+        if digest is None:
+            return
+        cls.objects.filter(digest=digest, refs__gt=0).update(
+            refs=F('refs') - 1, released=Case(When(refs=1, then=Value(now())), default=F('released')))
+
+    @classmethod
+    def replace(cls, old_name, new_name, content_type=''):
+        if old_name != new_name:
+            cls.acquire(new_name, content_type)
+            cls.release(old_name)
+
+    @classmethod
+    def _lock(cls, digest, **defaults):
+        # lock the row of a blob, created with defaults when there is none
+        while True:
+            blob = cls.objects.select_for_update().filter(digest=digest).first()
+            if blob is not None:
+                return blob
+            cls.objects.get_or_create(digest=digest, defaults=dict(defaults, released=now()))
+
+
+class TripMedia(models.Model):
+    """
+    File of a trip, uploaded by its owner in chunks and moved into the blob store once it is complete
+    """
+
+    owner = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='media')
+    file = models.FileField(max_length=200, editable=False, storage=blob_storage)
+    name = models.CharField(max_length=200, blank=True)  # name of the file on the client
+    content_type = models.CharField(max_length=100, blank=True)
+    size = models.BigIntegerField()
+    sha256 = models.CharField(max_length=64)  # hex digest of the whole file, checked once it is stored
+    received = models.BigIntegerField(default=0, editable=False)  # bytes stored, an upload resumes from here
+    created = models.DateTimeField(auto_now_add=True, editable=False)
+    completed = models.DateTimeField(null=True, blank=True, editable=False)
+    latitude = models.FloatField(null=True, blank=True)
+    longitude = models.FloatField(null=True, blank=True)
+    # geohash of the location, set on save, boxes of the map are range scans of its index
+    geohash = models.CharField(max_length=geo.PRECISION, blank=True, db_index=True, editable=False)
+    # read from the header of the file by extractmetadata, a few seconds after the media is complete
+    taken = models.DateTimeField(null=True, blank=True)
+    width = models.PositiveIntegerField(null=True, blank=True)
+    height = models.PositiveIntegerField(null=True, blank=True)
+    orientation = models.PositiveSmallIntegerField(null=True, blank=True)  # exif orientation, 1 is upright
+
+    class Meta:
+        verbose_name = 'trip media'
+        verbose_name_plural = 'trip media'
+
+    def __str__(self):
+        return self.name or self.file.name
+
+    def save(self, *args, **kwargs):
+        self.geohash = geo.encode(self.latitude, self.longitude) if self.is_geotagged else ''
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and {'latitude', 'longitude'} & set(update_fields):
+            kwargs['update_fields'] = set(update_fields) | {'geohash'}
+        super().save(*args, **kwargs)
+
+    @property
+    def is_complete(self):
+        return self.completed is not None
+
+    @property
+    def is_geotagged(self):
+        return self.latitude is not None and self.longitude is not None
+
+    @classmethod
+    def start_upload(cls, owner_id, name, content_type, size, sha256, latitude=None, longitude=None):
+        """
+        Create media of a new upload. content that is in the blob store already is not uploaded again,
+        the media is complete from the start
+        """
+        if Blob.objects.filter(digest=sha256, size=size).exists():
+            with transaction.atomic():
+                # a blob collected meanwhile is uploaded again
+                if Blob.acquire(blob_name(sha256), content_type):
+                    media = cls.objects.create(owner_id=owner_id, file=blob_name(sha256), name=name,
+                                               content_type=content_type, size=size, sha256=sha256, received=size,
+                                               completed=now(), latitude=latitude, longitude=longitude)
+                    if media.is_geotagged:
+                        MediaCluster.add(latitude, longitude)
+                    MetadataJob.objects.create(media=media)
+                    return media
+        return cls.objects.create(owner_id=owner_id, file=media_file_name(owner_id), name=name,
+                                  content_type=content_type, size=size, sha256=sha256, latitude=latitude,
+                                  longitude=longitude)
+
+    @staticmethod
+    def nearest(media, latitude, longitude, box, radius, limit, max_cells, split_rows):
+        """
+        Return [(distance, row)] of the limit media of queryset media nearest to the location, within radius meters
+        and inside box (south, west, north, east), nearest first. rows are tuples of values_list of media,
+        starting with id and ending with latitude and longitude.
+        cells of the geohash index are read nearest first, from at most max_cells that cover the box,
+        until the next one is farther than the farthest media found. a cell of more than split_rows media is split
+        into its 32 smaller cells instead, so dense and sparse maps alike read little more than they return
+        """
+        (south, west, north, east) = box
+        if west <= east:
+            longitudes = Q(longitude__gte=west, longitude__lte=east)
+        else:
+            longitudes = Q(longitude__gte=west) | Q(longitude__lte=east)
+        media = media.filter(longitudes, latitude__gte=south, latitude__lte=north, completed__isnull=False)
+
+        cells = [(geo.cell_distance(latitude, longitude, prefix), prefix)
+                 for prefix in geo.covering_cells(south, west, north, east, max_cells)]
+        heapq.heapify(cells)
+        found = []  # heap of (-distance, id, row), the farthest media found on top
+        while cells:
+            (cell_distance, prefix) = heapq.heappop(cells)
+            if cell_distance > radius or (len(found) == limit and cell_distance >= -found[0][0]):
+                break
+            (first, after) = geo.cell_range(prefix)
+            rows = media.filter(geohash__gte=first, geohash__lt=after)
+            if len(prefix) < geo.PRECISION:
+                rows = list(rows[:split_rows + 1])
+                if len(rows) > split_rows:
+                    for child in geo.children(prefix, south, west, north, east):
+                        heapq.heappush(cells, (geo.cell_distance(latitude, longitude, child), child))
+                    continue
+
+            for row in rows:
+                row_distance = geo.distance(latitude, longitude, row[-2], row[-1])
+                if row_distance > radius:
+                    continue
+                if len(found) < limit:
+                    heapq.heappush(found, (-row_distance, row[0], row))
+                elif row_distance < -found[0][0]:
+                    heapq.heapreplace(found, (-row_distance, row[0], row))
+        return [(-negative, row) for (negative, _, row) in sorted(found, reverse=True)]
+
+    def complete(self):
+        """
+        Move the file into the blob store once all of it is stored and checked
+        """
+        with transaction.atomic():
+            # the blob stays locked until its reference is counted
+            self.file.name = Blob.adopt(self.file.path, self.sha256, self.content_type)
+            self.completed = now()
+            self.save(update_fields=['file', 'completed'])
+            Blob.acquire(self.file.name, self.content_type)
+            if self.is_geotagged:
+                MediaCluster.add(self.latitude, self.longitude)
+            MetadataJob.objects.create(media=self)
+
+
+class MetadataJob(models.Model):
+    """
+    Complete media whose metadata extractmetadata has not read yet, a durable queue of them.
+    a worker leases the jobs it takes, those of a worker that stopped are taken again once their lease runs out
+    """
+
+    media = models.OneToOneField(TripMedia, on_delete=models.CASCADE, primary_key=True, related_name='metadata_job')
+    available = models.DateTimeField(default=now, db_index=True)  # when a worker may take it
+    attempts = models.PositiveSmallIntegerField(default=0)
+
+    def __str__(self):
+        return str(self.media_id)
+
+    @classmethod
+    def lease(cls, limit, seconds):
+        """
+        Take at most limit available jobs, oldest first, for seconds, and return [(media id, attempts)] of them
+        """
+        taken = now()
+        with transaction.atomic():
+            # workers skip the jobs another one is taking, on databases that lock rows
+            jobs = list(cls.objects.select_for_update(skip_locked=True).filter(available__lte=taken)
+                        .order_by('available').values_list('media_id', 'attempts')[:limit])
+            cls.objects.filter(pk__in=[media_id for (media_id, _) in jobs]) \
+                .update(available=taken + timedelta(seconds=seconds), attempts=F('attempts') + 1)
+        return [(media_id, attempts + 1) for (media_id, attempts) in jobs]
+
+
+class MediaCluster(models.Model):
+    """
+    Complete geotagged media inside one cell of the grid of a zoom level, tiles of the map are read from them.
+    x and y number the cells of the zoom level, each tile holds map_tiles grid x grid of them,
+    so clustermedia builds them again whenever the grid is changed
+    """
+
+    zoom = models.PositiveSmallIntegerField()
+    x = models.IntegerField()
+    y = models.IntegerField()
+    count = models.IntegerField(default=0)
+    # the centroid of the cell is the sums over count
+    latitude_sum = models.FloatField(default=0)
+    longitude_sum = models.FloatField(default=0)
+
+    class Meta:
+        unique_together = ('zoom', 'x', 'y')
+
+    def __str__(self):
+        return "{}/{}/{}".format(self.zoom, self.x, self.y)
+
+    @classmethod
+    def add(cls, latitude, longitude, count=1):
+        """
+        Count media at a location into its cell of each zoom level, a negative count takes them out.
+        the change is queued by the transaction of the caller, which so locks no cluster,
+        and counted into the clusters once it commits
+        """
+        ClusterChange.objects.create(latitude=latitude, longitude=longitude, count=count)
+        transaction.on_commit(cls.apply_changes)
+
+    @classmethod
+    def apply_changes(cls, batch_size=16):
+        """
+        Count queued changes into the clusters, in a short transaction for each batch_size of them.
+        changes stay queued while clustermedia builds the clusters or the database is busy, the next call counts them
+        """
+        while True:
+            try:
+                with transaction.atomic():
+                    if connection.vendor == 'postgresql':
+                        # clustermedia holds the clusters in EXCLUSIVE mode while it builds them
+                        with connection.cursor() as cursor:
+                            cursor.execute("LOCK TABLE {} IN ROW EXCLUSIVE MODE NOWAIT".format(
+                                connection.ops.quote_name(cls._meta.db_table)))
+                    # changes another call is counting are skipped, on databases that lock rows
+                    changes = list(ClusterChange.objects.select_for_update(skip_locked=True).order_by('id')
+                                   .values_list('id', 'latitude', 'longitude', 'count')[:batch_size])
+                    sums = {}  # cell: [count, latitude_sum, longitude_sum]
+                    for (_, latitude, longitude, count) in changes:
+                        for cell in clusters.cells(latitude, longitude):
+                            cell_sums = sums.setdefault(cell, [0, 0.0, 0.0])
+                            cell_sums[0] += count
+                            cell_sums[1] += latitude * count
+                            cell_sums[2] += longitude * count
+                    cls._count(sums)
+                    ClusterChange.objects.filter(pk__in=[change_id for (change_id, *_) in changes]).delete()
+            except OperationalError as error:
+                logger.info("media cluster changes left queued: %s", error)
+                return
+            if len(changes) < batch_size:
+                return
+
+    @classmethod
+    def _count(cls, sums):
+        cells = sorted(sums)
+        while True:
+            # cells are locked in one order by every call, so calls wait for each other instead of deadlocking
+            existing = set()
+            for chunk in _chunks(cells, CELLS_PER_QUERY):
+                existing.update(cls.objects.select_for_update().filter(cls._cells_filter(chunk))
+                                .order_by('zoom', 'x', 'y').values_list('zoom', 'x', 'y'))
+            # one update counts into the cells that change alike, a single change counts into all of them at once
+            changed = {}
+            for cell in existing:
+                changed.setdefault(tuple(sums[cell]), []).append(cell)
+            for ((count, latitude_sum, longitude_sum), changed_cells) in changed.items():
+                for chunk in _chunks(changed_cells, CELLS_PER_QUERY):
+                    cls.objects.filter(cls._cells_filter(chunk)).update(
+                        count=F('count') + count, latitude_sum=F('latitude_sum') + latitude_sum,
+                        longitude_sum=F('longitude_sum') + longitude_sum)
+            cells = [cell for cell in cells if cell not in existing and sums[cell][0] > 0]
+            try:
+                with transaction.atomic():
+                    cls.objects.bulk_create([
+                        cls(zoom=zoom, x=x, y=y, count=sums[(zoom, x, y)][0], latitude_sum=sums[(zoom, x, y)][1],
+                            longitude_sum=sums[(zoom, x, y)][2]) for (zoom, x, y) in cells])
+                return
+            except IntegrityError:
+                # changes counted meanwhile created some of them first
+                continue
+
+    @classmethod
+    def tile(cls, zoom, x, y):
+        """
+        Return [(latitude, longitude, count)] of the centroids of the clusters inside a tile
+        """
+        (first_x, first_y, after_x, after_y) = clusters.tile_cells(x, y)
+        rows = cls.objects.filter(zoom=zoom, x__gte=first_x, x__lt=after_x, y__gte=first_y, y__lt=after_y,
+                                  count__gt=0).values_list('latitude_sum', 'longitude_sum', 'count')
+        return [(latitude_sum / count, longitude_sum / count, count)
+                for (latitude_sum, longitude_sum, count) in rows]
+
+    @staticmethod
+    def _cells_filter(cells):
+        matched = Q()
+        for (zoom, x, y) in cells:
+            matched |= Q(zoom=zoom, x=x, y=y)
+        return matched
+
+
+class ClusterChange(models.Model):
+    """
+    Change of the count of media at a location that MediaCluster.add queued and the clusters do not count yet
+    """
+
+    latitude = models.FloatField()
+    longitude = models.FloatField()
+    count = models.SmallIntegerField()
+
+    def __str__(self):
+        return "{:+d} at {}, {}".format(self.count, self.latitude, self.longitude)
+
+
+def _chunks(items, size):
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
@@ -0,0 +1,40 @@
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from trip.models import Blob, MediaCluster, TripMedia
+
+
+@receiver(post_delete, sender=TripMedia)
+def release_media_file(sender, instance, **kwargs):
+    # complete media share blobs, the part of an unfinished upload is its own
+    if instance.is_complete:
+        Blob.release(instance.file.name)
+    elif instance.file.name:
+        instance.file.delete(save=False)
+
+
+@receiver(pre_save, sender=TripMedia)
+def stash_media_location(sender, instance, update_fields=None, **kwargs):
+    # complete media are clustered, a change of their location moves them to other clusters
+    if instance.pk and instance.is_complete and (update_fields is None or
+                                                 {'latitude', 'longitude'} & set(update_fields)):
+        instance._moved_from = TripMedia.objects.filter(pk=instance.pk, completed__isnull=False) \
+            .values_list('latitude', 'longitude').first()
+
+
+@receiver(post_save, sender=TripMedia)
+def move_media_cluster(sender, instance, **kwargs):
+    moved_from = instance.__dict__.pop('_moved_from', None)
+    if moved_from is None or moved_from == (instance.latitude, instance.longitude):
+        return
+    (latitude, longitude) = moved_from
+    if latitude is not None and longitude is not None:
+        MediaCluster.add(latitude, longitude, count=-1)
+    if instance.is_geotagged:
+        MediaCluster.add(instance.latitude, instance.longitude)
+
+
+@receiver(post_delete, sender=TripMedia)
+def uncount_media_cluster(sender, instance, **kwargs):
+    if instance.is_complete and instance.is_geotagged:
+        MediaCluster.add(instance.latitude, instance.longitude, count=-1)
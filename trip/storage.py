@@ -0,0 +1,74 @@
+import hashlib
+import os
+import tempfile
+from django.core.files.storage import FileSystemStorage
+from django.utils.deconstruct import deconstructible
+
+
+def blob_name(digest):
+    return "blobs/{}/{}/{}".format(digest[:2], digest[2:4], digest)
+
+
+def blob_digest(name):
+    """
+    Return digest of a blob name, or None for names of files stored elsewhere
+    """
+    (directory, _, digest) = (name or '').rpartition('/')
+    if directory.startswith('blobs/') and len(digest) == 64 and blob_name(digest) == name:
+        return digest
+    return None
+
+
+@deconstructible
+class ContentAddressedStorage(FileSystemStorage):
+    """
+    Store each file once, named by the sha256 of its content, whatever name it is saved with.
+    content is hashed while it is copied in, so it is read once, and a file that is stored already
+    costs no more disk. trip.models.Blob counts the references to each of them
+    """
+
+    def get_available_name(self, name, max_length=None):
+        # a name is only a hint, _save names files by their content
+        return name
+
+    def _save(self, name, content):
+        temporary = self._temporary_file()
+        digest = hashlib.sha256()
+        try:
+            with open(temporary, 'wb') as file:
+                for chunk in content.chunks():
+                    file.write(chunk)
+                    digest.update(chunk)
+            # the model locks the blob while its file is moved in, it imports this module
+            from trip.models import Blob
+            return Blob.adopt(temporary, digest.hexdigest())
+        finally:
+            if os.path.exists(temporary):
+                os.remove(temporary)
+
+    def adopt(self, path, digest):
+        """
+        Move the file at path, whose content has digest, into the store and return its name.
+        the file is removed instead when its content is stored already
+        """
+        name = blob_name(digest)
+        target = self.path(name)
+        if os.path.exists(target):
+            os.remove(path)
+            return name
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        if self.file_permissions_mode is not None:
+            os.chmod(path, self.file_permissions_mode)
+        # readers never see a part of the file, it appears under its name whole
+        os.replace(path, target)
+        return name
+
+    def _temporary_file(self):
+        directory = self.path('blobs/tmp')
+        os.makedirs(directory, exist_ok=True)
+        (descriptor, path) = tempfile.mkstemp(dir=directory)
+        os.close(descriptor)
+        return path
+
+
+blob_storage = ContentAddressedStorage()
@@ -0,0 +1,64 @@
+import random
+from django.test import SimpleTestCase, TestCase
+from django.utils.timezone import now
+
+from account.models import User
+from trip import geo
+from trip.models import TripMedia
+
+
+class CellDistanceTest(SimpleTestCase):
+
+    @staticmethod
+    def sampled_distance(latitude, longitude, prefix, steps=60):
+        # nearest of a dense grid of points of the cell, edges included
+        (south, west, north, east) = geo.decode_cell(prefix)
+        return min(geo.distance(latitude, longitude, south + (north - south) * i / steps,
+                                west + (east - west) * j / steps)
+                   for i in range(steps + 1) for j in range(steps + 1))
+
+    def test_never_farther_than_the_cell(self):
+        rng = random.Random(1)
+        for _ in range(300):
+            (latitude, longitude) = (rng.choice((1, -1)) * rng.uniform(55, 90), rng.uniform(-180, 180))
+            prefix = geo.encode(rng.uniform(-90, 90), rng.uniform(-180, 180), rng.randint(1, 3))
+            bound = geo.cell_distance(latitude, longitude, prefix)
+            sampled = self.sampled_distance(latitude, longitude, prefix)
+            self.assertLessEqual(bound, sampled + 1e-6, (latitude, longitude, prefix))
+            # and it is tight, the sampled grid is only a little off the nearest point
+            self.assertGreaterEqual(bound, sampled - 0.02 * geo.EARTH_RADIUS, (latitude, longitude, prefix))
+
+    def test_inside_is_zero(self):
+        self.assertEqual(geo.cell_distance(74.5, 20.1, geo.encode(74.5, 20.1, 2)), 0)
+
+
+class NearestTest(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        owner = User.objects.create(username='nearest', email='nearest@test.local')
+        rng = random.Random(2)
+        points = [(rng.uniform(60, 89.9), rng.uniform(-180, 180)) for _ in range(1500)] + \
+                 [(rng.uniform(-89.9, -60), rng.uniform(-180, 180)) for _ in range(500)]
+        TripMedia.objects.bulk_create(
+            [TripMedia(owner=owner, file='x', size=1, sha256='0' * 64, completed=now(), latitude=latitude,
+                       longitude=longitude, geohash=geo.encode(latitude, longitude))
+             for (latitude, longitude) in points], batch_size=400)
+        cls.points = list(TripMedia.objects.values_list('id', 'latitude', 'longitude'))
+
+    def brute_force(self, latitude, longitude, radius, limit):
+        found = sorted((geo.distance(latitude, longitude, other_latitude, other_longitude), media_id)
+                       for (media_id, other_latitude, other_longitude) in self.points)
+        return [media_id for (distance, media_id) in found if distance <= radius][:limit]
+
+    def test_matches_brute_force_at_high_latitudes(self):
+        media = TripMedia.objects.values_list('id', 'latitude', 'longitude')
+        for (latitude, longitude, radius) in [(74, 10, 500000), (74, 179, 2000000), (85, -60, 3000000),
+                                              (-80, 0, 1500000), (70, 100, 100000), (89.5, 0, 5000000)]:
+            box = geo.circle_box(latitude, longitude, radius)
+            for (max_cells, split_rows) in [(16, 256), (4, 8)]:
+                nearest = TripMedia.nearest(media, latitude, longitude, box, radius, limit=20,
+                                            max_cells=max_cells, split_rows=split_rows)
+                self.assertEqual([row[0] for (_, row) in nearest],
+                                 self.brute_force(latitude, longitude, radius, 20),
+                                 (latitude, longitude, radius, max_cells))
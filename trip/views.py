@@ -0,0 +1,80 @@
+import logging
+import re
+from django.http import FileResponse, HttpResponse, StreamingHttpResponse
+from django.shortcuts import get_object_or_404
+from django.views.decorators.http import condition, require_safe
+
+from trip.files import read_chunks
+from trip.models import Blob
+from trip.storage import blob_storage
+from tripmedia import settings
+
+logger = logging.getLogger(__name__)
+
+_range = re.compile(r'^bytes=(\d*)-(\d*)$')
+
+
+def _byte_range(header, size):
+    """
+    Return (first, last) byte of a single range header, None to send the whole blob, or raise ValueError
+    when no byte of the range is in the blob
+    """
+    match = _range.match(header.strip())
+    if match is None or match.groups() == ('', ''):
+        # many ranges or a broken header, the whole blob answers both
+        return None
+    (first, last) = match.groups()
+    if not first:
+        # a suffix, the last bytes of the blob
+        if int(last) == 0 or size == 0:
+            raise ValueError(header)
+        return max(0, size - int(last)), size - 1
+    if last and int(last) < int(first):
+        return None
+    if int(first) >= size:
+        raise ValueError(header)
+    return int(first), min(int(last), size - 1) if last else size - 1
+
+
+def _stream(file, start, end):
+    for (_, chunk) in read_chunks(file, start, end, settings.trip_media.get("chunk_size")):
+        yield bytes(chunk)
+
+
+@require_safe
+@condition(etag_func=lambda request, digest: digest)
+def blob(request, digest):
+    """
+    Serve a blob under its digest, the strongest etag there is, so any cached copy is valid forever.
+    a single byte range is served partly, to resume downloads. a blob whose file is missing is gone
+    """
+    stored = get_object_or_404(Blob, digest=digest, refs__gt=0)
+    path = blob_storage.path(stored.name)
+    content_type = stored.content_type or 'application/octet-stream'
+
+    byte_range = None
+    if 'HTTP_RANGE' in request.META and request.META.get('HTTP_IF_RANGE', '"%s"' % digest) == '"%s"' % digest:
+        try:
+            byte_range = _byte_range(request.META['HTTP_RANGE'], stored.size)
+        except ValueError:
+            response = HttpResponse(status=416)
+            response['Content-Range'] = 'bytes */%d' % stored.size
+            return response
+
+    # the file is opened before the response starts, so a missing one is not found halfway through it
+    try:
+        file = open(path, 'rb')
+    except FileNotFoundError:
+        logger.error("File of blob %s is missing, the blob store is corrupt", digest)
+        return HttpResponse(status=410)
+
+    if byte_range is None:
+        response = FileResponse(file, content_type=content_type)
+    else:
+        (first, last) = byte_range
+        response = StreamingHttpResponse(_stream(file, first, last + 1), status=206, content_type=content_type)
+        response['Content-Range'] = 'bytes %d-%d/%d' % (first, last, stored.size)
+        response['Content-Length'] = last - first + 1
+    response['Accept-Ranges'] = 'bytes'
+    response['Cache-Control'] = 'public, max-age=31536000, immutable'
+    return response
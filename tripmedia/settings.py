@@ -19,7 +19,8 @@ INSTALLED_APPS = [
     'django.contrib.messages',
     'django.contrib.staticfiles',
     'account',
-    'microservice'
+    'microservice',
+    'trip',
 ]
 
 AUTH_USER_MODEL = 'account.user'
@@ -60,18 +61,19 @@ if DEBUG:
     DATABASES = {
         'default': {
             'ENGINE': 'django.db.backends.sqlite3',
-            'NAME': os.path.dirname(__name__) + 'db.sqlite',
+            'NAME': os.environ.get('TRIPMEDIA_DB_NAME', os.path.dirname(__name__) + 'db.sqlite'),
         }
     }
 else:
     DATABASES = {
         'default': {
-            'ENGINE': 'django.db.backends.postgresql',
-            'NAME': 'tripmedia_db',
+            'ENGINE': 'django.db.backends.postgresql',  # runservices swaps in microservice.backends.postgresql_pool
+            'NAME': os.environ.get('TRIPMEDIA_DB_NAME', 'tripmedia_db'),  # benchservices points servers at its fixture
             'USER': 'postgres',
             'PASSWORD': '123',
             'HOST': 'localhost',
             'PORT': '',
+            'CONN_MAX_AGE': 0,  # with the pooled backend connections go back to microservice.pool after each call
         }
     }
 
@@ -103,8 +105,107 @@ USE_TZ = True
 STATIC_URL = '/static/'
 STATIC_ROOT = os.path.join(BASE_DIR, 'static')
 
+MEDIA_URL = '/media/'
+MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
+
+default_server_host = "localhost"
 default_server_port = 8585
 default_workers = 5
+default_processes = 1
+default_max_concurrent_rpcs = None  # no limit
+max_users_per_request = 500  # user ids accepted by a single get_users call
+stream_batch_size = 100  # responses of a streaming call produced by each database round trip
+db_pool = {
+    "max_size": default_workers,  # runservices sizes the pool to its --workers
+    "max_age": 30 * 60,  # seconds before a connection is replaced by a new one
+    "check_after": 30,  # seconds of idle time after which a connection is pinged before reuse
+    "timeout": 10,  # seconds a call waits for a free connection
+}
+availability_index = {
+    "warm_up": True,  # runservices loads taken usernames and emails before serving
+    "capacity": 1000000,  # least number of values the bloom filters are sized for
+    "error_rate": 0.01,  # share of available values that still need a database check
+    "refresh_interval": 1.0,  # seconds, users added or renamed by other processes are read into the filters after it
+    "refresh_overlap": 5.0,  # seconds before the latest rename read that each refresh reads again
+    "max_lag": 5.0,  # seconds since the last refresh after which the filters are not trusted
+    "rebuild_interval": 10 * 60,  # seconds, filters are built again after it to drop values users left
+}
+password_hashing = {
+    # processes hashing passwords for each server process, 0 hashes on the calling thread.
+    # None gives runservices the cpus of the host divided among its server processes, others hash on the calling thread
+    "processes": None,
+    "timeout": 30,  # seconds a call waits for its password to be hashed
+}
+rate_limit = {
+    "methods": ("login", "signup"),  # methods of ServerApi that are throttled
+    "peer_rate": 1,  # calls per second of each client address once its burst is spent
+    "peer_burst": 20,
+    "username_rate": 0.1,  # calls per second for each username of each client address once its burst is spent
+    "username_burst": 5,
+    "forwarded_for": "x-forwarded-for",  # metadata key a trusted proxy sets to the client address, None ignores it
+    "trusted_proxies": (),  # addresses of the proxies in front of the servers, such as "10.0.0.1"
+    "shards": 16,  # buckets are split over this many locks
+    "evict_every": 60,  # seconds between two sweeps of idle buckets in each shard
+}
+metrics = {
+    "port": 8586,  # /metrics is served on this port, the n-th forked server uses port + n, 0 turns it off
+    "buckets": (.005, .01, .025, .05, .1, .25, .5, 1, 2.5, 5, 10),  # seconds, bounds of call duration histograms
+}
+profiling = {
+    "enabled": False,  # runservices --profile turns it on too, it is for the threaded server only
+    "slow_call": 0.5,  # seconds, slower calls are logged with their queries
+    "profile_rate": 0.05,  # share of calls run under cProfile, other slow calls are logged with their stack
+    "logged_queries": 50,  # queries listed in the log of a slow call
+}
+trip_media = {
+    "chunk_size": 1024 * 1024,  # bytes of each message of download_media, the most upload_media takes in one
+    "max_size": 2 * 1024 ** 3,  # bytes, largest file upload_media accepts
+}
+geo = {
+    "max_cells": 16,  # geohash cells that cover the box of a map query at first, each a range scan of its index
+    "split_rows": 256,  # media a cell may hold before it is read as its 32 smaller cells instead
+    "max_results": 1000,  # media streamed by get_media_nearby at most
+}
+map_tiles = {
+    "max_zoom": 16,  # deepest zoom level clustered, get_map_tile refuses deeper tiles
+    "grid": 8,  # clusters along each side of a tile, a power of two, clustermedia must run when it is changed
+    "cache_size": 16384,  # tiles kept by each server process
+    "cache_ttl": 30,  # seconds a cached tile is served, media added meanwhile show up after it
+}
+media_metadata = {
+    "processes": 2,  # processes of extractmetadata reading file headers, 0 reads them on its own thread
+    "batch_size": 64,  # queued media read, and then updated, at a time
+    "lease": 5 * 60,  # seconds a worker holds the jobs it took, then another worker may take them
+    "max_attempts": 5,  # attempts at a file that can not be read before its job is dropped
+    "poll_interval": 1.0,  # seconds extractmetadata waits when the queue is empty
+}
+avatars = {
+    "sizes": (64, 256, 1024),  # px, side of the square thumbnails rendered for each avatar
+    "formats": ("jpeg", "webp"),  # jpeg is always rendered, responses fall back to it
+    "quality": 82,
+    "workers": 4,  # threads rendering thumbnails
+    "profile_size": 256,  # px, thumbnail of get_user and get_users when the request asks for no size
+    "list_size": 64,  # px, thumbnail of follower and following streams when the request asks for no size
+    "max_source_size": 20 * 1024 * 1024,  # bytes, largest trip media change_avatar accepts
+    "default": os.path.join(STATIC_ROOT, 'account', 'default-avatar.jpg'),  # avatar of profiles with none
+    "base_url": MEDIA_URL,  # prefix of thumbnail urls, the host or cdn serving MEDIA_ROOT
+}
+call_logging = {
+    "queue_size": 10000,  # records waiting for the log thread, records over it are dropped
+    "sample_rate": 1.0,  # share of calls ending with OK that are logged, other calls are always logged
+    "method_sample_rates": {  # sample rates of single methods of ServerApi
+        "hey_server": 0.01,
+        "is_logged_in": 0.01,
+    },
+}
+grpc_server_options = {
+    "grpc.keepalive_time_ms": 60 * 1000,
+    "grpc.keepalive_timeout_ms": 20 * 1000,
+    "grpc.keepalive_permit_without_calls": 1,
+    "grpc.http2.max_pings_without_data": 0,
+    "grpc.max_send_message_length": 4 * 1024 * 1024,
+    "grpc.max_receive_message_length": 4 * 1024 * 1024,
+}
 auth_meta_keys = {
     "auth_key": "_auth_",
     "auth_value": "AUTH_GRPC_CLIENT",
@@ -113,6 +214,13 @@ auth_meta_keys = {
     "auth_user_key": "_auth_user-id",
     "auth_client_state": "_auth_logged-in",
 }
+grpc_session = {
+    # db, cached_db, file or signed
+    # signed sessions are stateless tokens checked without any I/O, but they can not be revoked before they expire
+    "backend": "db",
+    "cache_max_size": 10000,  # decoded sessions kept in memory of each server process
+    "cache_ttl": 60,  # seconds, a cached session is read again from backend after that
+}
 client_meta_key = {
     "client_last_seen": "_client_last-seen",
     "client_request_id": "_client_request-id"
@@ -128,11 +236,14 @@ LOGGING = {
         'simple': {
             'format': '%(levelname)s %(asctime)s %(message)s'
         },
+        'json': {
+            '()': 'microservice.logs.JsonFormatter',
+        },
     },
     'handlers': {
         'log_to_stdout': {
             'level': 'DEBUG',
-            'formatter': 'simple',
+            'formatter': 'json',
             'class': 'logging.StreamHandler',
             'stream': sys.stdout,
         },
@@ -140,7 +251,7 @@ LOGGING = {
     'loggers': {
         'microservice': {
             'handlers': ['log_to_stdout'],
-            'level': 'DEBUG',
+            'level': 'INFO',
             'propagate': True,
         }
     }
@@ -1,6 +1,14 @@
+from django.conf import settings
+from django.conf.urls.static import static
 from django.contrib import admin
-from django.urls import path
+from django.urls import path, re_path
+
+from trip import views as trip_views
 
 urlpatterns = [
     path('admin/', admin.site.urls),
+    re_path(r'^blobs/(?P<digest>[0-9a-f]{64})$', trip_views.blob, name='blob'),
 ]
+
+# uploads and avatar thumbnails, served by django only while DEBUG is on
+urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)